@@ -9,7 +9,7 @@ from src.news_collector import NewsCollector
 from src.entity_classifier import EntityClassifier
 from src.article_scraper import ArticleScraper
 from src.ai_summarizer import AISummarizer, AIProvider
-from src.storage_layer import DatabaseStorage, CSVStorage
+from src.storage_layer import DatabaseStorage, CSVStorage, ParquetStorage
 from src.pipeline_orchestrator import PipelineOrchestrator
 
 
@@ -33,7 +33,7 @@ def parse_arguments():
     
     parser.add_argument(
         '--storage-type',
-        choices=['database', 'csv', 'web-ui'],
+        choices=['database', 'csv', 'parquet', 'web-ui'],
         help='Storage backend type (overrides STORAGE_TYPE env var)'
     )
     
@@ -46,7 +46,7 @@ def parse_arguments():
     
     parser.add_argument(
         '--output-path',
-        help='Output path for CSV storage (overrides OUTPUT_PATH env var)'
+        help='Output path for CSV or Parquet storage (overrides OUTPUT_PATH env var)'
     )
     
     parser.add_argument(
@@ -57,6 +57,19 @@ def parse_arguments():
     return parser.parse_args()
 
 
+def _close_components(components: list):
+    """Release the resources held by initialized pipeline components.
+    
+    Args:
+        components: Components with a close() method, closed in reverse order
+    """
+    for component in reversed(components):
+        try:
+            component.close()
+        except Exception as e:
+            logger.error(f"Failed to close {type(component).__name__}: {e}")
+
+
 def main():
     """Main entry point."""
     # Parse command-line arguments
@@ -75,6 +88,9 @@ def main():
     if args.database_url:
         os.environ['DATABASE_URL'] = args.database_url
     
+    # Pick up values from .env and the overrides above
+    ConfigurationManager.clear_cache()
+    
     # Validate API keys and fail fast if missing
     if not ConfigurationManager.validate_api_keys():
         print("\n❌ Error: Missing required API keys!")
@@ -87,12 +103,12 @@ def main():
     # Load configuration
     try:
         config = ConfigurationManager.load_config()
-        print(f"\n✓ Configuration loaded successfully")
-        print(f"  Storage Type: {config.storage_type.value}")
-        if config.storage_type.value == "csv":
-            print(f"  Output Path: {config.output_path}")
+        logger.info(f"✓ Configuration loaded successfully")
+        logger.info(f"  Storage Type: {config.storage_type.value}")
+        if config.storage_type.value in ("csv", "parquet"):
+            logger.info(f"  Output Path: {config.output_path}")
         elif config.storage_type.value == "database":
-            print(f"  Database URL: {config.database_url}")
+            logger.info(f"  Database URL: {config.database_url}")
     except ValueError as e:
         print(f"\n❌ Configuration Error: {e}")
         return 1
@@ -102,63 +118,76 @@ def main():
         if args.test_set:
             # Use command-line specified test set
             test_set = ConfigurationManager.TEST_SETS[args.test_set - 1]
-            print(f"\n✓ Test set selected: {test_set.name}")
-            print(f"  Tracking entities: {', '.join(test_set.entities)}")
+            logger.info(f"✓ Test set selected: {test_set.name}")
+            logger.info(f"  Tracking entities: {', '.join(test_set.entities)}")
         else:
             # Interactive selection
             test_set = ConfigurationManager.select_test_set()
-            print(f"\n✓ Test set selected: {test_set.name}")
-            print(f"  Tracking entities: {', '.join(test_set.entities)}")
+            logger.info(f"✓ Test set selected: {test_set.name}")
+            logger.info(f"  Tracking entities: {', '.join(test_set.entities)}")
     except (SystemExit, IndexError):
         return 1
     
     # Initialize all components
-    print("\n" + "=" * 60)
-    print("Initializing pipeline components...")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("Initializing pipeline components...")
+    logger.info("=" * 60)
+    
+    # Components holding connections or cache files, closed when main returns
+    closeables = []
     
     try:
         # Initialize NewsCollector
-        collector = NewsCollector(api_key=config.news_api_key)
-        print("✓ NewsCollector initialized")
+        collector = NewsCollector(
+            api_key=config.news_api_key,
+            rate_limit=config.news_api_rate_limit,
+            cache_dir=config.cache_dir
+        )
+        closeables.append(collector)
+        logger.info("✓ NewsCollector initialized")
         
         # Initialize EntityClassifier
         classifier = EntityClassifier(test_set=test_set)
-        print("✓ EntityClassifier initialized")
+        logger.info("✓ EntityClassifier initialized")
         
         # Initialize ArticleScraper
-        scraper = ArticleScraper()
-        print("✓ ArticleScraper initialized")
+        scraper = ArticleScraper(
+            concurrency=config.scraper_concurrency,
+            cache_dir=config.cache_dir,
+            preflight=config.scraper_preflight
+        )
+        closeables.append(scraper)
+        logger.info("✓ ArticleScraper initialized")
         
         # Initialize AISummarizer
-        # Map provider string to AIProvider enum
-        provider_map = {
-            "openai": AIProvider.OPENAI,
-            "claude": AIProvider.CLAUDE,
-            "gemini": AIProvider.GEMINI,
-            "groq": AIProvider.GROQ
-        }
-        ai_provider = provider_map.get(config.ai_provider.lower(), AIProvider.OPENAI)
+        ai_provider = AIProvider.from_str(config.ai_provider)
         
         summarizer = AISummarizer(
             api_key=config.ai_api_key,
-            provider=ai_provider
+            provider=ai_provider,
+            cache_dir=config.cache_dir
         )
-        print(f"✓ AISummarizer initialized (provider: {config.ai_provider})")
+        closeables.append(summarizer)
+        logger.info(f"✓ AISummarizer initialized (provider: {config.ai_provider})")
         
         # Initialize StorageLayer
         if config.storage_type == StorageType.DATABASE:
             if not config.database_url:
                 print("\n❌ Error: DATABASE_URL is required for database storage")
+                _close_components(closeables)
                 return 1
             storage = DatabaseStorage(database_url=config.database_url)
         elif config.storage_type == StorageType.CSV:
             storage = CSVStorage(output_path=config.output_path)
+        elif config.storage_type == StorageType.PARQUET:
+            storage = ParquetStorage(output_path=config.output_path)
         else:
             print(f"\n❌ Error: Storage type '{config.storage_type.value}' not yet implemented")
+            _close_components(closeables)
             return 1
+        closeables.append(storage)
         
-        print(f"✓ {config.storage_type.value.upper()} storage initialized")
+        logger.info(f"✓ {config.storage_type.value.upper()} storage initialized")
         
         # Initialize PipelineOrchestrator
         orchestrator = PipelineOrchestrator(
@@ -170,17 +199,18 @@ def main():
             summarizer=summarizer,
             storage=storage
         )
-        print("✓ PipelineOrchestrator initialized")
+        logger.info("✓ PipelineOrchestrator initialized")
         
     except Exception as e:
         print(f"\n❌ Error initializing components: {e}")
         logger.exception("Component initialization failed")
+        _close_components(closeables)
         return 1
     
     # Run pipeline orchestrator
-    print("\n" + "=" * 60)
-    print("Starting news aggregation pipeline...")
-    print("=" * 60 + "\n")
+    logger.info("=" * 60)
+    logger.info("Starting news aggregation pipeline...")
+    logger.info("=" * 60)
     
     try:
         result = orchestrator.run()
@@ -214,6 +244,8 @@ def main():
         print(f"\n📁 Storage Location:")
         if config.storage_type == StorageType.CSV:
             print(f"  CSV File: {config.output_path}")
+        elif config.storage_type == StorageType.PARQUET:
+            print(f"  Parquet Directory: {config.output_path}")
         elif config.storage_type == StorageType.DATABASE:
             print(f"  Database: {config.database_url}")
         
@@ -227,6 +259,9 @@ def main():
         print(f"\n❌ Pipeline execution failed: {e}")
         logger.exception("Pipeline execution error")
         return 1
+    
+    finally:
+        _close_components(closeables)
 
 
 if __name__ == "__main__":
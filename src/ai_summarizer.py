@@ -1,23 +1,77 @@
 """AI-powered summarization component for generating article summaries."""
+import json
 import logging
+import os
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
-import openai
+from typing import List, Optional
+from src.disk_cache import DiskCache
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional accelerator
+    tiktoken = None
 
 
 logger = logging.getLogger(__name__)
 
 
+# HTTP status codes worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Token budget for the article text sent to the provider
+MAX_INPUT_TOKENS = 1000
+
+# Static parts of the summarization prompt; the article text goes between them
+PROMPT_PREFIX = (
+    "Summarize the following news article in exactly 30-40 words.\n"
+    "Focus on key facts and main points. Use either a short paragraph or bullet points.\n"
+    "\n"
+    "Article:\n"
+)
+PROMPT_SUFFIX = "\n\nSummary:"
+
+# Generation budget for a single 30-40 word summary
+SUMMARY_MAX_TOKENS = 100
+
+# Instructions for summarizing several articles in one request; the numbered
+# articles are appended after this text
+BATCH_PROMPT_HEADER = (
+    "Summarize each of the following {count} news articles in exactly 30-40 words.\n"
+    "Focus on key facts and main points. Use either a short paragraph or bullet points.\n"
+    "Respond with only a JSON array of {count} strings, one summary per article, "
+    "in the same order as the articles.\n"
+)
+
+# Rough characters-per-token ratio for English text, used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+
 class AIProvider(Enum):
     """Supported AI providers."""
     OPENAI = "openai"
     CLAUDE = "claude"
     GEMINI = "gemini"
     GROQ = "groq"
+    
+    @classmethod
+    def from_str(cls, name: str) -> "AIProvider":
+        """Look up a provider by name, case-insensitively.
+        
+        Args:
+            name: Provider name (e.g. "openai", "Claude")
+            
+        Returns:
+            Matching AIProvider, or AIProvider.OPENAI if the name is not recognized
+        """
+        try:
+            return cls(name.lower())
+        except ValueError:
+            return cls.OPENAI
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Summary:
     """Result of AI summarization operation."""
     text: str
@@ -29,16 +83,30 @@ class Summary:
 class AISummarizer:
     """Generates AI-powered summaries of article content."""
     
-    def __init__(self, api_key: str, provider: AIProvider = AIProvider.OPENAI, model: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        provider: AIProvider = AIProvider.OPENAI,
+        model: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        max_retries: int = 3,
+        max_input_tokens: int = MAX_INPUT_TOKENS
+    ):
         """Initialize the AISummarizer.
         
         Args:
             api_key: API key for the AI provider
             provider: AI provider to use (default: OpenAI)
             model: Specific model to use (optional, uses provider default if not specified)
+            cache_dir: Directory for the summary cache (default: None, caching disabled)
+            max_retries: Maximum attempts per provider call on rate limit or server errors (default: 3)
+            max_input_tokens: Token budget for article text included in the prompt (default: 1000)
         """
         self.api_key = api_key
         self.provider = provider
+        self.max_retries = max_retries
+        self.max_input_tokens = max_input_tokens
+        self.cache = DiskCache(os.path.join(cache_dir, 'summaries.db')) if cache_dir else None
         
         # Set default models for each provider
         if model:
@@ -53,13 +121,18 @@ class AISummarizer:
             elif provider == AIProvider.GROQ:
                 self.model = "llama-3.3-70b-versatile"
         
-        # Initialize the appropriate client
+        self.encoding = self._load_encoding()
+        
+        # Initialize the appropriate client (SDKs are imported only for the selected provider).
+        # The SDKs' own retries are turned off since _call_with_retry already
+        # retries, and stacking both multiplies the requests sent while rate limited.
         if provider == AIProvider.OPENAI:
-            self.client = openai.OpenAI(api_key=api_key)
+            import openai
+            self.client = openai.OpenAI(api_key=api_key, max_retries=0)
         elif provider == AIProvider.CLAUDE:
             try:
                 import anthropic
-                self.client = anthropic.Anthropic(api_key=api_key)
+                self.client = anthropic.Anthropic(api_key=api_key, max_retries=0)
             except ImportError:
                 logger.error("anthropic package not installed. Install with: pip install anthropic")
                 raise
@@ -74,11 +147,16 @@ class AISummarizer:
         elif provider == AIProvider.GROQ:
             try:
                 from groq import Groq
-                self.client = Groq(api_key=api_key)
+                self.client = Groq(api_key=api_key, max_retries=0)
             except ImportError:
                 logger.error("groq package not installed. Install with: pip install groq")
                 raise
     
+    def close(self) -> None:
+        """Close the summary cache."""
+        if self.cache:
+            self.cache.close()
+    
     def summarize(self, content: str, max_words: int = 40) -> Summary:
         """Generate a summary of the article content.
         
@@ -89,35 +167,26 @@ class AISummarizer:
         Returns:
             Summary with generated text and success status
         """
+        # Identical requests reuse the previously generated summary
+        cached = self._get_cached_summary(content, max_words)
+        if cached is not None:
+            return cached
+        
         try:
             # Build the prompt
             prompt = self._build_prompt(content, max_words)
             
             # Call the appropriate AI provider
-            if self.provider == AIProvider.OPENAI:
-                summary_text = self._summarize_with_openai(prompt)
-            elif self.provider == AIProvider.CLAUDE:
-                summary_text = self._summarize_with_claude(prompt)
-            elif self.provider == AIProvider.GEMINI:
-                summary_text = self._summarize_with_gemini(prompt)
-            elif self.provider == AIProvider.GROQ:
-                summary_text = self._summarize_with_groq(prompt)
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
+            summary_text = self._call_with_retry(prompt)
             
             # Validate word count
             word_count = len(summary_text.split())
             
-            if not self._validate_length(summary_text, max_words):
+            if not self._validate_length(word_count, max_words):
                 logger.warning(f"Summary word count ({word_count}) outside acceptable range (30-{max_words})")
             
             logger.info(f"Successfully generated summary with {word_count} words")
-            return Summary(
-                text=summary_text,
-                word_count=word_count,
-                success=True,
-                error_message=None
-            )
+            return self._store_summary(content, max_words, summary_text, word_count)
         
         except Exception as e:
             error_msg = f"AI summarization failed: {str(e)}"
@@ -129,6 +198,239 @@ class AISummarizer:
                 error_message=error_msg
             )
     
+    def summarize_batch(self, contents: List[str], max_words: int = 40) -> List[Summary]:
+        """Generate summaries for several articles with a single provider request.
+        
+        Cached articles are answered from the cache; the rest are sent together
+        in one prompt that asks for a JSON array of summaries. If the request
+        fails or the response cannot be matched up with the articles, each
+        article is summarized individually instead.
+        
+        Args:
+            contents: Full article texts to summarize
+            max_words: Maximum word count for each summary (default: 40)
+            
+        Returns:
+            List of Summary in the same order as contents
+        """
+        results: List[Optional[Summary]] = [self._get_cached_summary(content, max_words) for content in contents]
+        missing = [i for i, result in enumerate(results) if result is None]
+        
+        if len(missing) == 1:
+            results[missing[0]] = self.summarize(contents[missing[0]], max_words)
+        elif missing:
+            texts = None
+            try:
+                prompt = self._build_batch_prompt([contents[i] for i in missing])
+                response_text = self._call_with_retry(prompt, SUMMARY_MAX_TOKENS * len(missing))
+                texts = self._parse_batch_response(response_text, len(missing))
+            except Exception as e:
+                logger.warning(f"Batch summarization request failed: {e}")
+            
+            if texts is None:
+                logger.warning(f"Falling back to individual summaries for {len(missing)} articles")
+                for i in missing:
+                    results[i] = self.summarize(contents[i], max_words)
+            else:
+                for i, summary_text in zip(missing, texts):
+                    word_count = len(summary_text.split())
+                    if not self._validate_length(word_count, max_words):
+                        logger.warning(f"Summary word count ({word_count}) outside acceptable range (30-{max_words})")
+                    results[i] = self._store_summary(contents[i], max_words, summary_text, word_count)
+                logger.info(f"Successfully generated {len(missing)} summaries in one request")
+        
+        return results
+    
+    def _get_cached_summary(self, content: str, max_words: int) -> Optional[Summary]:
+        """Look up a previously generated summary for the content.
+        
+        Args:
+            content: Full article text
+            max_words: Maximum word count the summary was generated for
+            
+        Returns:
+            Cached Summary, or None if caching is disabled or there is no entry
+        """
+        if not self.cache:
+            return None
+        
+        cached = self.cache.get_json(self._cache_key(content, max_words))
+        if cached is None:
+            return None
+        
+        logger.info("Using cached summary")
+        return Summary(
+            text=cached["text"],
+            word_count=cached["word_count"],
+            success=True,
+            error_message=None
+        )
+    
+    def _store_summary(self, content: str, max_words: int, summary_text: str, word_count: int) -> Summary:
+        """Cache a generated summary and wrap it in a successful Summary.
+        
+        Args:
+            content: Full article text the summary was generated from
+            max_words: Maximum word count the summary was generated for
+            summary_text: Generated summary text
+            word_count: Number of words in summary_text
+            
+        Returns:
+            Successful Summary for the generated text
+        """
+        if self.cache:
+            self.cache.set_json(self._cache_key(content, max_words), {"text": summary_text, "word_count": word_count})
+        
+        return Summary(
+            text=summary_text,
+            word_count=word_count,
+            success=True,
+            error_message=None
+        )
+    
+    def _cache_key(self, content: str, max_words: int) -> str:
+        """Build the summary cache key for an article.
+        
+        Args:
+            content: Full article text
+            max_words: Maximum summary word count
+            
+        Returns:
+            Cache key covering everything that affects the generated summary
+        """
+        return f"{self.provider.value}|{self.model}|{max_words}|{content}"
+    
+    def _call_with_retry(self, prompt: str, max_tokens: int = SUMMARY_MAX_TOKENS) -> str:
+        """Call the configured provider, retrying rate limit and server errors.
+        
+        Args:
+            prompt: Formatted prompt
+            max_tokens: Maximum number of tokens to generate
+            
+        Returns:
+            Generated summary text
+            
+        Raises:
+            Exception: The provider error once retries are exhausted or the error is not retryable
+        """
+        for attempt in range(self.max_retries):
+            try:
+                if self.provider == AIProvider.OPENAI:
+                    return self._summarize_with_openai(prompt, max_tokens)
+                elif self.provider == AIProvider.CLAUDE:
+                    return self._summarize_with_claude(prompt, max_tokens)
+                elif self.provider == AIProvider.GEMINI:
+                    return self._summarize_with_gemini(prompt, max_tokens)
+                elif self.provider == AIProvider.GROQ:
+                    return self._summarize_with_groq(prompt, max_tokens)
+                else:
+                    raise ValueError(f"Unsupported provider: {self.provider}")
+            
+            except Exception as e:
+                status_code = getattr(e, 'status_code', None)
+                if status_code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries - 1:
+                    raise
+                
+                wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
+                logger.warning(f"AI provider returned {status_code}. Retrying in {wait_time} seconds... (attempt {attempt + 1}/{self.max_retries})")
+                time.sleep(wait_time)
+    
+    def _build_batch_prompt(self, contents: List[str]) -> str:
+        """Build a single prompt asking for summaries of several articles.
+        
+        Args:
+            contents: Article contents to summarize
+            
+        Returns:
+            Formatted prompt string
+        """
+        parts = [BATCH_PROMPT_HEADER.format(count=len(contents))]
+        for number, content in enumerate(contents, 1):
+            parts.append(f"\nArticle {number}:\n{self._truncate_to_tokens(content, self.max_input_tokens)}\n")
+        parts.append("\nSummaries:")
+        return "".join(parts)
+    
+    def _parse_batch_response(self, response_text: str, expected: int) -> Optional[List[str]]:
+        """Extract the list of summaries from a batch response.
+        
+        Args:
+            response_text: Raw model output
+            expected: Number of summaries requested
+            
+        Returns:
+            List of stripped summary strings, or None if the response is not a
+            JSON array of exactly `expected` non-empty strings
+        """
+        start = response_text.find("[")
+        end = response_text.rfind("]")
+        if start == -1 or end < start:
+            return None
+        
+        try:
+            texts = json.loads(response_text[start:end + 1])
+        except ValueError:
+            return None
+        
+        if (
+            not isinstance(texts, list)
+            or len(texts) != expected
+            or not all(isinstance(text, str) and text.strip() for text in texts)
+        ):
+            return None
+        
+        return [text.strip() for text in texts]
+    
+    def _load_encoding(self):
+        """Load the tokenizer used to measure prompt length, if one is available.
+        
+        tiktoken covers OpenAI models exactly and is a close approximation for
+        Groq-hosted models. Other providers fall back to a character estimate.
+        
+        Returns:
+            tiktoken Encoding, or None if tiktoken is unavailable or not applicable
+        """
+        if tiktoken is None or self.provider not in (AIProvider.OPENAI, AIProvider.GROQ):
+            return None
+        
+        try:
+            try:
+                return tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                return tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # Loading may download the BPE file; without it, estimate from characters
+            logger.warning(f"Could not load tiktoken encoding, estimating tokens from characters: {e}")
+            return None
+    
+    def _truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """Truncate text to at most max_tokens tokens.
+        
+        Uses the model's tokenizer when loaded; otherwise estimates tokens from
+        character count and cuts at the last word boundary.
+        
+        Args:
+            text: Text to truncate
+            max_tokens: Token budget
+            
+        Returns:
+            Text unchanged if within budget, otherwise truncated with a trailing "..."
+        """
+        if self.encoding is not None:
+            # Scraped text may contain strings like "<|endoftext|>"; encode them as plain text
+            tokens = self.encoding.encode(text, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                return text
+            return self.encoding.decode(tokens[:max_tokens]) + "..."
+        
+        max_chars = max_tokens * CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        
+        cut = text.rfind(' ', 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        return text[:cut] + "..."
+    
     def _build_prompt(self, content: str, max_words: int) -> str:
         """Build the prompt for AI summarization.
         
@@ -139,39 +441,29 @@ class AISummarizer:
         Returns:
             Formatted prompt string
         """
-        # Truncate content if too long (to avoid token limits)
-        max_content_length = 4000
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
-        
-        prompt = f"""Summarize the following news article in exactly 30-40 words.
-Focus on key facts and main points. Use either a short paragraph or bullet points.
-
-Article:
-{content}
-
-Summary:"""
+        # Truncate content to the input token budget
+        content = self._truncate_to_tokens(content, self.max_input_tokens)
         
-        return prompt
+        return PROMPT_PREFIX + content + PROMPT_SUFFIX
     
-    def _validate_length(self, summary: str, max_words: int) -> bool:
+    def _validate_length(self, word_count: int, max_words: int) -> bool:
         """Validate that summary word count is within acceptable range.
         
         Args:
-            summary: Generated summary text
+            word_count: Number of words in the generated summary
             max_words: Maximum word count
             
         Returns:
             True if word count is between 30 and max_words (inclusive)
         """
-        word_count = len(summary.split())
         return 30 <= word_count <= max_words
     
-    def _summarize_with_openai(self, prompt: str) -> str:
+    def _summarize_with_openai(self, prompt: str, max_tokens: int = SUMMARY_MAX_TOKENS) -> str:
         """Generate summary using OpenAI API.
         
         Args:
             prompt: Formatted prompt
+            max_tokens: Maximum number of tokens to generate
             
         Returns:
             Generated summary text
@@ -183,23 +475,24 @@ Summary:"""
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
-            max_tokens=100
+            max_tokens=max_tokens
         )
         
         return response.choices[0].message.content.strip()
     
-    def _summarize_with_claude(self, prompt: str) -> str:
+    def _summarize_with_claude(self, prompt: str, max_tokens: int = SUMMARY_MAX_TOKENS) -> str:
         """Generate summary using Claude API.
         
         Args:
             prompt: Formatted prompt
+            max_tokens: Maximum number of tokens to generate
             
         Returns:
             Generated summary text
         """
         response = self.client.messages.create(
             model=self.model,
-            max_tokens=100,
+            max_tokens=max_tokens,
             messages=[
                 {"role": "user", "content": prompt}
             ]
@@ -207,25 +500,27 @@ Summary:"""
         
         return response.content[0].text.strip()
     
-    def _summarize_with_gemini(self, prompt: str) -> str:
+    def _summarize_with_gemini(self, prompt: str, max_tokens: int = SUMMARY_MAX_TOKENS) -> str:
         """Generate summary using Gemini API.
         
         Args:
             prompt: Formatted prompt
+            max_tokens: Maximum number of tokens to generate
             
         Returns:
             Generated summary text
         """
         model = self.client.GenerativeModel(self.model)
-        response = model.generate_content(prompt)
+        response = model.generate_content(prompt, generation_config={"max_output_tokens": max_tokens})
         
         return response.text.strip()
     
-    def _summarize_with_groq(self, prompt: str) -> str:
+    def _summarize_with_groq(self, prompt: str, max_tokens: int = SUMMARY_MAX_TOKENS) -> str:
         """Generate summary using Groq API.
         
         Args:
             prompt: Formatted prompt
+            max_tokens: Maximum number of tokens to generate
             
         Returns:
             Generated summary text
@@ -237,7 +532,7 @@ Summary:"""
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
-            max_tokens=100
+            max_tokens=max_tokens
         )
         
         return response.choices[0].message.content.strip()
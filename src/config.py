@@ -1,25 +1,49 @@
 """Configuration management for the news aggregation system."""
+import functools
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, Tuple
+from src.entity_matcher import EntityMatcher
 
 
 class StorageType(Enum):
     """Storage backend types."""
     DATABASE = "database"
     CSV = "csv"
+    PARQUET = "parquet"
     WEB_UI = "web_ui"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestSet:
-    """Represents a test set of company entities."""
+    """Represents a test set of company entities.
+    
+    Entities are stored as a tuple (lists passed in are converted), so test
+    sets are immutable and hashable.
+    """
     name: str
-    entities: List[str]
+    entities: Tuple[str, ...]
+    # Kept out of __init__, __repr__, __eq__ and __hash__
+    matcher: EntityMatcher = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so fields are set through object.__setattr__
+        object.__setattr__(self, 'entities', tuple(self.entities))
+        # Compile the entity list once so classification is a single scan per article
+        object.__setattr__(self, 'matcher', EntityMatcher(self.entities))
+    
+    def __getstate__(self):
+        # The compiled matcher is left out of copies and pickles and rebuilt from the entities
+        return (self.name, self.entities)
+    
+    def __setstate__(self, state):
+        object.__setattr__(self, 'name', state[0])
+        object.__setattr__(self, 'entities', state[1])
+        self.__post_init__()
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """System configuration loaded from environment variables."""
     news_api_key: str
@@ -28,33 +52,74 @@ class Config:
     storage_type: StorageType
     database_url: Optional[str] = None
     output_path: Optional[str] = None
+    scraper_concurrency: int = 16
+    summarizer_concurrency: int = 8
+    summarizer_batch_size: int = 1
+    storage_batch_size: int = 50
+    scraper_preflight: bool = False
+    classifier_prefilter: bool = False
+    cache_dir: Optional[str] = None
+    news_api_rate_limit: Optional[float] = None
 
 
 class ConfigurationManager:
     """Manages system configuration and test set selection."""
     
-    # Predefined test sets
-    TEST_SETS = [
-        TestSet(name="Test Set 1: IT Services", entities=["TCS", "Wipro", "Infosys", "HCLTech"]),
-        TestSet(name="Test Set 2: Telecom", entities=["Airtel", "Jio", "Vodafone Idea", "BSNL", "MTNL", "Tejas Networks"]),
-        TestSet(name="Test Set 3: AI Companies", entities=["OpenAI", "Anthropic", "Google Deepmind", "Microsoft", "Meta"]),
-        TestSet(name="Test Set 4: Tech Giants", entities=["Microsoft", "Google", "Apple", "Meta"]),
-    ]
+    # Predefined test sets (a tuple, since each carries a compiled matcher that
+    # is built once at import and shared by every lookup)
+    TEST_SETS = (
+        TestSet(name="Test Set 1: IT Services", entities=("TCS", "Wipro", "Infosys", "HCLTech")),
+        TestSet(name="Test Set 2: Telecom", entities=("Airtel", "Jio", "Vodafone Idea", "BSNL", "MTNL", "Tejas Networks")),
+        TestSet(name="Test Set 3: AI Companies", entities=("OpenAI", "Anthropic", "Google Deepmind", "Microsoft", "Meta")),
+        TestSet(name="Test Set 4: Tech Giants", entities=("Microsoft", "Google", "Apple", "Meta")),
+    )
+    
+    # Copy of the process environment taken on first access (see _getenv)
+    _env_snapshot: Optional[dict] = None
+    
+    @staticmethod
+    def clear_cache():
+        """Discard the cached environment snapshot and loaded configuration.
+        
+        Call this after modifying environment variables (e.g. applying command-line
+        overrides) so the next lookup sees the new values.
+        """
+        ConfigurationManager._env_snapshot = None
+        ConfigurationManager.load_config.cache_clear()
+    
+    @staticmethod
+    def _getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+        """Look up an environment variable from the cached environment snapshot.
+        
+        Args:
+            name: Environment variable name
+            default: Value to return when the variable is not set
+            
+        Returns:
+            Variable value, or default if not set
+        """
+        if ConfigurationManager._env_snapshot is None:
+            ConfigurationManager._env_snapshot = dict(os.environ)
+        return ConfigurationManager._env_snapshot.get(name, default)
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def load_config() -> Config:
         """Load configuration from environment variables.
         
+        The result is cached for the lifetime of the process; call clear_cache()
+        after changing the environment to reload it.
+        
         Returns:
             Config: System configuration
             
         Raises:
             ValueError: If required environment variables are missing
         """
-        news_api_key = os.getenv("NEWS_API_KEY")
-        ai_api_key = os.getenv("AI_API_KEY")
-        ai_provider = os.getenv("AI_PROVIDER", "openai")
-        storage_type_str = os.getenv("STORAGE_TYPE", "csv")
+        news_api_key = ConfigurationManager._getenv("NEWS_API_KEY")
+        ai_api_key = ConfigurationManager._getenv("AI_API_KEY")
+        ai_provider = ConfigurationManager._getenv("AI_PROVIDER", "openai")
+        storage_type_str = ConfigurationManager._getenv("STORAGE_TYPE", "csv")
         
         if not news_api_key:
             raise ValueError("Missing required environment variable: NEWS_API_KEY")
@@ -64,10 +129,19 @@ class ConfigurationManager:
         try:
             storage_type = StorageType(storage_type_str.lower())
         except ValueError:
-            raise ValueError(f"Invalid STORAGE_TYPE: {storage_type_str}. Must be one of: database, csv, web_ui")
+            raise ValueError(f"Invalid STORAGE_TYPE: {storage_type_str}. Must be one of: database, csv, parquet, web_ui")
         
-        database_url = os.getenv("DATABASE_URL")
-        output_path = os.getenv("OUTPUT_PATH", "output/articles.csv")
+        database_url = ConfigurationManager._getenv("DATABASE_URL")
+        default_output_path = "output/articles.parquet" if storage_type == StorageType.PARQUET else "output/articles.csv"
+        output_path = ConfigurationManager._getenv("OUTPUT_PATH", default_output_path)
+        scraper_concurrency = ConfigurationManager._get_int_env("SCRAPER_CONCURRENCY", 16)
+        summarizer_concurrency = ConfigurationManager._get_int_env("SUMMARIZER_CONCURRENCY", 8)
+        summarizer_batch_size = ConfigurationManager._get_int_env("SUMMARIZER_BATCH_SIZE", 1)
+        storage_batch_size = ConfigurationManager._get_int_env("STORAGE_BATCH_SIZE", 50)
+        scraper_preflight = ConfigurationManager._get_bool_env("SCRAPER_PREFLIGHT", False)
+        classifier_prefilter = ConfigurationManager._get_bool_env("CLASSIFIER_PREFILTER", False)
+        cache_dir = ConfigurationManager._getenv("CACHE_DIR") or None
+        news_api_rate_limit = ConfigurationManager._get_float_env("NEWS_API_RATE_LIMIT", None)
         
         return Config(
             news_api_key=news_api_key,
@@ -75,9 +149,99 @@ class ConfigurationManager:
             ai_provider=ai_provider,
             storage_type=storage_type,
             database_url=database_url,
-            output_path=output_path
+            output_path=output_path,
+            scraper_concurrency=scraper_concurrency,
+            summarizer_concurrency=summarizer_concurrency,
+            summarizer_batch_size=summarizer_batch_size,
+            storage_batch_size=storage_batch_size,
+            scraper_preflight=scraper_preflight,
+            classifier_prefilter=classifier_prefilter,
+            cache_dir=cache_dir,
+            news_api_rate_limit=news_api_rate_limit
         )
     
+    @staticmethod
+    def _get_int_env(name: str, default: int) -> int:
+        """Read a positive integer from an environment variable.
+        
+        Args:
+            name: Environment variable name
+            default: Value to use when the variable is not set
+            
+        Returns:
+            int: Parsed value
+            
+        Raises:
+            ValueError: If the variable is set but is not a positive integer
+        """
+        value = ConfigurationManager._getenv(name)
+        if not value:
+            return default
+        
+        try:
+            parsed = int(value)
+        except ValueError:
+            raise ValueError(f"Invalid {name}: {value}. Must be a positive integer")
+        
+        if parsed < 1:
+            raise ValueError(f"Invalid {name}: {value}. Must be a positive integer")
+        
+        return parsed
+    
+    @staticmethod
+    def _get_float_env(name: str, default: Optional[float]) -> Optional[float]:
+        """Read a positive number from an environment variable.
+        
+        Args:
+            name: Environment variable name
+            default: Value to use when the variable is not set
+            
+        Returns:
+            Optional[float]: Parsed value
+            
+        Raises:
+            ValueError: If the variable is set but is not a positive number
+        """
+        value = ConfigurationManager._getenv(name)
+        if not value:
+            return default
+        
+        try:
+            parsed = float(value)
+        except ValueError:
+            raise ValueError(f"Invalid {name}: {value}. Must be a positive number")
+        
+        if not parsed > 0:
+            raise ValueError(f"Invalid {name}: {value}. Must be a positive number")
+        
+        return parsed
+    
+    @staticmethod
+    def _get_bool_env(name: str, default: bool) -> bool:
+        """Read a boolean flag from an environment variable.
+        
+        Args:
+            name: Environment variable name
+            default: Value to use when the variable is not set
+            
+        Returns:
+            bool: Parsed value
+            
+        Raises:
+            ValueError: If the variable is set but is not a recognized boolean
+        """
+        value = ConfigurationManager._getenv(name)
+        if not value:
+            return default
+        
+        normalized = value.strip().lower()
+        if normalized in ("1", "true", "yes", "on"):
+            return True
+        if normalized in ("0", "false", "no", "off"):
+            return False
+        
+        raise ValueError(f"Invalid {name}: {value}. Must be true or false")
+    
     @staticmethod
     def validate_api_keys() -> bool:
         """Validate that required API keys are present.
@@ -85,7 +249,7 @@ class ConfigurationManager:
         Returns:
             bool: True if all required API keys are present
         """
-        return bool(os.getenv("NEWS_API_KEY") and os.getenv("AI_API_KEY"))
+        return bool(ConfigurationManager._getenv("NEWS_API_KEY") and ConfigurationManager._getenv("AI_API_KEY"))
     
     @staticmethod
     def select_test_set() -> TestSet:
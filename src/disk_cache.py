@@ -0,0 +1,192 @@
+"""Persistent key/value cache used by pipeline components to skip repeated work."""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional accelerator
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """SQLite-backed cache mapping string keys to byte values with an optional TTL.
+    
+    Keys are stored as their SHA-256 digest, so arbitrary strings (URLs, prompts)
+    can be used directly. A single connection is shared across threads and guarded
+    by a lock, which keeps the cache safe to use from concurrent scrapers.
+    
+    Values are compressed before they are written (zstandard when installed,
+    zlib otherwise); the codec is recorded per entry so either can be read back.
+    """
+    
+    def __init__(self, path: str, ttl_seconds: Optional[int] = None, compress: bool = True):
+        """Initialize the DiskCache, creating the database file if needed.
+        
+        Args:
+            path: Path to the SQLite database file
+            ttl_seconds: Seconds before an entry expires (None means entries never expire)
+            compress: Whether to compress values on write (default: True)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.codec = ("zstd" if zstandard else "zlib") if compress else ""
+        
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value BLOB NOT NULL, "
+            "codec TEXT NOT NULL DEFAULT '')"
+        )
+        # Caches created before compression was added lack the codec column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+        if "codec" not in columns:
+            self._conn.execute("ALTER TABLE entries ADD COLUMN codec TEXT NOT NULL DEFAULT ''")
+        self._conn.commit()
+        
+        logger.debug(f"Opened disk cache at {path}")
+    
+    @staticmethod
+    def _hash_key(key: str) -> str:
+        """Return the storage key for a cache key.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Hex SHA-256 digest of the key
+        """
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _compress(value: bytes, codec: str) -> bytes:
+        """Compress a value with the given codec.
+        
+        Args:
+            value: Raw bytes
+            codec: "zstd", "zlib" or "" for no compression
+        
+        Returns:
+            Encoded bytes
+        """
+        if codec == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(value)
+        if codec == "zlib":
+            return zlib.compress(value, 6)
+        return value
+    
+    @staticmethod
+    def _decompress(value: bytes, codec: str) -> bytes:
+        """Reverse _compress for a stored value.
+        
+        Args:
+            value: Stored bytes
+            codec: Codec recorded with the entry
+        
+        Returns:
+            Raw bytes
+        """
+        if codec == "zstd":
+            return zstandard.ZstdDecompressor().decompress(value)
+        if codec == "zlib":
+            return zlib.decompress(value)
+        return value
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Look up a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached bytes, or None if the key is missing or expired
+        """
+        hashed = self._hash_key(key)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, value, codec FROM entries WHERE key = ?", (hashed,)
+            ).fetchone()
+            
+            if row is None:
+                return None
+            
+            stored_at, value, codec = row
+            if self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (hashed,))
+                self._conn.commit()
+                return None
+        
+        try:
+            return self._decompress(bytes(value), codec)
+        except Exception as e:
+            # e.g. a zstd entry read back without zstandard installed
+            logger.debug(f"Ignoring cache entry that could not be decoded: {e}")
+            return None
+    
+    def set(self, key: str, value: bytes) -> None:
+        """Store a value, replacing any existing entry for the key.
+        
+        Args:
+            key: Cache key
+            value: Bytes to store
+        """
+        hashed = self._hash_key(key)
+        encoded = self._compress(value, self.codec)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, stored_at, value, codec) VALUES (?, ?, ?, ?)",
+                (hashed, time.time(), sqlite3.Binary(encoded), self.codec)
+            )
+            self._conn.commit()
+    
+    def get_json(self, key: str) -> Optional[Any]:
+        """Look up a cached JSON value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Decoded value, or None if the key is missing, expired or not valid JSON
+        """
+        value = self.get(key)
+        if value is None:
+            return None
+        
+        try:
+            return orjson.loads(value) if orjson else json.loads(value)
+        except ValueError:
+            logger.debug("Ignoring cache entry that is not valid JSON")
+            return None
+    
+    def set_json(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value.
+        
+        Args:
+            key: Cache key
+            value: Value to serialize and store
+        """
+        self.set(key, orjson.dumps(value) if orjson else json.dumps(value).encode("utf-8"))
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -18,8 +18,8 @@ class EntityClassifier:
             test_set: TestSet containing the entities to match against
         """
         self.test_set = test_set
-        # Store lowercase versions for case-insensitive matching
-        self.entities_lower = [entity.lower() for entity in test_set.entities]
+        # Entities are compiled once per test set into a case-insensitive matcher
+        self.matcher = test_set.matcher
     
     def classify(self, article: RawArticle, full_content: str) -> List[str]:
         """Extract entities from article text and return matching entity tags.
@@ -40,6 +40,8 @@ class EntityClassifier:
     def should_include(self, article: RawArticle, full_content: str) -> bool:
         """Determine if an article should be included based on entity matching.
         
+        Unlike classify, the search stops at the first entity found.
+        
         Args:
             article: RawArticle with title and metadata
             full_content: Full article text content
@@ -47,8 +49,7 @@ class EntityClassifier:
         Returns:
             True if article mentions at least one entity from test set, False otherwise
         """
-        entities = self.classify(article, full_content)
-        return len(entities) > 0
+        return self.matcher.match_any_folded(article.title.casefold(), full_content.casefold())
     
     def _extract_entities(self, article: RawArticle, full_content: str) -> List[str]:
         """Extract all matching entities from article text.
@@ -63,21 +64,17 @@ class EntityClassifier:
         Returns:
             List of matching entity names (original case from test set)
         """
-        # Combine title and content for searching
-        text_to_search = f"{article.title} {full_content}".lower()
-        
-        matched_entities = []
-        
-        # Check each entity from the test set
-        for i, entity_lower in enumerate(self.entities_lower):
-            # Case-insensitive search
-            if entity_lower in text_to_search:
-                # Return the original case entity name from test set
-                matched_entities.append(self.test_set.entities[i])
+        # Case-fold title and content separately rather than joining them, which
+        # would copy the whole article one more time (casefold also handles
+        # Unicode cases that lower() misses, e.g. German sharp s). The short
+        # title is searched first so the content scan can stop early.
+        matched_entities = self.matcher.match_folded(article.title.casefold(), full_content.casefold())
         
-        if matched_entities:
-            logger.debug(f"Article '{article.title[:50]}...' matched entities: {', '.join(matched_entities)}")
-        else:
-            logger.debug(f"Article '{article.title[:50]}...' matched no entities")
+        # Called for every article, so skip building debug messages unless they are shown
+        if logger.isEnabledFor(logging.DEBUG):
+            if matched_entities:
+                logger.debug(f"Article '{article.title[:50]}...' matched entities: {', '.join(matched_entities)}")
+            else:
+                logger.debug(f"Article '{article.title[:50]}...' matched no entities")
         
         return matched_entities
@@ -0,0 +1,127 @@
+"""Multi-pattern entity matcher used to scan article text for test set entities."""
+import logging
+from typing import List
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class EntityMatcher:
+    """Case-insensitive substring matcher for a fixed list of entity names.
+    
+    When pyahocorasick is installed the entities are compiled into a single
+    Aho-Corasick automaton so each text is scanned once regardless of how many
+    entities there are. Without it, each distinct entity is checked with str's
+    built-in substring search, which for test-set sized lists is faster than
+    walking an automaton in pure Python.
+    
+    A single regex alternation is deliberately not used as the fallback: its
+    matches cannot overlap, so "Google" would be lost inside "Google Deepmind",
+    and re's alternation scan is slower than repeated substring searches.
+    """
+    
+    def __init__(self, entities: List[str]):
+        """Initialize the EntityMatcher, compiling the entity list.
+        
+        Args:
+            entities: Entity names to match (original case is preserved in results)
+        """
+        self.entities = list(entities)
+        self.entities_lower = [entity.casefold() for entity in self.entities]
+        self.automaton = None
+        
+        # Empty names match any text, as with a plain substring check
+        self._always_matched = frozenset(i for i, entity_lower in enumerate(self.entities_lower) if not entity_lower)
+        
+        # Entities that fold to the same name share one search
+        positions = {}
+        for i, entity_lower in enumerate(self.entities_lower):
+            if entity_lower:
+                positions.setdefault(entity_lower, []).append(i)
+        self._patterns = tuple(positions.items())
+        
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for entity_lower, indices in self._patterns:
+                self.automaton.add_word(entity_lower, indices)
+            self.automaton.make_automaton()
+    
+    def match(self, text: str) -> List[str]:
+        """Find every entity that occurs in the text.
+        
+        Args:
+            text: Text to search
+        
+        Returns:
+            Matching entity names in test set order (original case)
+        """
+        return self.match_folded(text.casefold())
+    
+    def match_folded(self, *texts_lower: str) -> List[str]:
+        """Find every entity that occurs in any of the already case-folded texts.
+        
+        Use this when the caller has folded the text itself, to avoid a second copy.
+        Several texts (e.g. title and body) can be searched without joining them;
+        an entity must occur within a single text to match. Texts are searched in
+        order and searching stops once every entity has been found, so pass the
+        shortest text first.
+        
+        Args:
+            *texts_lower: Texts to search, already passed through str.casefold()
+        
+        Returns:
+            Matching entity names in test set order (original case)
+        """
+        # Bound to locals since they are read on every iteration below
+        entities = self.entities
+        total = len(entities)
+        found = set(self._always_matched)
+        
+        if self.automaton is None:
+            for entity_lower, indices in self._patterns:
+                for text_lower in texts_lower:
+                    if entity_lower in text_lower:
+                        found.update(indices)
+                        break
+        elif self.automaton.kind == ahocorasick.AHOCORASICK:
+            for text_lower in texts_lower:
+                if len(found) == total:
+                    break
+                for _, indices in self.automaton.iter(text_lower):
+                    found.update(indices)
+                    if len(found) == total:
+                        break
+        
+        return [entities[i] for i in sorted(found)]
+    
+    def match_any_folded(self, *texts_lower: str) -> bool:
+        """Check whether any entity occurs in any of the already case-folded texts.
+        
+        Stops at the first match, so it is cheaper than match_folded when only
+        a yes/no answer is needed.
+        
+        Args:
+            *texts_lower: Texts to search, already passed through str.casefold()
+        
+        Returns:
+            True if at least one entity occurs within one of the texts
+        """
+        if self._always_matched:
+            return True
+        
+        if self.automaton is None:
+            return any(
+                entity_lower in text_lower
+                for text_lower in texts_lower
+                for entity_lower, _ in self._patterns
+            )
+        
+        if self.automaton.kind != ahocorasick.AHOCORASICK:
+            return False
+        
+        return any(next(self.automaton.iter(text_lower), None) is not None for text_lower in texts_lower)
@@ -1,10 +1,28 @@
 """News collection component for fetching articles from external APIs."""
 import logging
+import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 import requests
+from requests.adapters import HTTPAdapter
+from src.disk_cache import DiskCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - optional accelerator
+    ciso8601 = None
 
 
 logger = logging.getLogger(__name__)
@@ -17,7 +35,73 @@ logging.basicConfig(
 )
 
 
-@dataclass
+# Maximum number of result pages fetched per query
+MAX_PAGES = 3
+
+# Rate limit and server errors retried by the collector
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Longest wait between retries, and the maximum random delay (in seconds) added
+# to each backoff so clients rate limited at the same moment spread out their
+# retries instead of hitting the API again in lockstep
+RETRY_BACKOFF_MAX = 30
+RETRY_BACKOFF_JITTER = 1.0
+
+# Seconds a cached result page is reused; short, since new articles keep arriving
+RESPONSE_CACHE_TTL = 10 * 60
+
+
+class _TokenBucket:
+    """Client-side request rate limiter shared by every request a collector makes.
+    
+    Tokens refill continuously at the current rate up to capacity, and each
+    request attempt takes one, waiting for it if necessary. The rate is halved
+    whenever the API answers 429 and recovers in steps of a tenth of the
+    configured rate with every successful request (AIMD).
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        """Initialize a full bucket.
+        
+        Args:
+            rate: Requests allowed per second
+            capacity: Maximum number of requests that can be sent back to back
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take a token, sleeping until one is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait)
+    
+    def slow_down(self) -> None:
+        """Halve the rate after a rate limit response (never below 1/16 of the configured rate)."""
+        with self.lock:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+    
+    def speed_up(self) -> None:
+        """Step the rate back towards the configured rate after a successful request."""
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+@dataclass(frozen=True, slots=True)
 class RawArticle:
     """Initial article data from news API."""
     title: str
@@ -30,16 +114,47 @@ class RawArticle:
 class NewsCollector:
     """Collects news articles from external news APIs."""
     
-    def __init__(self, api_key: str, max_retries: int = 3):
+    def __init__(
+        self,
+        api_key: str,
+        max_retries: int = 3,
+        rate_limit: Optional[float] = None,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = RESPONSE_CACHE_TTL
+    ):
         """Initialize the NewsCollector.
         
         Args:
             api_key: API key for the news service
-            max_retries: Maximum number of retry attempts for failed requests
+            max_retries: Maximum number of attempts for failed requests
+            rate_limit: Maximum requests per second sent to the API, with bursts
+                of up to MAX_PAGES requests (default: None, unlimited)
+            cache_dir: Directory for the API response cache (default: None, caching disabled)
+            cache_ttl: Seconds a cached result page stays valid (default: 10 minutes)
         """
         self.api_key = api_key
         self.base_url = "https://newsapi.org/v2/everything"
         self.max_retries = max_retries
+        
+        # Requests wait for a token instead of running into the API's rate limit
+        self._bucket = _TokenBucket(rate_limit, capacity=MAX_PAGES) if rate_limit else None
+        
+        # Identical queries within cache_ttl (e.g. repeated runs) reuse the result pages
+        self.cache = DiskCache(os.path.join(cache_dir, 'news_api.db'), ttl_seconds=cache_ttl) if cache_dir else None
+        
+        # Keep-alive session so every page and retry reuses the same connection.
+        # The adapter itself never retries: _request_page does, so that every
+        # attempt waits for its own token from the bucket.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_PAGES)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+    
+    def close(self) -> None:
+        """Close the pooled keep-alive connections and the response cache."""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
     
     def fetch_news(self, entities: List[str], days_back: int = 7) -> List[RawArticle]:
         """Fetch news articles for the given entities within the specified time window.
@@ -63,89 +178,184 @@ class NewsCollector:
             "apiKey": self.api_key
         }
         
-        all_articles = []
-        page = 1
+        # Most queries fit on one page, so only request the rest once it is full
+        first_page, total_results = self._fetch_with_retry({**params, "page": 1})
+        pages = [first_page]
         
-        # Handle pagination - fetch up to 3 pages
-        while page <= 3:
-            params["page"] = page
-            
-            articles = self._fetch_with_retry(params)
-            if not articles:
-                break
-            
+        last_page = MAX_PAGES
+        if total_results is not None:
+            # Page 1 reports the total, so pages past the end are never requested
+            last_page = min(MAX_PAGES, -(-total_results // params["pageSize"]))
+        
+        if len(first_page) == params["pageSize"] and last_page > 1:
+            # Remaining pages only differ by page number, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=last_page - 1) as executor:
+                pages.extend(executor.map(
+                    lambda page: self._fetch_with_retry({**params, "page": page})[0],
+                    range(2, last_page + 1)
+                ))
+        
+        all_articles = []
+        for articles in pages:
             all_articles.extend(articles)
             
             # If we got fewer than pageSize results, we've reached the end
             if len(articles) < params["pageSize"]:
                 break
-            
-            page += 1
         
         logger.info(f"Fetched {len(all_articles)} articles for entities: {', '.join(entities)}")
         return all_articles
     
-    def _fetch_with_retry(self, params: dict) -> List[RawArticle]:
-        """Fetch articles with exponential backoff retry logic.
+    def _fetch_with_retry(self, params: dict) -> Tuple[List[RawArticle], Optional[int]]:
+        """Fetch one page of articles.
+        
+        Rate limit (429) and server errors, timeouts and connection errors are
+        retried by _request_page. Pages found in the response cache are not
+        requested at all.
         
         Args:
             params: Request parameters
             
         Returns:
-            List of RawArticle instances
+            Tuple of (RawArticle instances, total number of results reported by
+            the API or None if unknown); the list is empty if the request
+            ultimately failed
+        """
+        # The API key is left out so the cache key never contains it
+        cache_key = urlencode(sorted((k, v) for k, v in params.items() if k != "apiKey")) if self.cache else None
+        
+        try:
+            if cache_key is not None:
+                data = self.cache.get_json(cache_key)
+                if data is not None:
+                    logger.debug(f"Cache hit for page {params.get('page')} of query {params.get('q')}")
+                    return self._parse_page(data)
+            
+            response = self._request_page(params)
+            
+            if response.status_code in RETRY_STATUS_CODES:
+                logger.error(f"Failed to fetch news after {self.max_retries} attempts (HTTP {response.status_code})")
+                return [], None
+            
+            response.raise_for_status()
+            # orjson parses the raw bytes directly instead of decoding them to a str first
+            data = orjson.loads(response.content) if orjson else response.json()
+            
+            if data.get("status") != "ok":
+                error_msg = data.get("message", "Unknown error")
+                logger.error(f"API returned error status: {error_msg}")
+                return [], None
+            
+            # Only pages that parse are cached, so a bad page is fetched again next time
+            page = self._parse_page(data)
+            if cache_key is not None:
+                self.cache.set(cache_key, response.content)
+            
+            return page
+        
+        except requests.exceptions.Timeout as e:
+            logger.error(f"Request timeout after {self.max_retries} attempts: {e}")
+        
+        except requests.exceptions.HTTPError as e:
+            # Client errors other than 429 are not worth retrying
+            logger.error(f"HTTP error: {e}")
+        
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error after {self.max_retries} attempts: {e}")
+        
+        except ValueError as e:
+            # Malformed body (requests' own JSON errors are RequestExceptions above)
+            logger.error(f"API returned invalid JSON: {e}")
+        
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+        
+        return [], None
+    
+    def _request_page(self, params: dict) -> requests.Response:
+        """Request one page, retrying rate limit and server errors, timeouts and connection errors.
+        
+        With a rate limit set, every attempt, including each retry, first waits
+        for a token from the collector's bucket, so retries never push the
+        collector over its configured rate.
+        
+        Args:
+            params: Request parameters
+            
+        Returns:
+            The last response received, which still has a retryable status code
+            if every attempt failed
+            
+        Raises:
+            requests.exceptions.RequestException: If the last attempt timed out
+                or could not connect
         """
-        for attempt in range(self.max_retries):
+        for attempt in range(1, self.max_retries + 1):
+            if self._bucket is not None:
+                self._bucket.acquire()
+            
             try:
-                response = requests.get(self.base_url, params=params, timeout=30)
-                
-                # Handle rate limiting (429) with exponential backoff
+                response = self.session.get(self.base_url, params=params, timeout=30)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+            
+            if self._bucket is not None:
                 if response.status_code == 429:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.warning(f"Rate limit hit. Retrying in {wait_time} seconds... (attempt {attempt + 1}/{self.max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get("status") != "ok":
-                    error_msg = data.get("message", "Unknown error")
-                    logger.error(f"API returned error status: {error_msg}")
-                    return []
-                
-                return self._parse_response(data)
-            
-            except requests.exceptions.Timeout as e:
-                logger.error(f"Request timeout (attempt {attempt + 1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
-                    time.sleep(wait_time)
-                    continue
-            
-            except requests.exceptions.HTTPError as e:
-                logger.error(f"HTTP error: {e}")
-                # Don't retry on client errors (4xx except 429)
-                if 400 <= response.status_code < 500 and response.status_code != 429:
-                    return []
-                # Retry on server errors (5xx)
-                if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
-                    time.sleep(wait_time)
-                    continue
-            
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request error (attempt {attempt + 1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
-                    time.sleep(wait_time)
-                    continue
-            
-            except Exception as e:
-                logger.error(f"Unexpected error: {e}")
-                return []
-        
-        logger.error(f"Failed to fetch news after {self.max_retries} attempts")
-        return []
+                    self._bucket.slow_down()
+                else:
+                    self._bucket.speed_up()
+            
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+            
+            time.sleep(self._retry_delay(attempt, response.headers.get("Retry-After")))
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt.
+        
+        Retries back off exponentially (1s, 2s, 4s, ...) with jitter, up to
+        RETRY_BACKOFF_MAX seconds, unless the API sends a Retry-After header,
+        which takes precedence.
+        
+        Args:
+            attempt: Number of attempts made so far
+            retry_after: Value of the response's Retry-After header, if any
+            
+        Returns:
+            Delay in seconds
+        """
+        if retry_after:
+            retry_after = retry_after.strip()
+            if retry_after.isdigit():
+                return float(retry_after)
+            
+            # The header may also be an HTTP date
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        
+        return min(RETRY_BACKOFF_MAX, 2 ** (attempt - 1) + random.uniform(0, RETRY_BACKOFF_JITTER))
+    
+    def _parse_page(self, data: Dict[str, Any]) -> Tuple[List[RawArticle], Optional[int]]:
+        """Parse a successful result page.
+        
+        Args:
+            data: Decoded JSON body of the page
+            
+        Returns:
+            Tuple of (RawArticle instances, total number of results reported by
+            the API or None if unknown)
+        """
+        total_results = data.get("totalResults")
+        return self._parse_response(data), total_results if isinstance(total_results, int) else None
     
     def _build_query(self, entities: List[str]) -> str:
         """Build search query from entity list.
@@ -156,46 +366,72 @@ class NewsCollector:
         Returns:
             Query string for the API
         """
-        # Use OR operator to search for any of the entities
-        return " OR ".join(f'"{entity}"' for entity in entities)
+        if not entities:
+            return ""
+        
+        # Quote each entity and use OR to search for any of them, in one join
+        return '"' + '" OR "'.join(entities) + '"'
     
-    def _parse_response(self, response: dict) -> List[RawArticle]:
+    def _parse_response(self, response: Dict[str, Any]) -> List[RawArticle]:
         """Parse API response into RawArticle instances.
         
+        Articles without a title or URL and malformed entries are skipped.
+        
         Args:
             response: JSON response from the API
             
         Returns:
             List of RawArticle instances
         """
-        articles = []
+        articles = (self._parse_article(article_data) for article_data in response.get("articles") or [])
+        return [article for article in articles if article is not None]
+    
+    def _parse_article(self, article_data: Any) -> Optional[RawArticle]:
+        """Build a RawArticle from one entry of the response.
         
-        for article_data in response.get("articles", []):
-            try:
-                # Parse published date
-                published_at = article_data.get("publishedAt")
-                published_date = None
-                if published_at:
-                    try:
-                        published_date = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
-                        logger.warning(f"Could not parse date: {published_at}")
-                
-                # Create RawArticle instance
-                article = RawArticle(
-                    title=article_data.get("title", ""),
-                    url=article_data.get("url", ""),
-                    published_date=published_date,
-                    source=article_data.get("source", {}).get("name", "Unknown"),
-                    snippet=article_data.get("description")
-                )
-                
-                # Only add articles with valid title and URL
-                if article.title and article.url:
-                    articles.append(article)
+        Args:
+            article_data: One element of the response's "articles" list
             
-            except Exception as e:
-                logger.warning(f"Error parsing article: {e}")
-                continue
+        Returns:
+            RawArticle instance, or None if the entry has no title or URL or is
+            malformed (e.g. a source that is not an object)
+        """
+        if not isinstance(article_data, dict) or not article_data.get("title") or not article_data.get("url"):
+            return None
+        
+        # Articles are built with a plain constructor call. Copying a prebuilt
+        # template with dataclasses.replace still goes through __init__ and
+        # adds its own field lookups, so it is slower, not faster.
+        try:
+            return RawArticle(
+                title=article_data["title"],
+                url=article_data["url"],
+                published_date=self._parse_date(article_data.get("publishedAt")),
+                source=(article_data.get("source") or {}).get("name", "Unknown"),
+                snippet=article_data.get("description")
+            )
+        except (AttributeError, TypeError) as e:
+            # One bad entry must not cost the rest of the page
+            logger.warning(f"Error parsing article {article_data.get('url')}: {e}")
+            return None
+    
+    def _parse_date(self, published_at: Optional[str]) -> Optional[datetime]:
+        """Parse an ISO 8601 publication date from the API.
+        
+        Args:
+            published_at: Date string such as "2024-01-15T10:30:00Z", or None
+            
+        Returns:
+            Parsed datetime, or None if the date is missing or malformed
+        """
+        if not published_at:
+            return None
         
-        return articles
+        try:
+            # ciso8601 is a C parser that also accepts the "Z" suffix directly
+            if ciso8601 is not None:
+                return ciso8601.parse_datetime(published_at)
+            return datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+        except (ValueError, AttributeError, TypeError):
+            logger.warning(f"Could not parse date: {published_at}")
+            return None
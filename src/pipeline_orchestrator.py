@@ -1,8 +1,11 @@
 """Pipeline orchestrator for coordinating the news aggregation workflow."""
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+from tqdm import tqdm
 from src.config import Config, TestSet
 from src.news_collector import NewsCollector, RawArticle
 from src.entity_classifier import EntityClassifier
@@ -10,11 +13,28 @@ from src.article_scraper import ArticleScraper, ScrapedContent
 from src.ai_summarizer import AISummarizer, Summary
 from src.storage_layer import StorageLayer, ProcessedArticle
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional accelerator
+    uvloop = None
+
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Maximum number of finished articles waiting for the store stage
+STORE_QUEUE_SIZE = 64
+
+# Seconds a partially filled summarization batch waits for more articles
+SUMMARY_BATCH_WAIT = 0.05
+
+# Runs the stage pipeline's event loop. uvloop's libuv-based loop, when
+# installed, is cheaper to wake for each scrape, summary and store result
+# handed back from the thread pools.
+_run_event_loop = uvloop.run if uvloop else asyncio.run
+
+
+@dataclass(frozen=True, slots=True)
 class PipelineError:
     """Error that occurred during pipeline processing."""
     stage: str
@@ -23,7 +43,7 @@ class PipelineError:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Result of pipeline execution with statistics."""
     total_collected: int
@@ -34,6 +54,88 @@ class PipelineResult:
     errors: List[PipelineError]
 
 
+class _SummaryBatcher:
+    """Groups articles arriving from concurrent tasks into summarize_batch calls.
+    
+    A batch is sent as soon as it is full, or SUMMARY_BATCH_WAIT seconds after
+    its first article arrived, so a slow trickle of articles is not held back.
+    Must be used from within the running event loop.
+    """
+    
+    def __init__(self, summarizer: AISummarizer, summarize_pool: ThreadPoolExecutor, batch_size: int):
+        """Initialize the batcher.
+        
+        Args:
+            summarizer: AISummarizer used for the batched requests
+            summarize_pool: Executor for summarizer calls
+            batch_size: Maximum number of articles per request
+        """
+        self.summarizer = summarizer
+        self.summarize_pool = summarize_pool
+        self.batch_size = batch_size
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def summarize(self, content: str) -> Summary:
+        """Queue an article for the next batch and wait for its summary.
+        
+        Args:
+            content: Full article text
+            
+        Returns:
+            Summary generated for the article
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((content, future))
+        
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(SUMMARY_BATCH_WAIT, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Send every queued article as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Summarize a batch on the summarize pool and resolve its waiters.
+        
+        Args:
+            batch: (content, future) pairs to summarize
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            summaries = await loop.run_in_executor(
+                self.summarize_pool, self.summarizer.summarize_batch, [content for content, _ in batch]
+            )
+        except Exception as e:
+            summaries, error_message = [], f"Batch summarization failed: {e}"
+        else:
+            error_message = f"summarize_batch returned {len(summaries)} summaries for {len(batch)} articles"
+        
+        for (_, future), summary in zip(batch, summaries):
+            if not future.done():
+                future.set_result(summary)
+        
+        # Articles left without a summary fail like any other summarization
+        # error instead of waiting forever
+        for _, future in batch[len(summaries):]:
+            if not future.done():
+                future.set_result(Summary(text="", word_count=0, success=False, error_message=error_message))
+
+
 class PipelineOrchestrator:
     """Orchestrates the complete news aggregation pipeline."""
     
@@ -96,24 +198,15 @@ class PipelineOrchestrator:
             logger.warning("No articles collected. Pipeline complete.")
             return self._build_result()
         
-        # Stage 2-5: Process each article
-        logger.info(f"\n[Stage 2-4] Processing {self.total_collected} articles...")
+        # Skip duplicate and already stored URLs before any expensive work
+        raw_articles = self._filter_new_articles(raw_articles)
+        if not raw_articles:
+            logger.info("All collected articles are already stored. Pipeline complete.")
+            return self._build_result()
         
-        for i, raw_article in enumerate(raw_articles, 1):
-            logger.info(f"\nProcessing article {i}/{self.total_collected}: {raw_article.title[:60]}...")
-            
-            processed_article = self._process_article(raw_article)
-            
-            if processed_article:
-                # Save to storage
-                success = self.storage.save_article(processed_article)
-                if success:
-                    self.total_stored += 1
-                    logger.info(f"✓ Article stored successfully")
-                else:
-                    self._log_error("storage", raw_article.url, "Failed to save article to storage")
-            else:
-                logger.info(f"✗ Article skipped (no matching entities or processing failed)")
+        # Stages 2-4: Scrape, classify, summarize and store, with stages overlapping
+        logger.info(f"\n[Stage 2-4] Processing {len(raw_articles)} articles...")
+        _run_event_loop(self._run_stages(raw_articles))
         
         # Log final results
         logger.info("\n" + "=" * 60)
@@ -122,46 +215,226 @@ class PipelineOrchestrator:
         
         return self._build_result()
     
-    def _process_article(self, raw_article: RawArticle) -> Optional[ProcessedArticle]:
-        """Process a single article through all pipeline stages.
+    def _filter_new_articles(self, raw_articles: List[RawArticle]) -> List[RawArticle]:
+        """Drop articles whose URL repeats within the batch or is already in storage.
         
         Args:
-            raw_article: RawArticle to process
+            raw_articles: Collected articles
             
         Returns:
-            ProcessedArticle if successful, None if article should be skipped
+            Articles with unique, not yet stored URLs, in collection order
+        """
+        # One lookup for the whole batch rather than a query per URL
+        seen_urls = set(self.storage.stored_urls([raw_article.url for raw_article in raw_articles]))
+        new_articles = []
+        
+        for raw_article in raw_articles:
+            if raw_article.url in seen_urls:
+                continue
+            seen_urls.add(raw_article.url)
+            new_articles.append(raw_article)
+        
+        skipped = len(raw_articles) - len(new_articles)
+        if skipped:
+            logger.info(f"Skipping {skipped} duplicate or already stored articles")
+        
+        return new_articles
+    
+    async def _run_stages(self, raw_articles: List[RawArticle]):
+        """Run the scrape, classify, summarize and store stages as a pipeline.
+        
+        Each article moves through the stages independently, so one article can
+        be summarized while others are still being scraped. Scraping and
+        summarization run on their own bounded thread pools; storage runs on a
+        single thread and writes articles in collection order. When
+        config.summarizer_batch_size is above 1 and the summarizer provides
+        summarize_batch, articles ready for summarization are grouped into
+        multi-article requests.
+        
+        Only the blocking scraper, summarizer and storage calls run on the
+        pools. Classification and the statistics and error bookkeeping happen
+        on the event loop thread, so the counters need no locking.
+        
+        Args:
+            raw_articles: Collected articles to process
+        """
+        store_queue: asyncio.Queue = asyncio.Queue(maxsize=STORE_QUEUE_SIZE)
+        
+        with ThreadPoolExecutor(max_workers=self.config.scraper_concurrency, thread_name_prefix="scrape") as scrape_pool, \
+                ThreadPoolExecutor(max_workers=self.config.summarizer_concurrency, thread_name_prefix="summarize") as summarize_pool, \
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="store") as store_pool:
+            store_task = asyncio.create_task(self._store_stage(store_queue, len(raw_articles), store_pool))
+            
+            batching = self.config.summarizer_batch_size > 1
+            if batching and not callable(getattr(self.summarizer, "summarize_batch", None)):
+                logger.warning("Summarizer does not support batching, summarizing one article per request")
+                batching = False
+            
+            if batching:
+                summarize = _SummaryBatcher(self.summarizer, summarize_pool, self.config.summarizer_batch_size).summarize
+            else:
+                async def summarize(content: str) -> Summary:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        summarize_pool, self.summarizer.summarize, content
+                    )
+            
+            # Progress bar is shown only when stderr is a terminal
+            with tqdm(total=len(raw_articles), desc="Processing articles", unit="article", disable=None) as progress:
+                try:
+                    await asyncio.gather(*(
+                        self._process_article(index, raw_article, store_queue, scrape_pool, summarize, progress)
+                        for index, raw_article in enumerate(raw_articles)
+                    ))
+                finally:
+                    await store_task
+    
+    async def _process_article(
+        self,
+        index: int,
+        raw_article: RawArticle,
+        store_queue: asyncio.Queue,
+        scrape_pool: ThreadPoolExecutor,
+        summarize: Callable[[str], Awaitable[Summary]],
+        progress: tqdm
+    ):
+        """Move a single article through scraping, classification and summarization.
+        
+        The result (or None if the article was skipped) is always handed to the
+        store stage so it can keep output in collection order.
+        
+        Args:
+            index: Position of the article in the collected list
+            raw_article: RawArticle to process
+            store_queue: Queue feeding the store stage
+            scrape_pool: Executor for scraper calls
+            summarize: Coroutine function returning the Summary for an article text
+            progress: Progress bar advanced once the article leaves the pipeline
+        """
+        loop = asyncio.get_running_loop()
+        processed_article = None
+        scraped = None
+        
+        try:
+            # Cheap check against the API metadata so off-topic articles are never scraped
+            if self.config.classifier_prefilter and not self.classifier.should_include(raw_article, raw_article.snippet or ""):
+                logger.debug(f"Article title and snippet match no entities, skipping before scrape: {raw_article.url}")
+                return
+            
+            scraped = await loop.run_in_executor(scrape_pool, self.scraper.scrape, raw_article.url)
+            
+            entities = self._classify_article(raw_article, scraped)
+            if not entities:
+                logger.info(f"✗ Article skipped (no matching entities or processing failed): {raw_article.title[:60]}")
+                return
+            
+            summary = await summarize(scraped.full_text)
+            processed_article = self._build_article(raw_article, scraped, entities, summary)
+        
+        finally:
+            # The full text isn't needed past summarization; drop it before
+            # waiting on a full store queue so it can be freed right away
+            del scraped
+            progress.update(1)
+            await store_queue.put((index, raw_article, processed_article))
+    
+    async def _store_stage(self, store_queue: asyncio.Queue, total: int, store_pool: ThreadPoolExecutor):
+        """Save processed articles in collection order as they become available.
+        
+        Articles that are next in line are collected into batches of up to
+        config.storage_batch_size and written with a single save_articles call.
+        A batch is written once it is full, or as soon as no more articles are
+        waiting on the queue, so a slow pipeline never holds finished articles
+        back; while a batch is being written the next one builds up.
+        
+        Args:
+            store_queue: Queue of (index, raw_article, processed_article) tuples
+            total: Number of articles expected on the queue
+            store_pool: Single-thread executor for storage calls
         """
-        # Stage 2: Scrape content
-        scraped = self.scraper.scrape(raw_article.url)
+        loop = asyncio.get_running_loop()
+        pending = {}
+        batch = []
+        next_index = 0
         
+        while next_index < total:
+            index, raw_article, processed_article = await store_queue.get()
+            pending[index] = (raw_article, processed_article)
+            
+            # Queue every article that is now next in line
+            while next_index in pending:
+                raw_article, processed_article = pending.pop(next_index)
+                next_index += 1
+                
+                if processed_article is not None:
+                    batch.append((next_index, raw_article, processed_article))
+            
+            while batch and (len(batch) >= self.config.storage_batch_size or store_queue.empty()):
+                chunk = batch[:self.config.storage_batch_size]
+                del batch[:len(chunk)]
+                
+                results = await loop.run_in_executor(
+                    store_pool, self.storage.save_articles, [processed_article for _, _, processed_article in chunk]
+                )
+                for (position, raw_article, _), success in zip(chunk, results):
+                    if success:
+                        self.total_stored += 1
+                        logger.info(f"✓ Article {position}/{total} stored successfully")
+                    else:
+                        self._log_error("storage", raw_article.url, "Failed to save article to storage")
+    
+    def _classify_article(self, raw_article: RawArticle, scraped: ScrapedContent) -> List[str]:
+        """Check the scrape result for an article and classify its entities.
+        
+        Args:
+            raw_article: RawArticle to classify
+            scraped: ScrapedContent returned by the scraper for this article
+            
+        Returns:
+            List of matched entity names (empty if scraping failed or nothing matched)
+        """
         if not scraped.success:
             self._log_error("scraping", raw_article.url, scraped.error_message or "Unknown scraping error")
-            return None
+            return []
         
         self.total_scraped += 1
         
-        # Stage 3: Classify entities
         entities = self.classifier.classify(raw_article, scraped.full_text)
         
         if not entities:
             # No matching entities - skip this article (expected behavior, not an error)
             logger.debug(f"Article has no matching entities, skipping: {raw_article.url}")
-            return None
+            return []
         
         self.total_classified += 1
-        logger.debug(f"Article classified with entities: {', '.join(entities)}")
-        
-        # Stage 4: Generate summary
-        summary = self.summarizer.summarize(scraped.full_text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Article classified with entities: {', '.join(entities)}")
+        return entities
+    
+    def _build_article(
+        self,
+        raw_article: RawArticle,
+        scraped: ScrapedContent,
+        entities: List[str],
+        summary: Summary
+    ) -> Optional[ProcessedArticle]:
+        """Build the ProcessedArticle for a classified article once its summary is available.
         
+        Args:
+            raw_article: RawArticle being processed
+            scraped: ScrapedContent returned by the scraper for this article
+            entities: Entities matched by the classifier
+            summary: Summary generated for the article
+            
+        Returns:
+            ProcessedArticle if summarization succeeded, None otherwise
+        """
         if not summary.success:
             self._log_error("summarization", raw_article.url, summary.error_message or "Unknown summarization error")
             return None
         
         self.total_summarized += 1
         
-        # Stage 5: Build ProcessedArticle
-        processed_article = ProcessedArticle(
+        return ProcessedArticle(
             title=raw_article.title,
             url=raw_article.url,
             published_date=scraped.published_date or scraped.scrape_timestamp,
@@ -170,8 +443,6 @@ class PipelineOrchestrator:
             source=raw_article.source,
             created_at=datetime.now()
         )
-        
-        return processed_article
     
     def _log_error(self, stage: str, article_url: str, error_message: str):
         """Log an error that occurred during pipeline processing.
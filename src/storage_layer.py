@@ -1,15 +1,57 @@
 """Storage layer for persisting processed articles."""
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set
+
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - optional accelerator
+    ciso8601 = None
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Maximum number of IDs or URLs bound into a single IN (...) query, and the
+# number of rows fetched per chunk when streaming articles
+ID_QUERY_CHUNK_SIZE = 500
+
+# Smallest batch written to PostgreSQL with COPY rather than INSERT. Below this
+# the staging table setup costs more than COPY saves.
+PG_COPY_MIN_ROWS = 100
+
+# Parser for the ISO 8601 timestamps written by CSVStorage (ciso8601 is a faster
+# C implementation when installed)
+_parse_iso_datetime = ciso8601.parse_datetime if ciso8601 else datetime.fromisoformat
+
+# Lengths of datetime.isoformat() output for naive datetimes, without and with
+# microseconds. Strings of this form sort in the same order as the datetimes.
+_NAIVE_ISO_LENGTHS = (19, 26)
+
+# Buffer sizes for CSVStorage's bulk appends. Large buffers let a batch of
+# long summaries reach the file in a few write calls instead of one per 8 KB.
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+INDEX_WRITE_BUFFER_SIZE = 1 << 16
+
+# Column headers written by CSVStorage, in the order fields are stored
+CSV_HEADERS = ('Title', 'URL', 'Published Date', 'Entities', 'Summary', 'Source', 'Created At')
+
+# Number of articles ParquetStorage buffers before writing them out as a new
+# part file. Parquet files cannot be appended to, so each flush costs a file;
+# larger batches also compress better and leave fewer files to read back.
+PARQUET_BATCH_SIZE = 500
+
+# Compression codec for ParquetStorage part files
+PARQUET_COMPRESSION = 'zstd'
+
+
+@dataclass(slots=True)
 class ProcessedArticle:
     """Final article ready for storage with all required fields."""
     title: str
@@ -21,6 +63,10 @@ class ProcessedArticle:
     created_at: datetime
 
 
+# Column names returned by get_articles_columnar, in ProcessedArticle field order
+ARTICLE_COLUMNS = ProcessedArticle.__slots__
+
+
 @dataclass
 class ArticleFilters:
     """Filters for querying stored articles."""
@@ -29,44 +75,182 @@ class ArticleFilters:
     end_date: Optional[datetime] = None
 
 
+def _join_entities(entity_tags: List[str]) -> str:
+    """Serialize entity tags for the CSV Entities column.
+    
+    Tags are trimmed and empty tags dropped here, once per article, so that
+    rows written by CSVStorage can be read back with a plain split.
+    
+    Args:
+        entity_tags: Entity tags of an article
+        
+    Returns:
+        Comma-separated tags
+    """
+    return ','.join(tag for tag in (tag.strip() for tag in entity_tags) if tag)
+
+
+def _split_entities(raw_entities: str) -> List[str]:
+    """Parse the CSV Entities column back into entity tags.
+    
+    Args:
+        raw_entities: Comma-separated tags
+        
+    Returns:
+        Entity tags, trimmed and without empty entries
+    """
+    entity_tags = raw_entities.split(',') if raw_entities else []
+    
+    # Columns written by _join_entities need nothing more; padded or empty
+    # tags only appear in files edited by hand
+    if '' in entity_tags or ', ' in raw_entities or ' ,' in raw_entities or raw_entities != raw_entities.strip():
+        entity_tags = [tag.strip() for tag in entity_tags if tag.strip()]
+    
+    return entity_tags
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Convert a datetime to the naive UTC form DatabaseStorage and ParquetStorage store.
+    
+    Args:
+        value: Naive or aware datetime
+        
+    Returns:
+        The datetime unchanged if naive, otherwise converted to UTC without tzinfo
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """Tune a new SQLite connection for write throughput.
+    
+    WAL journaling with synchronous=NORMAL syncs to disk at checkpoints
+    rather than on every commit, and still cannot corrupt the database on a
+    crash (the most recent commits may be lost on power failure).
+    
+    Args:
+        dbapi_connection: Raw sqlite3 connection
+        connection_record: SQLAlchemy connection pool record (unused)
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+@lru_cache(maxsize=None)
+def _orm_models():
+    """Define the SQLAlchemy models used by DatabaseStorage.
+    
+    The models are built once per process and shared by every DatabaseStorage
+    instance, so SQLAlchemy's compiled statement cache carries over between
+    instances instead of starting empty for a fresh mapper each time. Tables
+    are still created per engine.
+    
+    Returns:
+        Tuple of (declarative base, Article model, ArticleEntity model)
+    """
+    from sqlalchemy import Column, Integer, DateTime, Text, ForeignKey, Index
+    from sqlalchemy.orm import configure_mappers, declarative_base
+    
+    Base = declarative_base()
+    
+    # Define the articles table
+    class Article(Base):
+        __tablename__ = 'articles'
+        
+        id = Column(Integer, primary_key=True)
+        title = Column(Text, nullable=False)
+        url = Column(Text, nullable=False, unique=True)
+        # Indexed for the date range filter in get_articles
+        published_date = Column(DateTime, nullable=False, index=True)
+        source = Column(Text, nullable=False)
+        summary = Column(Text, nullable=False)
+        created_at = Column(DateTime, nullable=False)
+    
+    # Define the article_entities association table
+    class ArticleEntity(Base):
+        __tablename__ = 'article_entities'
+        # Covers the entity filter in get_articles without touching the table
+        __table_args__ = (Index('ix_article_entities_entity_article', 'entity', 'article_id'),)
+        
+        id = Column(Integer, primary_key=True)
+        article_id = Column(Integer, ForeignKey('articles.id'), nullable=False, index=True)
+        entity = Column(Text, nullable=False)
+    
+    # Configure the mappers here, once, rather than lazily inside the first
+    # query of whichever instance happens to run one first
+    configure_mappers()
+    
+    return Base, Article, ArticleEntity
+
+
+@lru_cache(maxsize=None)
+def _parquet_schema():
+    """Define the Arrow schema of the files written by ParquetStorage.
+    
+    Timestamps are stored without a time zone; pyarrow converts aware
+    datetimes to UTC when they are written.
+    
+    Returns:
+        pyarrow.Schema with one field per name in ARTICLE_COLUMNS
+    """
+    import pyarrow as pa
+    
+    return pa.schema([
+        ('title', pa.string()),
+        ('url', pa.string()),
+        ('published_date', pa.timestamp('us')),
+        ('entity_tags', pa.list_(pa.string())),
+        ('summary', pa.string()),
+        ('source', pa.string()),
+        ('created_at', pa.timestamp('us')),
+    ])
+
+
 class StorageLayer(ABC):
     """Abstract base class for article storage backends."""
     
-    def _validate_article(self, article: ProcessedArticle) -> bool:
+    @staticmethod
+    def _validate_article(article: ProcessedArticle) -> bool:
         """Validate that all required fields are present and non-empty.
         
+        Only the article is inspected, so this can be called without a backend.
+        
         Args:
             article: ProcessedArticle to validate
             
         Returns:
             True if all required fields are valid, False otherwise
         """
-        # Check title
-        if not article.title or not article.title.strip():
-            logger.error("Article validation failed: title is empty")
-            return False
+        title, url, summary = article.title, article.url, article.summary
         
-        # Check URL
-        if not article.url or not article.url.strip():
-            logger.error("Article validation failed: URL is empty")
-            return False
+        # Common case: every field is present (isspace() avoids the copy strip() makes)
+        if (
+            title and not title.isspace()
+            and url and not url.isspace()
+            and article.published_date
+            and article.entity_tags
+            and summary and not summary.isspace()
+        ):
+            return True
         
-        # Check published_date
-        if not article.published_date:
+        # Report the first invalid field
+        if not title or title.isspace():
+            logger.error("Article validation failed: title is empty")
+        elif not url or url.isspace():
+            logger.error("Article validation failed: URL is empty")
+        elif not article.published_date:
             logger.error("Article validation failed: published_date is missing")
-            return False
-        
-        # Check entity_tags
-        if not article.entity_tags or len(article.entity_tags) == 0:
+        elif not article.entity_tags:
             logger.error("Article validation failed: entity_tags is empty")
-            return False
-        
-        # Check summary
-        if not article.summary or not article.summary.strip():
+        else:
             logger.error("Article validation failed: summary is empty")
-            return False
         
-        return True
+        return False
     
     @abstractmethod
     def save_article(self, article: ProcessedArticle) -> bool:
@@ -80,6 +264,20 @@ class StorageLayer(ABC):
         """
         pass
     
+    def save_articles(self, articles: List[ProcessedArticle]) -> List[bool]:
+        """Save several processed articles to storage.
+        
+        Backends that can write a batch more cheaply than one article at a time
+        override this; the default saves each article in turn.
+        
+        Args:
+            articles: ProcessedArticles to save
+            
+        Returns:
+            Whether each article was saved (or already stored), in input order
+        """
+        return [self.save_article(article) for article in articles]
+    
     @abstractmethod
     def get_articles(self, filters: Optional[ArticleFilters] = None) -> List[ProcessedArticle]:
         """Retrieve articles from storage with optional filtering.
@@ -91,6 +289,74 @@ class StorageLayer(ABC):
             List of ProcessedArticle instances matching the filters
         """
         pass
+    
+    def iter_articles(self, filters: Optional[ArticleFilters] = None) -> Iterator[ProcessedArticle]:
+        """Stream articles from storage with optional filtering.
+        
+        Backends that can read results incrementally override this so large
+        result sets are not held in memory at once; the default wraps get_articles.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
+            
+        Yields:
+            ProcessedArticle instances matching the filters
+        """
+        yield from self.get_articles(filters)
+    
+    def get_articles_columnar(self, filters: Optional[ArticleFilters] = None) -> Dict[str, list]:
+        """Retrieve articles as one list per field instead of one object per article.
+        
+        Analytics callers that scan a few fields, or hand the result to a
+        dataframe or Arrow table constructor, can use this to skip building a
+        ProcessedArticle for every row. Backends override it to read columns
+        directly; the default transposes iter_articles.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
+            
+        Returns:
+            Dict mapping each name in ARTICLE_COLUMNS to a list of values, with
+            the same index referring to the same article in every list
+        """
+        columns = {name: [] for name in ARTICLE_COLUMNS}
+        for article in self.iter_articles(filters):
+            for name, values in columns.items():
+                values.append(getattr(article, name))
+        return columns
+    
+    @abstractmethod
+    def has_url(self, url: str) -> bool:
+        """Check whether an article with the given URL is already stored.
+        
+        Args:
+            url: Article URL
+            
+        Returns:
+            True if an article with this URL exists in storage
+        """
+        pass
+    
+    def stored_urls(self, urls: List[str]) -> Set[str]:
+        """Return which of the given URLs are already stored.
+        
+        Backends that can look up many URLs in one query override this; the
+        default checks each URL with has_url.
+        
+        Args:
+            urls: Article URLs
+            
+        Returns:
+            The subset of urls that exist in storage
+        """
+        return {url for url in urls if self.has_url(url)}
+    
+    def close(self) -> None:
+        """Write out any buffered articles and release resources.
+        
+        Backends that write through on every save have nothing to do here.
+        """
+        pass
 
 
 
@@ -103,39 +369,40 @@ class DatabaseStorage(StorageLayer):
         Args:
             database_url: Database connection URL (e.g., 'sqlite:///articles.db' or PostgreSQL URL)
         """
-        from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Table, ForeignKey
-        from sqlalchemy.orm import declarative_base, sessionmaker, relationship
+        from sqlalchemy import create_engine, event
+        from sqlalchemy.engine import make_url
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
         
         self.database_url = database_url
-        self.engine = create_engine(database_url)
-        self.Base = declarative_base()
-        
-        # Define the articles table
-        class Article(self.Base):
-            __tablename__ = 'articles'
-            
-            id = Column(Integer, primary_key=True)
-            title = Column(Text, nullable=False)
-            url = Column(Text, nullable=False, unique=True)
-            published_date = Column(DateTime, nullable=False)
-            source = Column(Text, nullable=False)
-            summary = Column(Text, nullable=False)
-            created_at = Column(DateTime, nullable=False)
-        
-        # Define the article_entities association table
-        class ArticleEntity(self.Base):
-            __tablename__ = 'article_entities'
-            
-            id = Column(Integer, primary_key=True)
-            article_id = Column(Integer, ForeignKey('articles.id'), nullable=False)
-            entity = Column(Text, nullable=False)
-        
-        self.Article = Article
-        self.ArticleEntity = ArticleEntity
+        url = make_url(database_url)
+        if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+            # Each connection to an in-memory database gets its own empty one,
+            # and the default pool opens one per thread, so the pipeline's store
+            # thread would not see the tables. Share a single connection instead.
+            self.engine = create_engine(
+                database_url,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False}
+            )
+            event.listen(self.engine, "connect", _configure_sqlite_connection)
+        elif database_url.startswith("sqlite"):
+            self.engine = create_engine(database_url)
+            event.listen(self.engine, "connect", _configure_sqlite_connection)
+        else:
+            # Server databases may drop idle connections between pipeline runs
+            self.engine = create_engine(database_url, pool_pre_ping=True)
+        self.Base, self.Article, self.ArticleEntity = _orm_models()
         
         # Create tables
         self.Base.metadata.create_all(self.engine)
         
+        # create_all skips tables that already exist, so databases created
+        # before an index was added get it here
+        for table in self.Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        
         # Create session factory
         self.Session = sessionmaker(bind=self.engine)
         
@@ -150,49 +417,294 @@ class DatabaseStorage(StorageLayer):
         Returns:
             True if save was successful, False otherwise
         """
+        return self.save_articles([article])[0]
+    
+    def save_articles(self, articles: List[ProcessedArticle]) -> List[bool]:
+        """Save several processed articles to the database in one transaction.
+        
+        Articles and their entity tags are written with one multi-row INSERT
+        each rather than a statement per row. Articles whose URL is already
+        stored (or repeated within the batch) are skipped and count as saved.
+        
+        Args:
+            articles: ProcessedArticles to save
+            
+        Returns:
+            Whether each article was saved (or already stored), in input order
+        """
         # Validate required fields
-        if not self._validate_article(article):
-            return False
+        results = [self._validate_article(article) for article in articles]
+        
+        new_articles = {}
+        for article, valid in zip(articles, results):
+            if valid:
+                new_articles.setdefault(article.url, article)
+        
+        if not new_articles:
+            return results
         
-        session = self.Session()
         try:
-            # Check if article already exists (by URL)
-            existing = session.query(self.Article).filter_by(url=article.url).first()
-            if existing:
-                logger.info(f"Article already exists in database: {article.url}")
-                session.close()
-                return True
-            
-            # Create article record
-            db_article = self.Article(
-                title=article.title,
-                url=article.url,
-                published_date=article.published_date,
-                source=article.source,
-                summary=article.summary,
-                created_at=article.created_at
+            # session.begin() commits on success and rolls back on error
+            with self.Session() as session, session.begin():
+                article_ids = self._insert_new_articles(session, new_articles)
+                
+                # Create entity associations for the articles that were inserted
+                entity_params = [
+                    {"article_id": article_id, "entity": entity}
+                    for url, article_id in article_ids.items()
+                    for entity in new_articles[url].entity_tags
+                ]
+                if entity_params:
+                    self._insert_entities(session, entity_params)
+        except Exception as e:
+            logger.error(f"Failed to save articles to database: {e}")
+            return [False] * len(articles)
+        
+        for url in new_articles.keys() - article_ids.keys():
+            logger.info(f"Article already exists in database: {url}")
+        for url in article_ids:
+            logger.info(f"Successfully saved article to database: {new_articles[url].title}")
+        return results
+    
+    def _insert_new_articles(self, session, articles: Dict[str, ProcessedArticle]) -> Dict[str, int]:
+        """Insert article rows whose URL is not stored yet.
+        
+        On SQLite and PostgreSQL this is a single INSERT ... ON CONFLICT (url)
+        DO NOTHING RETURNING id, url, so the unique constraint on url decides
+        which rows are new without a separate lookup (and without racing another
+        writer). Large PostgreSQL batches go through COPY (see
+        _copy_new_articles). Other databases check for existing URLs with a
+        SELECT first, and read the new IDs back with RETURNING where supported.
+        
+        Args:
+            session: Open database session (committed by the caller)
+            articles: Articles to insert, keyed by URL
+            
+        Returns:
+            Mapping of URL to new article ID for every row that was inserted
+        """
+        from sqlalchemy import insert
+        
+        article_table = self.Article.__table__
+        dialect = self.engine.dialect
+        
+        if self._can_copy(len(articles)):
+            return self._copy_new_articles(session, articles)
+        
+        if dialect.name in ("sqlite", "postgresql") and dialect.insert_executemany_returning:
+            if dialect.name == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            
+            stmt = dialect_insert(article_table).on_conflict_do_nothing(index_elements=["url"]).returning(
+                article_table.c.id, article_table.c.url
             )
-            session.add(db_article)
-            session.flush()  # Get the article ID
-            
-            # Create entity associations
-            for entity in article.entity_tags:
-                entity_record = self.ArticleEntity(
-                    article_id=db_article.id,
-                    entity=entity
-                )
-                session.add(entity_record)
+            rows = session.execute(stmt, [self._article_params(article) for article in articles.values()])
+            return {url: article_id for article_id, url in rows}
+        
+        # Check which articles already exist (by URL)
+        existing = {url for (url,) in session.query(self.Article.url).filter(self.Article.url.in_(list(articles)))}
+        new_urls = [url for url in articles if url not in existing]
+        if not new_urls:
+            return {}
+        
+        params = [self._article_params(articles[url]) for url in new_urls]
+        if dialect.insert_executemany_returning:
+            # Generated IDs come back with the insert itself
+            rows = session.execute(insert(article_table).returning(article_table.c.id, article_table.c.url), params)
+        else:
+            session.execute(insert(article_table), params)
+            rows = session.query(self.Article.id, self.Article.url).filter(self.Article.url.in_(new_urls))
+        return {url: article_id for article_id, url in rows}
+    
+    def _insert_entities(self, session, entity_params: List[dict]) -> None:
+        """Insert article_entities rows.
+        
+        Args:
+            session: Open database session (committed by the caller)
+            entity_params: Column values for each row
+        """
+        from sqlalchemy import insert
+        
+        if self._can_copy(len(entity_params)):
+            self._copy_rows(
+                session, 'article_entities', ('article_id', 'entity'),
+                ((params["article_id"], params["entity"]) for params in entity_params)
+            )
+        else:
+            session.execute(insert(self.ArticleEntity.__table__), entity_params)
+    
+    def _can_copy(self, row_count: int) -> bool:
+        """Check whether a batch should be written with PostgreSQL's COPY.
+        
+        Args:
+            row_count: Number of rows in the batch
             
-            session.commit()
-            logger.info(f"Successfully saved article to database: {article.title}")
-            return True
+        Returns:
+            True for batches of at least PG_COPY_MIN_ROWS on a psycopg2 connection
+        """
+        dialect = self.engine.dialect
+        return dialect.name == "postgresql" and dialect.driver == "psycopg2" and row_count >= PG_COPY_MIN_ROWS
+    
+    def _copy_new_articles(self, session, articles: Dict[str, ProcessedArticle]) -> Dict[str, int]:
+        """Insert article rows whose URL is not stored yet using COPY.
+        
+        COPY cannot skip conflicting rows, so the batch is copied into a
+        temporary staging table and moved into articles with one
+        INSERT ... SELECT ... ON CONFLICT (url) DO NOTHING RETURNING id, url.
+        
+        Args:
+            session: Open database session (committed by the caller)
+            articles: Articles to insert, keyed by URL
+            
+        Returns:
+            Mapping of URL to new article ID for every row that was inserted
+        """
+        from sqlalchemy import text
+        
+        columns = tuple(column.name for column in self.Article.__table__.columns if column.name != 'id')
+        column_list = ', '.join(columns)
         
+        # Dropped when the caller's transaction commits
+        session.execute(text(
+            "CREATE TEMP TABLE articles_staging (title TEXT, url TEXT, published_date TIMESTAMP, "
+            "source TEXT, summary TEXT, created_at TIMESTAMP) ON COMMIT DROP"
+        ))
+        self._copy_rows(
+            session, 'articles_staging', columns,
+            (itemgetter(*columns)(self._article_params(article)) for article in articles.values())
+        )
+        rows = session.execute(text(
+            f"INSERT INTO articles ({column_list}) SELECT {column_list} FROM articles_staging "
+            f"ON CONFLICT (url) DO NOTHING RETURNING id, url"
+        ))
+        return {url: article_id for article_id, url in rows}
+    
+    @staticmethod
+    def _copy_rows(session, table: str, columns: tuple, rows) -> None:
+        """Stream rows into a table with COPY ... FROM STDIN.
+        
+        Every value is quoted so empty strings are not read back as NULL;
+        None is written as an unquoted empty field, which COPY reads as NULL.
+        
+        Args:
+            session: Open database session on a psycopg2 connection
+            table: Table to copy into
+            columns: Column names, in the order of the row values
+            rows: Iterable of row value sequences
+        """
+        import io
+        
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(','.join(
+                '' if value is None else '"' + str(value).replace('"', '""') + '"' for value in row
+            ))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        finally:
+            cursor.close()
+    
+    @staticmethod
+    def _article_params(article: ProcessedArticle) -> dict:
+        """Build the articles table row for an article.
+        
+        Timestamps are stored as naive UTC, so INSERT and COPY write the same
+        value for a timezone-aware datetime (a TIMESTAMP column would otherwise
+        drop or reinterpret the offset).
+        
+        Args:
+            article: ProcessedArticle to store
+            
+        Returns:
+            Column values for the articles table
+        """
+        return {
+            "title": article.title,
+            "url": article.url,
+            "published_date": _naive_utc(article.published_date) if article.published_date else None,
+            "source": article.source,
+            "summary": article.summary,
+            "created_at": _naive_utc(article.created_at) if article.created_at else None
+        }
+    
+    def has_url(self, url: str) -> bool:
+        """Check whether an article with the given URL is already in the database.
+        
+        Args:
+            url: Article URL
+            
+        Returns:
+            True if an article with this URL exists
+        """
+        try:
+            with self.Session() as session:
+                return session.query(self.Article.id).filter_by(url=url).first() is not None
         except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to save article to database: {e}")
+            logger.error(f"Failed to look up article URL in database: {e}")
             return False
-        finally:
-            session.close()
+    
+    def stored_urls(self, urls: List[str]) -> Set[str]:
+        """Return which of the given URLs are already in the database.
+        
+        URLs are looked up with one IN (...) query per ID_QUERY_CHUNK_SIZE
+        URLs instead of a query per URL.
+        
+        Args:
+            urls: Article URLs
+            
+        Returns:
+            The subset of urls that exist in the database (empty if the lookup fails)
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        found = set()
+        try:
+            with self.Session() as session:
+                for start in range(0, len(unique_urls), ID_QUERY_CHUNK_SIZE):
+                    chunk = unique_urls[start:start + ID_QUERY_CHUNK_SIZE]
+                    found.update(url for (url,) in session.query(self.Article.url).filter(self.Article.url.in_(chunk)))
+        except Exception as e:
+            logger.error(f"Failed to look up article URLs in database: {e}")
+            return set()
+        return found
+    
+    def _filtered_query(self, session, filters: Optional[ArticleFilters], *entities):
+        """Build a query over the articles table with the given filters applied.
+        
+        Args:
+            session: Session to build the query in
+            filters: Optional ArticleFilters to apply
+            *entities: Mapped class or columns to select
+            
+        Returns:
+            SQLAlchemy Query selecting the given entities
+        """
+        query = session.query(*entities)
+        
+        # Apply entity filter if specified
+        if filters and filters.entities:
+            # Keep articles with at least one matching entity (EXISTS avoids
+            # the DISTINCT a join would need for multi-entity matches)
+            query = query.filter(
+                session.query(self.ArticleEntity.id).filter(
+                    self.ArticleEntity.article_id == self.Article.id,
+                    self.ArticleEntity.entity.in_(filters.entities)
+                ).exists()
+            )
+        
+        # Apply date filters if specified
+        if filters and filters.start_date:
+            query = query.filter(self.Article.published_date >= filters.start_date)
+        
+        if filters and filters.end_date:
+            query = query.filter(self.Article.published_date <= filters.end_date)
+        
+        return query
     
     def get_articles(self, filters: Optional[ArticleFilters] = None) -> List[ProcessedArticle]:
         """Retrieve articles from the database with optional filtering.
@@ -203,56 +715,98 @@ class DatabaseStorage(StorageLayer):
         Returns:
             List of ProcessedArticle instances matching the filters
         """
-        session = self.Session()
         try:
-            # Start with base query
-            query = session.query(self.Article)
+            result = list(self.iter_articles(filters))
+        except Exception as e:
+            logger.error(f"Failed to retrieve articles from database: {e}")
+            return []
+        
+        logger.info(f"Retrieved {len(result)} articles from database")
+        return result
+    
+    def get_articles_columnar(self, filters: Optional[ArticleFilters] = None) -> Dict[str, list]:
+        """Retrieve articles from the database as one list per field.
+        
+        Selects plain column tuples rather than ORM objects, and loads entity
+        tags for the whole result with a single query.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
             
-            # Apply entity filter if specified
-            if filters and filters.entities:
-                # Join with article_entities and filter by entity
-                query = query.join(self.ArticleEntity).filter(
-                    self.ArticleEntity.entity.in_(filters.entities)
-                ).distinct()
-            
-            # Apply date filters if specified
-            if filters and filters.start_date:
-                query = query.filter(self.Article.published_date >= filters.start_date)
-            
-            if filters and filters.end_date:
-                query = query.filter(self.Article.published_date <= filters.end_date)
-            
-            # Execute query
-            db_articles = query.all()
-            
-            # Convert to ProcessedArticle instances
-            result = []
-            for db_article in db_articles:
-                # Get entity tags for this article
-                entity_records = session.query(self.ArticleEntity).filter_by(
-                    article_id=db_article.id
-                ).all()
-                entity_tags = [record.entity for record in entity_records]
-                
-                processed_article = ProcessedArticle(
-                    title=db_article.title,
-                    url=db_article.url,
-                    published_date=db_article.published_date,
-                    entity_tags=entity_tags,
-                    summary=db_article.summary,
-                    source=db_article.source,
-                    created_at=db_article.created_at
+        Returns:
+            Dict mapping each name in ARTICLE_COLUMNS to a list of values
+            (empty lists if the query fails)
+        """
+        columns = {name: [] for name in ARTICLE_COLUMNS}
+        try:
+            with self.Session() as session:
+                scalar_names = [name for name in ARTICLE_COLUMNS if name != 'entity_tags']
+                query = self._filtered_query(
+                    session, filters, self.Article.id, *(getattr(self.Article, name) for name in scalar_names)
                 )
-                result.append(processed_article)
-            
-            logger.info(f"Retrieved {len(result)} articles from database")
-            return result
-        
+                rows = query.all()
+                
+                # Get entity tags for every matching article in one query
+                entity_tags_by_id = defaultdict(list)
+                entity_rows = session.query(self.ArticleEntity.article_id, self.ArticleEntity.entity).filter(
+                    self.ArticleEntity.article_id.in_(query.with_entities(self.Article.id))
+                ).order_by(self.ArticleEntity.id)
+                for article_id, entity in entity_rows:
+                    entity_tags_by_id[article_id].append(entity)
+                
+                for position, name in enumerate(scalar_names, start=1):
+                    columns[name] = [row[position] for row in rows]
+                columns['entity_tags'] = [entity_tags_by_id[row[0]] for row in rows]
         except Exception as e:
             logger.error(f"Failed to retrieve articles from database: {e}")
-            return []
-        finally:
-            session.close()
+            return {name: [] for name in ARTICLE_COLUMNS}
+        
+        logger.info(f"Retrieved {len(columns['url'])} articles from database")
+        return columns
+    
+    def iter_articles(self, filters: Optional[ArticleFilters] = None) -> Iterator[ProcessedArticle]:
+        """Stream articles from the database with optional filtering.
+        
+        Rows are fetched ID_QUERY_CHUNK_SIZE at a time, with one entity tag
+        query per chunk, so memory use stays bounded for large result sets.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
+            
+        Yields:
+            ProcessedArticle instances matching the filters
+            
+        Raises:
+            Exception: Database errors are propagated to the caller
+        """
+        with self.Session() as session:
+            query = self._filtered_query(session, filters, self.Article)
+            
+            rows = iter(query.yield_per(ID_QUERY_CHUNK_SIZE))
+            while True:
+                db_articles = list(islice(rows, ID_QUERY_CHUNK_SIZE))
+                if not db_articles:
+                    break
+                
+                # Get entity tags for the whole chunk in one query
+                entity_tags_by_id = defaultdict(list)
+                entity_rows = session.query(self.ArticleEntity.article_id, self.ArticleEntity.entity).filter(
+                    self.ArticleEntity.article_id.in_([db_article.id for db_article in db_articles])
+                ).order_by(self.ArticleEntity.id)
+                for article_id, entity in entity_rows:
+                    entity_tags_by_id[article_id].append(entity)
+                
+                # Convert to ProcessedArticle instances
+                for db_article in db_articles:
+                    yield ProcessedArticle(
+                        title=db_article.title,
+                        url=db_article.url,
+                        published_date=db_article.published_date,
+                        entity_tags=entity_tags_by_id[db_article.id],
+                        summary=db_article.summary,
+                        source=db_article.source,
+                        created_at=db_article.created_at
+                    )
 
 
 
@@ -269,6 +823,19 @@ class CSVStorage(StorageLayer):
         
         self.output_path = output_path
         
+        # Sidecar file listing stored URLs one per line, so later runs can load
+        # them without parsing the whole CSV
+        self.index_path = output_path + ".urlidx"
+        
+        # URLs already in the file, loaded on first lookup (see _stored_urls)
+        self._urls: Optional[set] = None
+        
+        # Append handles for the CSV and index files, opened on the first save
+        # and kept until close() so later batches skip the open/close calls
+        self._csv_file = None
+        self._csv_writer = None
+        self._index_file = None
+        
         # Ensure directory exists
         directory = os.path.dirname(output_path)
         if directory and not os.path.exists(directory):
@@ -283,10 +850,15 @@ class CSVStorage(StorageLayer):
     def _create_csv_with_headers(self):
         """Create CSV file with proper headers."""
         import csv
+        import os
+        
+        # An index left over from a previous file no longer applies
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
         
         with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
-            writer.writerow(['Title', 'URL', 'Published Date', 'Entities', 'Summary', 'Source', 'Created At'])
+            writer.writerow(CSV_HEADERS)
         
         logger.info(f"Created CSV file with headers: {self.output_path}")
     
@@ -299,38 +871,130 @@ class CSVStorage(StorageLayer):
         Returns:
             True if save was successful, False otherwise
         """
+        return self.save_articles([article])[0]
+    
+    def save_articles(self, articles: List[ProcessedArticle]) -> List[bool]:
+        """Save several processed articles to the CSV file with a single write.
+        
+        All new rows are appended with one writerows call and flushed, so the
+        file is complete after every batch. The file handles stay open for
+        later batches until close() is called. Articles whose URL is already
+        stored (or repeated within the batch) are skipped and count as saved.
+        
+        Args:
+            articles: ProcessedArticles to save
+            
+        Returns:
+            Whether each article was saved (or already stored), in input order
+        """
         import csv
         
         # Validate required fields
-        if not self._validate_article(article):
-            return False
+        results = [self._validate_article(article) for article in articles]
         
         try:
-            # Check if article already exists (by URL)
-            existing_articles = self.get_articles()
-            if any(a.url == article.url for a in existing_articles):
-                logger.info(f"Article already exists in CSV: {article.url}")
-                return True
-            
-            # Append to CSV file
-            with open(self.output_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    article.title,
-                    article.url,
-                    article.published_date.isoformat(),
-                    ','.join(article.entity_tags),  # Comma-separated entities
-                    article.summary,
-                    article.source,
-                    article.created_at.isoformat()
-                ])
-            
-            logger.info(f"Successfully saved article to CSV: {article.title}")
-            return True
+            stored_urls = self._stored_urls()
+            new_articles = {}
+            for article, valid in zip(articles, results):
+                if not valid:
+                    continue
+                # Check if article already exists (by URL)
+                if article.url in stored_urls:
+                    logger.info(f"Article already exists in CSV: {article.url}")
+                    continue
+                new_articles.setdefault(article.url, article)
+            
+            if new_articles:
+                # Rows are built up front so a bad article cannot leave a partial batch in the file
+                rows = [
+                    [
+                        article.title,
+                        article.url,
+                        article.published_date.isoformat(),
+                        _join_entities(article.entity_tags),  # Comma-separated entities
+                        article.summary,
+                        article.source,
+                        article.created_at.isoformat()
+                    ]
+                    for article in new_articles.values()
+                ]
+                
+                if self._csv_file is None:
+                    self._csv_file = open(self.output_path, 'a', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_SIZE)
+                    self._csv_writer = csv.writer(self._csv_file)
+                    self._index_file = open(self.index_path, 'a', encoding='utf-8', buffering=INDEX_WRITE_BUFFER_SIZE)
+                
+                # Append to CSV file, then record the URLs in the index
+                self._csv_writer.writerows(rows)
+                self._csv_file.flush()
+                self._index_file.writelines(f"{url}\n" for url in new_articles)
+                self._index_file.flush()
+                
+                stored_urls.update(new_articles)
+                for article in new_articles.values():
+                    logger.info(f"Successfully saved article to CSV: {article.title}")
+            
+            return results
         
         except Exception as e:
-            logger.error(f"Failed to save article to CSV: {e}")
-            return False
+            logger.error(f"Failed to save articles to CSV: {e}")
+            # Reopen on the next save rather than reuse handles in an unknown state
+            self.close()
+            return [False] * len(articles)
+    
+    def close(self) -> None:
+        """Close the append handles kept open by save_articles."""
+        for f in (self._csv_file, self._index_file):
+            if f is not None:
+                try:
+                    f.close()
+                except OSError as e:
+                    logger.error(f"Failed to close CSV storage file: {e}")
+        self._csv_file = self._csv_writer = self._index_file = None
+    
+    def has_url(self, url: str) -> bool:
+        """Check whether an article with the given URL is already in the CSV file.
+        
+        Args:
+            url: Article URL
+            
+        Returns:
+            True if an article with this URL exists
+        """
+        return url in self._stored_urls()
+    
+    def _stored_urls(self) -> set:
+        """Return the set of URLs in the CSV file, loading them on first use.
+        
+        URLs come from the index file when it is at least as new as the CSV.
+        Otherwise (no index yet, or the CSV was changed by something else) they
+        are read from the CSV's URL column and the index is rewritten.
+        
+        Returns:
+            Set of stored article URLs (kept up to date by save_articles)
+        """
+        import csv
+        import os
+        
+        if self._urls is None:
+            self._urls = set()
+            if not os.path.exists(self.output_path):
+                return self._urls
+            
+            if os.path.exists(self.index_path) and os.path.getmtime(self.index_path) >= os.path.getmtime(self.output_path):
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._urls.update(f.read().splitlines())
+                return self._urls
+            
+            with open(self.output_path, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Skip header
+                self._urls.update(row[1] for row in reader if len(row) > 1)
+            
+            with open(self.index_path, 'w', encoding='utf-8', buffering=INDEX_WRITE_BUFFER_SIZE) as f:
+                f.writelines(f"{url}\n" for url in self._urls)
+        
+        return self._urls
     
     def get_articles(self, filters: Optional[ArticleFilters] = None) -> List[ProcessedArticle]:
         """Retrieve articles from the CSV file with optional filtering.
@@ -341,62 +1005,385 @@ class CSVStorage(StorageLayer):
         Returns:
             List of ProcessedArticle instances matching the filters
         """
+        try:
+            result = list(self.iter_articles(filters))
+        except Exception as e:
+            logger.error(f"Failed to retrieve articles from CSV: {e}")
+            return []
+        
+        logger.info(f"Retrieved {len(result)} articles from CSV")
+        return result
+    
+    def iter_articles(self, filters: Optional[ArticleFilters] = None) -> Iterator[ProcessedArticle]:
+        """Stream articles from the CSV file with optional filtering.
+        
+        Rows are read and parsed one at a time, so memory use does not grow
+        with the size of the file.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
+            
+        Yields:
+            ProcessedArticle instances matching the filters
+            
+        Raises:
+            OSError: If the CSV file cannot be read
+        """
+        for values in self._iter_rows(filters):
+            yield ProcessedArticle(*values)
+    
+    def get_articles_columnar(self, filters: Optional[ArticleFilters] = None) -> Dict[str, list]:
+        """Retrieve articles from the CSV file as one list per field.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
+            
+        Returns:
+            Dict mapping each name in ARTICLE_COLUMNS to a list of values
+            (empty lists if the file cannot be read)
+        """
+        columns = {name: [] for name in ARTICLE_COLUMNS}
+        try:
+            rows = list(self._iter_rows(filters))
+        except Exception as e:
+            logger.error(f"Failed to retrieve articles from CSV: {e}")
+            return columns
+        
+        for values, column in zip(zip(*rows), columns.values()):
+            column.extend(values)
+        
+        logger.info(f"Retrieved {len(rows)} articles from CSV")
+        return columns
+    
+    def _iter_rows(self, filters: Optional[ArticleFilters] = None) -> Iterator[tuple]:
+        """Parse the CSV rows that match the filters.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
+            
+        Yields:
+            Tuples of field values in ARTICLE_COLUMNS order
+            
+        Raises:
+            OSError: If the CSV file cannot be read
+            ValueError: If the header row lacks one of CSV_HEADERS
+        """
         import csv
         import os
         
-        try:
-            # Check if file exists
-            if not os.path.exists(self.output_path):
-                logger.warning(f"CSV file does not exist: {self.output_path}")
-                return []
+        # Check if file exists
+        if not os.path.exists(self.output_path):
+            logger.warning(f"CSV file does not exist: {self.output_path}")
+            return
+        
+        # Built once so each row is checked with a set lookup rather than a
+        # nested scan of filter entities against entity tags
+        entity_set = frozenset(filters.entities) if filters and filters.entities else None
+        start_date = filters.start_date if filters else None
+        end_date = filters.end_date if filters else None
+        
+        # Naive bounds in isoformat() form let rows written by save_article be
+        # range checked by string comparison, so rejected rows are never parsed
+        start_key = start_date.isoformat() if start_date and start_date.tzinfo is None else None
+        end_key = end_date.isoformat() if end_date and end_date.tzinfo is None else None
+        
+        with open(self.output_path, 'r', newline='', encoding='utf-8') as f:
+            # Rows are read as lists and unpacked by position, which avoids
+            # building a dict per row as csv.DictReader does
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
             
-            result = []
+            # Files whose columns were reordered or extended by hand are
+            # mapped onto the standard order
+            reorder = None
+            if tuple(header) != CSV_HEADERS:
+                reorder = itemgetter(*(header.index(name) for name in CSV_HEADERS))
             
-            with open(self.output_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                for row in reader:
-                    try:
-                        # Parse entity tags (comma-separated)
-                        entity_tags = [e.strip() for e in row['Entities'].split(',') if e.strip()]
-                        
-                        # Parse dates
-                        published_date = datetime.fromisoformat(row['Published Date'])
-                        created_at = datetime.fromisoformat(row['Created At'])
-                        
-                        # Create ProcessedArticle
-                        article = ProcessedArticle(
-                            title=row['Title'],
-                            url=row['URL'],
-                            published_date=published_date,
-                            entity_tags=entity_tags,
-                            summary=row['Summary'],
-                            source=row['Source'],
-                            created_at=created_at
-                        )
-                        
-                        # Apply filters
-                        if filters:
-                            # Entity filter
-                            if filters.entities:
-                                if not any(entity in article.entity_tags for entity in filters.entities):
-                                    continue
-                            
-                            # Date filters
-                            if filters.start_date and article.published_date < filters.start_date:
-                                continue
-                            
-                            if filters.end_date and article.published_date > filters.end_date:
-                                continue
+            # Filters are applied as soon as the fields they need are parsed,
+            # so rejected rows skip the remaining parsing and object creation
+            for row in reader:
+                try:
+                    if reorder is not None:
+                        row = reorder(row)
+                    # Fields past the last column (e.g. stray trailing commas) are
+                    # ignored, as csv.DictReader did
+                    title, url, raw_published, raw_entities, summary, source, raw_created = row[:len(CSV_HEADERS)]
+                    
+                    # Cheap prefilter on the raw column: a row whose text contains
+                    # none of the filter entities cannot have a matching tag
+                    if entity_set is not None and not any(entity in raw_entities for entity in entity_set):
+                        continue
+                    
+                    # Parse entity tags (comma-separated)
+                    entity_tags = _split_entities(raw_entities)
+                    
+                    # Entity filter (exact tag match)
+                    if entity_set is not None and entity_set.isdisjoint(entity_tags):
+                        continue
+                    
+                    # Date filters
+                    if len(raw_published) in _NAIVE_ISO_LENGTHS and raw_published[10] == 'T':
+                        if start_key and raw_published < start_key:
+                            continue
                         
-                        result.append(article)
-                    except (KeyError, ValueError) as e:
-                        logger.warning(f"Error parsing CSV row: {e}")
+                        if end_key and raw_published > end_key:
+                            continue
+                    
+                    published_date = _parse_iso_datetime(raw_published)
+                    
+                    if start_date and published_date < start_date:
+                        continue
+                    
+                    if end_date and published_date > end_date:
                         continue
+                    
+                    values = (
+                        title,
+                        url,
+                        published_date,
+                        entity_tags,
+                        summary,
+                        source,
+                        _parse_iso_datetime(raw_created)
+                    )
+                except (IndexError, ValueError) as e:
+                    logger.warning(f"Error parsing CSV row: {e}")
+                    continue
+                
+                yield values
+
+
+
+class ParquetStorage(StorageLayer):
+    """Parquet storage implementation using pyarrow.
+    
+    Articles are stored in a directory of Parquet part files. Since a Parquet
+    file cannot be appended to, saved articles are buffered in memory and
+    written batch_size at a time as a new part file; call close() (or flush())
+    when done to write the remainder. Reads see buffered articles too.
+    
+    pyarrow is imported when the storage is created, so it is only required
+    when this backend is used.
+    """
+    
+    def __init__(self, output_path: str, batch_size: int = PARQUET_BATCH_SIZE):
+        """Initialize ParquetStorage with an output directory.
+        
+        Args:
+            output_path: Directory holding the Parquet part files
+            batch_size: Number of articles buffered before a part file is written
+            
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import os
+        import pyarrow  # noqa: F401 - fail here rather than on the first flush
+        
+        self.output_path = output_path
+        self.batch_size = max(1, batch_size)
+        
+        # Articles saved since the last flush, keyed by URL
+        self._pending: Dict[str, ProcessedArticle] = {}
+        
+        # URLs already written to part files, loaded on first lookup (see _stored_urls)
+        self._urls: Optional[set] = None
+        
+        os.makedirs(output_path, exist_ok=True)
+        
+        logger.info(f"Initialized ParquetStorage with output path: {output_path}")
+    
+    def save_article(self, article: ProcessedArticle) -> bool:
+        """Save a processed article, writing a part file once the buffer is full.
+        
+        Args:
+            article: ProcessedArticle to save
+            
+        Returns:
+            True if save was successful, False otherwise
+        """
+        return self.save_articles([article])[0]
+    
+    def save_articles(self, articles: List[ProcessedArticle]) -> List[bool]:
+        """Save several processed articles, writing a part file once the buffer is full.
+        
+        Articles whose URL is already stored (or repeated within the batch) are
+        skipped and count as saved.
+        
+        Args:
+            articles: ProcessedArticles to save
+            
+        Returns:
+            Whether each article was saved (or already stored), in input order
+        """
+        # Validate required fields
+        results = [self._validate_article(article) for article in articles]
+        
+        added = []
+        try:
+            stored_urls = self._stored_urls()
+            for article, valid in zip(articles, results):
+                if not valid:
+                    continue
+                if article.url in stored_urls or article.url in self._pending:
+                    logger.info(f"Article already exists in Parquet storage: {article.url}")
+                    continue
+                self._pending[article.url] = article
+                added.append(article.url)
+            
+            if len(self._pending) >= self.batch_size:
+                self.flush()
             
-            logger.info(f"Retrieved {len(result)} articles from CSV")
-            return result
+            return results
         
         except Exception as e:
-            logger.error(f"Failed to retrieve articles from CSV: {e}")
-            return []
+            # Articles buffered by earlier calls stay queued for the next flush
+            for url in added:
+                self._pending.pop(url, None)
+            logger.error(f"Failed to save articles to Parquet storage: {e}")
+            return [False] * len(articles)
+    
+    def flush(self) -> None:
+        """Write the buffered articles to a new part file.
+        
+        The file is written under a hidden name and renamed into place, so
+        readers never see a partly written part.
+        
+        Raises:
+            OSError: If the part file cannot be written
+        """
+        import os
+        import time
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        if not self._pending:
+            return
+        
+        articles = list(self._pending.values())
+        table = pa.table(
+            {
+                'title': [article.title for article in articles],
+                'url': [article.url for article in articles],
+                'published_date': [article.published_date for article in articles],
+                'entity_tags': [[tag for tag in (tag.strip() for tag in article.entity_tags) if tag] for article in articles],
+                'summary': [article.summary for article in articles],
+                'source': [article.source for article in articles],
+                'created_at': [article.created_at for article in articles],
+            },
+            schema=_parquet_schema()
+        )
+        
+        # Zero-padded nanosecond names sort in the order the parts were written
+        name = f"part-{time.time_ns():020d}.parquet"
+        temp_path = os.path.join(self.output_path, '.' + name)
+        pq.write_table(table, temp_path, compression=PARQUET_COMPRESSION)
+        os.replace(temp_path, os.path.join(self.output_path, name))
+        
+        self._stored_urls().update(self._pending)
+        self._pending.clear()
+        logger.info(f"Wrote {len(articles)} articles to Parquet part file: {name}")
+    
+    def close(self) -> None:
+        """Write out any buffered articles."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to write buffered articles to Parquet storage: {e}")
+    
+    def has_url(self, url: str) -> bool:
+        """Check whether an article with the given URL is stored or buffered.
+        
+        Args:
+            url: Article URL
+            
+        Returns:
+            True if an article with this URL exists
+        """
+        return url in self._pending or url in self._stored_urls()
+    
+    def _stored_urls(self) -> set:
+        """Return the set of URLs in the part files, loading them on first use.
+        
+        Only the URL column is read.
+        
+        Returns:
+            Set of written article URLs (kept up to date by flush)
+        """
+        if self._urls is None:
+            self._urls = set(self._read_table(columns=['url']).column('url').to_pylist())
+        return self._urls
+    
+    def _read_table(self, filters: Optional[ArticleFilters] = None, columns: Optional[List[str]] = None):
+        """Read the part files into a single Arrow table.
+        
+        Date filters are pushed down to the reader, so row groups whose
+        statistics fall outside the range are skipped without decoding.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
+            columns: Columns to read (default: all of ARTICLE_COLUMNS)
+            
+        Returns:
+            pyarrow.Table of the matching articles, in the order they were written
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+        
+        predicates = []
+        if filters and filters.start_date:
+            predicates.append(('published_date', '>=', _naive_utc(filters.start_date)))
+        if filters and filters.end_date:
+            predicates.append(('published_date', '<=', _naive_utc(filters.end_date)))
+        
+        table = pq.read_table(
+            self.output_path,
+            columns=columns,
+            filters=predicates or None,
+            schema=_parquet_schema()
+        )
+        
+        if filters and filters.entities:
+            # Rows with at least one tag in the filter, found on the flattened tags
+            tags = table.column('entity_tags').combine_chunks()
+            hits = pc.is_in(pc.list_flatten(tags), value_set=pa.array(list(filters.entities), pa.string()))
+            table = table.take(pc.unique(pc.filter(pc.list_parent_indices(tags), hits)))
+        
+        return table
+    
+    def get_articles(self, filters: Optional[ArticleFilters] = None) -> List[ProcessedArticle]:
+        """Retrieve articles from Parquet storage with optional filtering.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
+            
+        Returns:
+            List of ProcessedArticle instances matching the filters
+        """
+        columns = self.get_articles_columnar(filters)
+        return [ProcessedArticle(*values) for values in zip(*columns.values())]
+    
+    def get_articles_columnar(self, filters: Optional[ArticleFilters] = None) -> Dict[str, list]:
+        """Retrieve articles from Parquet storage as one list per field.
+        
+        Buffered articles are written out first so they are included.
+        
+        Args:
+            filters: Optional ArticleFilters to filter results
+            
+        Returns:
+            Dict mapping each name in ARTICLE_COLUMNS to a list of values
+            (empty lists if the files cannot be read)
+        """
+        try:
+            self.flush()
+            table = self._read_table(filters)
+        except Exception as e:
+            logger.error(f"Failed to retrieve articles from Parquet storage: {e}")
+            return {name: [] for name in ARTICLE_COLUMNS}
+        
+        logger.info(f"Retrieved {table.num_rows} articles from Parquet storage")
+        return table.select(list(ARTICLE_COLUMNS)).to_pydict()
+
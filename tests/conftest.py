@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+import pytest
+from src.config import ConfigurationManager
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Reset cached configuration so each test sees its own environment."""
+    ConfigurationManager.clear_cache()
+    yield
+    ConfigurationManager.clear_cache()
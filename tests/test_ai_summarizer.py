@@ -1,4 +1,7 @@
 """Unit tests for the AISummarizer component."""
+import copy
+import pickle
+import sqlite3
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from src.ai_summarizer import AISummarizer, AIProvider, Summary
@@ -9,20 +12,27 @@ class TestAISummarizer:
     
     def test_summarizer_initialization_openai(self):
         """Test AISummarizer can be initialized with OpenAI provider."""
-        with patch('src.ai_summarizer.openai.OpenAI') as mock_openai:
+        with patch('openai.OpenAI') as mock_openai:
             summarizer = AISummarizer(api_key="test-key", provider=AIProvider.OPENAI)
             assert summarizer.api_key == "test-key"
             assert summarizer.provider == AIProvider.OPENAI
             assert summarizer.model == "gpt-3.5-turbo"
-            mock_openai.assert_called_once_with(api_key="test-key")
+            # Retries are handled by _call_with_retry, not stacked on the SDK's own
+            mock_openai.assert_called_once_with(api_key="test-key", max_retries=0)
+    
+    def test_summarizer_initialization_claude_disables_sdk_retries(self):
+        """Test the Anthropic client is built without its own retries."""
+        with patch('anthropic.Anthropic') as mock_anthropic:
+            AISummarizer(api_key="test-key", provider=AIProvider.CLAUDE)
+            mock_anthropic.assert_called_once_with(api_key="test-key", max_retries=0)
     
     def test_summarizer_custom_model(self):
         """Test AISummarizer can be initialized with custom model."""
-        with patch('src.ai_summarizer.openai.OpenAI'):
+        with patch('openai.OpenAI'):
             summarizer = AISummarizer(api_key="test-key", provider=AIProvider.OPENAI, model="gpt-4")
             assert summarizer.model == "gpt-4"
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_summarize_success(self, mock_openai_class):
         """Test successful summarization with OpenAI."""
         # Setup mock
@@ -44,7 +54,7 @@ class TestAISummarizer:
         assert result.error_message is None
         assert len(result.text) > 0
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_summarize_validates_word_count(self, mock_openai_class):
         """Test that summarizer validates word count is within range."""
         # Setup mock with summary in valid range
@@ -62,7 +72,123 @@ class TestAISummarizer:
         assert result.success is True
         assert result.word_count > 0
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
+    def test_summarize_uses_cache(self, mock_openai_class, tmp_path):
+        """Test that identical content is only sent to the provider once."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = " ".join(["word"] * 35)
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+        
+        summarizer = AISummarizer(api_key="test-key", cache_dir=str(tmp_path))
+        result1 = summarizer.summarize("Cached article content")
+        result2 = summarizer.summarize("Cached article content")
+        
+        assert result1.success is True
+        assert result2.success is True
+        assert result2.text == result1.text
+        assert result2.word_count == 35
+        mock_client.chat.completions.create.assert_called_once()
+    
+    @patch('openai.OpenAI')
+    def test_summarize_does_not_cache_failures(self, mock_openai_class, tmp_path):
+        """Test that failed summaries are retried rather than served from cache."""
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = Exception("Temporary error")
+        mock_openai_class.return_value = mock_client
+        
+        summarizer = AISummarizer(api_key="test-key", cache_dir=str(tmp_path))
+        summarizer.summarize("Article content")
+        summarizer.summarize("Article content")
+        
+        assert mock_client.chat.completions.create.call_count == 2
+    
+    @patch('openai.OpenAI')
+    def test_summarize_batch_single_request(self, mock_openai_class):
+        """Test summarize_batch summarizes several articles with one API call."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = '```json\n["First summary.", "Second summary.", "Third summary."]\n```'
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+        
+        summarizer = AISummarizer(api_key="test-key")
+        results = summarizer.summarize_batch(["doc-0", "doc-1", "doc-2"])
+        
+        assert [r.text for r in results] == ["First summary.", "Second summary.", "Third summary."]
+        assert all(r.success for r in results)
+        assert mock_client.chat.completions.create.call_count == 1
+        prompt = mock_client.chat.completions.create.call_args.kwargs["messages"][-1]["content"]
+        assert "Article 3:\ndoc-2" in prompt
+    
+    @patch('openai.OpenAI')
+    def test_summarize_batch_falls_back_on_malformed_response(self, mock_openai_class):
+        """Test summarize_batch summarizes individually when the batch response cannot be parsed."""
+        def create(**kwargs):
+            prompt = kwargs["messages"][-1]["content"]
+            response = Mock()
+            response.choices = [Mock()]
+            if "JSON array" in prompt:
+                response.choices[0].message.content = '["Only one summary."]'
+            else:
+                article = next(word for word in prompt.split() if word.startswith("doc-"))
+                response.choices[0].message.content = "summary of " + article
+            return response
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = create
+        mock_openai_class.return_value = mock_client
+        
+        summarizer = AISummarizer(api_key="test-key")
+        results = summarizer.summarize_batch(["doc-0", "doc-1"])
+        
+        assert [r.text for r in results] == ["summary of doc-0", "summary of doc-1"]
+        assert mock_client.chat.completions.create.call_count == 3
+    
+    @patch('openai.OpenAI')
+    def test_summarize_batch_uses_cache(self, mock_openai_class, tmp_path):
+        """Test summarize_batch only sends articles without a cached summary."""
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "summary of doc-1"
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+        
+        summarizer = AISummarizer(api_key="test-key", cache_dir=str(tmp_path))
+        summarizer._store_summary("doc-0", 40, "cached summary", 2)
+        results = summarizer.summarize_batch(["doc-0", "doc-1"])
+        
+        assert [r.text for r in results] == ["cached summary", "summary of doc-1"]
+        prompt = mock_client.chat.completions.create.call_args.kwargs["messages"][-1]["content"]
+        assert "doc-0" not in prompt
+    
+    @patch('src.ai_summarizer.time.sleep')
+    @patch('openai.OpenAI')
+    def test_summarize_retries_rate_limit(self, mock_openai_class, mock_sleep):
+        """Test that rate limit errors are retried with exponential backoff."""
+        rate_limit_error = Exception("Rate limit exceeded")
+        rate_limit_error.status_code = 429
+        
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "A short summary"
+        
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [rate_limit_error, rate_limit_error, mock_response]
+        mock_openai_class.return_value = mock_client
+        
+        summarizer = AISummarizer(api_key="test-key")
+        result = summarizer.summarize("Article content")
+        
+        assert result.success is True
+        assert mock_client.chat.completions.create.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
+    
+    @patch('openai.OpenAI')
     def test_summarize_handles_api_error(self, mock_openai_class):
         """Test handling of API errors during summarization."""
         # Setup mock to raise exception
@@ -80,7 +206,7 @@ class TestAISummarizer:
         assert result.text == ""
         assert result.word_count == 0
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_summarize_handles_network_error(self, mock_openai_class):
         """Test handling of network errors."""
         # Setup mock to raise network exception
@@ -96,7 +222,7 @@ class TestAISummarizer:
         assert result.error_message is not None
         assert "Network unreachable" in result.error_message
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_summarize_truncates_long_content(self, mock_openai_class):
         """Test that very long content is truncated before sending to API."""
         # Setup mock
@@ -122,7 +248,43 @@ class TestAISummarizer:
         prompt = call_args[1]['messages'][1]['content']
         assert len(prompt) < len(long_content)
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
+    def test_truncate_to_tokens_without_tokenizer(self, mock_openai_class):
+        """Test character-estimate truncation cuts at a word boundary."""
+        summarizer = AISummarizer(api_key="test-key")
+        summarizer.encoding = None
+        
+        assert summarizer._truncate_to_tokens("short text", 10) == "short text"
+        assert summarizer._truncate_to_tokens("alpha beta gamma delta", 3) == "alpha beta..."
+    
+    @patch('openai.OpenAI')
+    def test_truncate_to_tokens_with_tokenizer(self, mock_openai_class):
+        """Test truncation uses the loaded tokenizer when available."""
+        summarizer = AISummarizer(api_key="test-key")
+        summarizer.encoding = Mock()
+        summarizer.encoding.encode.return_value = list(range(10))
+        summarizer.encoding.decode.return_value = "first tokens"
+        
+        result = summarizer._truncate_to_tokens("some long text", 4)
+        
+        assert result == "first tokens..."
+        summarizer.encoding.decode.assert_called_once_with([0, 1, 2, 3])
+        # Special-token text in an article is encoded as plain text instead of raising
+        summarizer.encoding.encode.assert_called_once_with("some long text", disallowed_special=())
+    
+    @patch('openai.OpenAI')
+    def test_load_encoding_failure_falls_back_to_estimate(self, mock_openai_class):
+        """Test a tokenizer that cannot be loaded (e.g. BPE download fails) leaves the summarizer usable."""
+        mock_tiktoken = Mock()
+        mock_tiktoken.encoding_for_model.side_effect = OSError("network unreachable")
+        
+        with patch('src.ai_summarizer.tiktoken', mock_tiktoken):
+            summarizer = AISummarizer(api_key="test-key")
+        
+        assert summarizer.encoding is None
+        assert summarizer._truncate_to_tokens("alpha beta gamma delta", 3) == "alpha beta..."
+    
+    @patch('openai.OpenAI')
     def test_build_prompt_format(self, mock_openai_class):
         """Test that prompt is built with correct format."""
         mock_client = Mock()
@@ -136,7 +298,7 @@ class TestAISummarizer:
         assert "Test article content" in prompt
         assert "Summary:" in prompt
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_validate_length_within_range(self, mock_openai_class):
         """Test word count validation for summaries within range."""
         mock_client = Mock()
@@ -145,11 +307,11 @@ class TestAISummarizer:
         summarizer = AISummarizer(api_key="test-key")
         
         # Test valid lengths
-        assert summarizer._validate_length("word " * 30, 40) is True
-        assert summarizer._validate_length("word " * 35, 40) is True
-        assert summarizer._validate_length("word " * 40, 40) is True
+        assert summarizer._validate_length(30, 40) is True
+        assert summarizer._validate_length(35, 40) is True
+        assert summarizer._validate_length(40, 40) is True
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_validate_length_outside_range(self, mock_openai_class):
         """Test word count validation for summaries outside range."""
         mock_client = Mock()
@@ -158,9 +320,25 @@ class TestAISummarizer:
         summarizer = AISummarizer(api_key="test-key")
         
         # Test invalid lengths
-        assert summarizer._validate_length("word " * 29, 40) is False
-        assert summarizer._validate_length("word " * 41, 40) is False
-        assert summarizer._validate_length("word " * 10, 40) is False
+        assert summarizer._validate_length(29, 40) is False
+        assert summarizer._validate_length(41, 40) is False
+        assert summarizer._validate_length(10, 40) is False
+    
+    def test_provider_from_str(self):
+        """Test provider names are resolved case-insensitively with an OpenAI default."""
+        assert AIProvider.from_str("claude") == AIProvider.CLAUDE
+        assert AIProvider.from_str("GROQ") == AIProvider.GROQ
+        assert AIProvider.from_str("unknown") == AIProvider.OPENAI
+    
+    @patch('openai.OpenAI')
+    def test_close_closes_cache(self, mock_openai_class, tmp_path):
+        """Test close releases the summary cache file."""
+        summarizer = AISummarizer(api_key="test-key", cache_dir=str(tmp_path))
+        
+        summarizer.close()
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            summarizer.cache.get("key")
     
     def test_summary_dataclass(self):
         """Test Summary dataclass structure."""
@@ -176,6 +354,19 @@ class TestAISummarizer:
         assert summary.success is True
         assert summary.error_message is None
     
+    def test_summary_is_slotted(self):
+        """Test Summary carries no per-instance __dict__."""
+        summary = Summary(text="Test summary", word_count=2, success=True, error_message=None)
+        
+        assert not hasattr(summary, "__dict__")
+    
+    def test_summary_copy_and_pickle(self):
+        """Test Summary survives copy and a pickle round trip."""
+        summary = Summary(text="Test summary", word_count=2, success=True, error_message=None)
+        
+        assert copy.copy(summary) == summary
+        assert pickle.loads(pickle.dumps(summary)) == summary
+    
     def test_summary_dataclass_with_error(self):
         """Test Summary dataclass with error."""
         summary = Summary(
@@ -190,7 +381,7 @@ class TestAISummarizer:
         assert summary.success is False
         assert summary.error_message == "API error"
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_summarize_continues_after_failure(self, mock_openai_class):
         """Test that summarizer can continue after a failure."""
         mock_client = Mock()
@@ -213,7 +404,7 @@ class TestAISummarizer:
         result2 = summarizer.summarize("Second article")
         assert result2.success is True
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_summarize_with_empty_content(self, mock_openai_class):
         """Test summarization with empty content."""
         mock_client = Mock()
@@ -229,7 +420,7 @@ class TestAISummarizer:
         # Should still work, just summarize empty content
         assert result.success is True
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_summarize_strips_whitespace(self, mock_openai_class):
         """Test that summary text is stripped of leading/trailing whitespace."""
         mock_client = Mock()
@@ -247,7 +438,7 @@ class TestAISummarizer:
         assert not result.text.startswith(" ")
         assert not result.text.endswith(" ")
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_summarize_uses_correct_model(self, mock_openai_class):
         """Test that summarizer uses the specified model."""
         mock_client = Mock()
@@ -264,7 +455,7 @@ class TestAISummarizer:
         call_args = mock_client.chat.completions.create.call_args
         assert call_args[1]['model'] == "gpt-4"
     
-    @patch('src.ai_summarizer.openai.OpenAI')
+    @patch('openai.OpenAI')
     def test_summarize_sets_temperature(self, mock_openai_class):
         """Test that summarizer sets appropriate temperature parameter."""
         mock_client = Mock()
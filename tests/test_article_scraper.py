@@ -1,8 +1,21 @@
 """Unit tests for the ArticleScraper component."""
+import sqlite3
+import threading
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
-from src.article_scraper import ArticleScraper, ScrapedContent
+from src.article_scraper import ArticleScraper, ScrapedContent, CONNECT_TIMEOUT, canonical_url
+
+
+def make_response(content=b"<html><body></body></html>"):
+    """Build a mock streamed HTTP response with the given body."""
+    mock_response = Mock()
+    mock_response.content = content
+    mock_response.headers = {}
+    mock_response.iter_content.return_value = [content]
+    return mock_response
 
 
 class TestArticleScraper:
@@ -18,8 +31,154 @@ class TestArticleScraper:
         scraper = ArticleScraper(timeout=60)
         assert scraper.timeout == 60
     
-    @patch('src.article_scraper.Article')
-    def test_scrape_success_with_newspaper3k(self, mock_article_class):
+    @patch('newspaper.Article')
+    def test_downloads_limited_per_host(self, mock_article_class):
+        """Test a single host never gets more than per_host_concurrency downloads at once."""
+        mock_article_class.return_value.text = "Sufficient article text. " * 10
+        mock_article_class.return_value.publish_date = None
+        lock = threading.Lock()
+        active = []
+        peak = []
+        
+        def slow_get(url, **kwargs):
+            with lock:
+                active.append(url)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(url)
+            return make_response()
+        
+        urls = [f"https://example.com/article{i}" for i in range(8)]
+        scraper = ArticleScraper(concurrency=8, per_host_concurrency=2)
+        
+        with patch('src.article_scraper.requests.Session.get', side_effect=slow_get), \
+                ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(scraper.scrape, urls))
+        
+        assert all(result.success for result in results)
+        assert max(peak) <= 2
+        scraper.close()
+    
+    @patch('src.article_scraper.requests.Session.get')
+    def test_scrape_skips_recently_dead_urls(self, mock_requests_get, tmp_path):
+        """Test that a URL which returned 404 is not requested again."""
+        mock_response = make_response()
+        mock_response.status_code = 404
+        mock_response.raise_for_status.side_effect = Exception("404 Not Found")
+        mock_requests_get.return_value = mock_response
+        
+        scraper = ArticleScraper(cache_dir=str(tmp_path))
+        result1 = scraper.scrape("https://example.com/gone")
+        result2 = scraper.scrape("https://example.com/gone")
+        
+        assert result1.success is False
+        assert result2.success is False
+        assert "Skipped" in result2.error_message
+        assert mock_requests_get.call_count == 1
+    
+    @patch('src.article_scraper.requests.Session.head')
+    @patch('src.article_scraper.requests.Session.get')
+    def test_preflight_skips_non_html(self, mock_requests_get, mock_requests_head):
+        """Test preflight skips pages whose HEAD response is not HTML."""
+        robots_response = Mock(status_code=404)
+        mock_requests_get.return_value = robots_response
+        mock_requests_head.return_value = Mock(status_code=200, headers={'Content-Type': 'application/pdf'})
+        
+        scraper = ArticleScraper(preflight=True)
+        result = scraper.scrape("https://example.com/report.pdf")
+        
+        assert result.success is False
+        assert "non-HTML" in result.error_message
+        # Only robots.txt was requested, never the page itself
+        mock_requests_get.assert_called_once()
+    
+    @patch('src.article_scraper.requests.Session.head')
+    @patch('src.article_scraper.requests.Session.get')
+    def test_preflight_respects_robots_txt(self, mock_requests_get, mock_requests_head):
+        """Test preflight skips pages disallowed by robots.txt and fetches robots.txt once per host."""
+        mock_requests_get.return_value = Mock(status_code=200, text="User-agent: *\nDisallow: /private/")
+        
+        scraper = ArticleScraper(preflight=True)
+        result1 = scraper.scrape("https://example.com/private/a")
+        result2 = scraper.scrape("https://example.com/private/b")
+        
+        assert "robots.txt" in result1.error_message
+        assert "robots.txt" in result2.error_message
+        mock_requests_get.assert_called_once()
+        mock_requests_head.assert_not_called()
+    
+    @patch('src.article_scraper.requests.Session.head')
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
+    def test_preflight_skipped_for_cached_pages(self, mock_article_class, mock_requests_get, mock_requests_head, tmp_path):
+        """Test a cached page is served without fetching robots.txt or sending a HEAD request."""
+        mock_article_class.return_value.text = "Sufficient article text. " * 10
+        mock_article_class.return_value.publish_date = None
+        mock_requests_head.return_value = Mock(status_code=200, headers={'Content-Type': 'text/html'})
+        
+        scraper = ArticleScraper(cache_dir=str(tmp_path))
+        mock_requests_get.return_value = make_response()
+        assert scraper.scrape("https://example.com/article").success is True
+        mock_requests_get.reset_mock()
+        
+        preflight_scraper = ArticleScraper(cache_dir=str(tmp_path), preflight=True)
+        result = preflight_scraper.scrape("https://example.com/article")
+        
+        assert result.success is True
+        mock_requests_get.assert_not_called()
+        mock_requests_head.assert_not_called()
+        scraper.close()
+        preflight_scraper.close()
+    
+    @patch('src.article_scraper.requests.Session.head')
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
+    def test_preflight_head_uses_host_slot(self, mock_article_class, mock_requests_get, mock_requests_head):
+        """Test the preflight HEAD request holds one of the host's download slots."""
+        mock_article_class.return_value.text = "Sufficient article text. " * 10
+        mock_article_class.return_value.publish_date = None
+        scraper = ArticleScraper(preflight=True, per_host_concurrency=1)
+        slot_free_during_head = []
+        
+        def head(url, **kwargs):
+            slot = scraper._host_slot("example.com")
+            acquired = slot.acquire(blocking=False)
+            if acquired:
+                slot.release()
+            slot_free_during_head.append(acquired)
+            return Mock(status_code=200, headers={'Content-Type': 'text/html'})
+        
+        robots_response = Mock(status_code=404)
+        mock_requests_get.side_effect = lambda url, **kwargs: robots_response if url.endswith("/robots.txt") else make_response()
+        mock_requests_head.side_effect = head
+        
+        assert scraper.scrape("https://example.com/article").success is True
+        assert slot_free_during_head == [False]
+    
+    def test_session_retries_transient_errors(self):
+        """Test the pooled session retries rate limit and server errors."""
+        scraper = ArticleScraper()
+        retry = scraper.session.get_adapter('https://example.com').max_retries
+        
+        assert retry.total == 3
+        assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+    
+    def test_extract_paragraphs_prefers_article_container(self):
+        """Test paragraph extraction uses the article container and skips page chrome."""
+        html = (
+            b"<html><body><nav><p>Menu</p></nav><p>Sidebar text</p>"
+            b"<article><p>First paragraph.</p><script>var x;</script><p> </p><p>Second paragraph.</p></article>"
+            b"</body></html>"
+        )
+        
+        scraper = ArticleScraper()
+        
+        assert scraper._extract_paragraphs(html) == "First paragraph.\n\nSecond paragraph."
+    
+    @patch('src.article_scraper.requests.Session.get', return_value=make_response())
+    @patch('newspaper.Article')
+    def test_scrape_success_with_newspaper3k(self, mock_article_class, mock_requests_get):
         """Test successful scraping using newspaper3k."""
         # Setup mock
         mock_article = Mock()
@@ -37,12 +196,29 @@ class TestArticleScraper:
         assert result.error_message is None
         assert isinstance(result.scrape_timestamp, datetime)
         
-        # Verify newspaper3k was called correctly
-        mock_article.download.assert_called_once()
+        # Verify newspaper3k parsed the page fetched by the shared session
+        mock_article.download.assert_called_once_with(input_html=mock_requests_get.return_value.content)
         mock_article.parse.assert_called_once()
+        mock_requests_get.assert_called_once()
     
-    @patch('src.article_scraper.Article')
-    def test_scrape_success_without_published_date(self, mock_article_class):
+    @patch('src.article_scraper.requests.Session.get', return_value=make_response())
+    @patch('newspaper.Article')
+    def test_scrape_shares_newspaper_config(self, mock_article_class, mock_requests_get):
+        """Test every article is parsed with one shared config that skips image downloads."""
+        mock_article_class.return_value.text = "This is a test article with sufficient content. " * 10
+        scraper = ArticleScraper()
+        
+        scraper.scrape("https://example.com/a")
+        scraper.scrape("https://example.com/b")
+        
+        configs = [call.kwargs["config"] for call in mock_article_class.call_args_list]
+        assert configs[0] is configs[1] is scraper._newspaper_config
+        assert configs[0].fetch_images is False
+        assert configs[0].memoize_articles is False
+    
+    @patch('src.article_scraper.requests.Session.get', return_value=make_response())
+    @patch('newspaper.Article')
+    def test_scrape_success_without_published_date(self, mock_article_class, mock_requests_get):
         """Test successful scraping when published date is not available."""
         # Setup mock
         mock_article = Mock()
@@ -58,8 +234,8 @@ class TestArticleScraper:
         assert result.published_date is None
         assert result.scrape_timestamp is not None
     
-    @patch('src.article_scraper.requests.get')
-    @patch('src.article_scraper.Article')
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
     def test_scrape_fallback_to_beautifulsoup(self, mock_article_class, mock_requests_get):
         """Test fallback to BeautifulSoup when newspaper3k fails."""
         # Make newspaper3k fail
@@ -81,6 +257,8 @@ class TestArticleScraper:
         </html>
         """
         mock_response.raise_for_status = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_requests_get.return_value = mock_response
         
         scraper = ArticleScraper()
@@ -91,9 +269,28 @@ class TestArticleScraper:
         assert len(result.full_text) > 100
         assert "paragraph one" in result.full_text.lower()
         assert result.published_date is None  # BeautifulSoup doesn't extract dates
+        
+        # Both extractors worked from the single download
+        assert mock_requests_get.call_count == 1
+        mock_article.download.assert_called_once_with(input_html=mock_response.content)
     
-    @patch('src.article_scraper.requests.get')
-    @patch('src.article_scraper.Article')
+    @patch('src.article_scraper.requests.Session.get', return_value=make_response(
+        b"<html><body><article><p>" + b"Fallback paragraph with enough content. " * 5 + b"</p></article></body></html>"
+    ))
+    @patch('newspaper.Article')
+    def test_scrape_short_newspaper_text_falls_back_without_refetching(self, mock_article_class, mock_requests_get):
+        """Test the fallback reuses the fetched HTML when newspaper3k extracts too little text."""
+        mock_article_class.return_value.text = "Too short"
+        mock_article_class.return_value.publish_date = None
+        
+        result = ArticleScraper().scrape("https://example.com/article")
+        
+        assert result.success is True
+        assert result.full_text.startswith("Fallback paragraph")
+        assert mock_requests_get.call_count == 1
+    
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
     def test_scrape_handles_404_error(self, mock_article_class, mock_requests_get):
         """Test handling of 404 errors."""
         # Make newspaper3k fail
@@ -115,8 +312,34 @@ class TestArticleScraper:
         assert result.error_message is not None
         assert "404" in result.error_message or "error" in result.error_message.lower()
     
-    @patch('src.article_scraper.requests.get')
-    @patch('src.article_scraper.Article')
+    @patch('src.article_scraper.requests.Session.get', return_value=make_response())
+    def test_requests_use_short_connect_timeout(self, mock_requests_get):
+        """Test pages are requested with a separate, shorter connect timeout."""
+        scraper = ArticleScraper(timeout=60)
+        
+        scraper._fetch("https://example.com/article")
+        
+        assert mock_requests_get.call_args.kwargs["timeout"] == (CONNECT_TIMEOUT, 60)
+    
+    def test_connection_pool_covers_concurrency(self):
+        """Test the connection pool has room for every concurrent worker."""
+        scraper = ArticleScraper(concurrency=64)
+        
+        assert scraper.session.get_adapter("https://example.com")._pool_maxsize == 64
+    
+    def test_close_closes_session_and_caches(self, tmp_path):
+        """Test close releases pooled connections and cache files."""
+        scraper = ArticleScraper(cache_dir=str(tmp_path))
+        
+        with patch.object(scraper.session, "close") as mock_close:
+            scraper.close()
+        
+        mock_close.assert_called_once()
+        with pytest.raises(sqlite3.ProgrammingError):
+            scraper.cache.get("https://example.com/article")
+    
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
     def test_scrape_handles_timeout(self, mock_article_class, mock_requests_get):
         """Test handling of request timeouts."""
         # Make newspaper3k fail
@@ -136,7 +359,7 @@ class TestArticleScraper:
         assert result.error_message is not None
         assert "timeout" in result.error_message.lower()
     
-    @patch('src.article_scraper.Article')
+    @patch('newspaper.Article')
     def test_scrape_handles_insufficient_content(self, mock_article_class):
         """Test handling when extracted content is too short."""
         # Setup mock with very short content
@@ -146,10 +369,12 @@ class TestArticleScraper:
         mock_article_class.return_value = mock_article
         
         # Mock the fallback to also fail
-        with patch('src.article_scraper.requests.get') as mock_requests:
+        with patch('src.article_scraper.requests.Session.get') as mock_requests:
             mock_response = Mock()
             mock_response.content = b"<html><body><p>Short</p></body></html>"
             mock_response.raise_for_status = Mock()
+            mock_response.headers = {}
+            mock_response.iter_content.return_value = [mock_response.content]
             mock_requests.return_value = mock_response
             
             scraper = ArticleScraper()
@@ -158,8 +383,8 @@ class TestArticleScraper:
             # Verify - should fail due to insufficient content
             assert result.success is False
     
-    @patch('src.article_scraper.requests.get')
-    @patch('src.article_scraper.Article')
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
     def test_scrape_removes_script_and_style_tags(self, mock_article_class, mock_requests_get):
         """Test that script and style tags are removed during scraping."""
         # Make newspaper3k fail
@@ -182,6 +407,8 @@ class TestArticleScraper:
         </html>
         """
         mock_response.raise_for_status = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_requests_get.return_value = mock_response
         
         scraper = ArticleScraper()
@@ -193,6 +420,133 @@ class TestArticleScraper:
         assert "color: red" not in result.full_text
         assert "actual article content" in result.full_text
     
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
+    def test_scrape_uses_response_cache(self, mock_article_class, mock_requests_get, tmp_path):
+        """Test that a cached page is reused instead of being fetched again."""
+        # Make newspaper3k fail so the fallback fetch path is used
+        mock_article = Mock()
+        mock_article.download.side_effect = Exception("Download failed")
+        mock_article_class.return_value = mock_article
+        
+        mock_response = Mock()
+        mock_response.content = b"""
+        <html><body><article>
+            <p>This cached article has enough content to pass validation checks.</p>
+            <p>It should only be downloaded once across repeated scrapes.</p>
+        </article></body></html>
+        """
+        mock_response.raise_for_status = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [mock_response.content]
+        mock_requests_get.return_value = mock_response
+        
+        scraper = ArticleScraper(cache_dir=str(tmp_path))
+        result1 = scraper.scrape("https://example.com/cached")
+        result2 = scraper.scrape("https://example.com/cached")
+        
+        assert result1.success is True
+        assert result2.full_text == result1.full_text
+        assert mock_requests_get.call_count == 1
+    
+    def test_extract_paragraphs_skips_noscript_and_iframes(self):
+        """Test paragraphs inside noscript and iframe blocks are not treated as article text."""
+        html = b"""
+        <html><body>
+            <noscript><p>Please enable JavaScript to read this article.</p></noscript>
+            <article>
+                <p>Real article text.</p>
+                <iframe><p>Embedded player fallback</p></iframe>
+            </article>
+        </body></html>
+        """
+        
+        assert ArticleScraper()._extract_paragraphs(html) == "Real article text."
+    
+    @patch('src.article_scraper.HTMLParser', None)
+    def test_extract_paragraphs_releases_parse_tree(self):
+        """Test the BeautifulSoup tree is decomposed once the text has been extracted."""
+        from bs4 import BeautifulSoup
+        
+        html = b"<html><body><article><p>Real article text.</p></article></body></html>"
+        
+        with patch.object(BeautifulSoup, 'decompose', autospec=True) as mock_decompose:
+            assert ArticleScraper()._extract_paragraphs(html) == "Real article text."
+        
+        assert isinstance(mock_decompose.call_args_list[-1].args[0], BeautifulSoup)
+    
+    def test_article_patterns_compiled_once(self):
+        """Test the BeautifulSoup selectors are compiled on first use and then reused."""
+        from src.article_scraper import ARTICLE_SELECTORS, _article_patterns
+        
+        patterns = _article_patterns()
+        
+        assert len(patterns) == len(ARTICLE_SELECTORS)
+        assert _article_patterns() is patterns
+    
+    def test_canonical_url(self):
+        """Test cache keys ignore tracking parameters, fragments, host case and trailing slashes."""
+        assert canonical_url("HTTPS://Example.com/news/story/?utm_source=x&id=7&fbclid=abc#top") == "https://example.com/news/story?id=7"
+        assert canonical_url("https://example.com/") == "https://example.com/"
+        assert canonical_url("https://example.com/a?b=1&c=") == "https://example.com/a?b=1&c="
+    
+    def test_canonical_url_keeps_query_encoding(self):
+        """Test removing tracking parameters leaves the remaining ones byte-for-byte intact."""
+        assert canonical_url("https://example.com/a?q=a%20b&utm_medium=rss&gclid") == "https://example.com/a?q=a%20b"
+        assert canonical_url("https://example.com/a?q=a%20b") == "https://example.com/a?q=a%20b"
+        assert canonical_url("https://example.com/a?fbclidx=1&xutm_a=2") == "https://example.com/a?fbclidx=1&xutm_a=2"
+    
+    @patch('src.article_scraper.requests.Session.get', return_value=make_response(
+        b"<html><body><article><p>" + b"Cached article text with enough content. " * 5 + b"</p></article></body></html>"
+    ))
+    @patch('newspaper.Article')
+    def test_scrape_cache_shared_by_tracking_variants(self, mock_article_class, mock_requests_get, tmp_path):
+        """Test links differing only in tracking parameters share a cache entry unless forced."""
+        mock_article_class.return_value.download.side_effect = Exception("Download failed")
+        scraper = ArticleScraper(cache_dir=str(tmp_path))
+        
+        assert scraper.scrape("https://example.com/story").success is True
+        assert scraper.scrape("https://example.com/story/?utm_campaign=feed#comments").success is True
+        assert mock_requests_get.call_count == 1
+        
+        assert scraper.scrape("https://example.com/story", force=True).success is True
+        assert mock_requests_get.call_count == 2
+    
+    @patch('src.article_scraper.requests.Session.get')
+    def test_fetch_truncates_oversized_page(self, mock_requests_get):
+        """Test that streaming stops once the page size limit is reached."""
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = iter([b"a" * 60, b"b" * 60, b"c" * 60])
+        mock_requests_get.return_value = mock_response
+        
+        scraper = ArticleScraper(max_page_bytes=100)
+        html = scraper._fetch("https://example.com/huge")
+        
+        assert html == b"a" * 60 + b"b" * 40
+        mock_response.close.assert_called_once()
+    
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
+    def test_scrape_rejects_large_content_length(self, mock_article_class, mock_requests_get):
+        """Test that pages advertising a size above the limit are not downloaded."""
+        mock_article = Mock()
+        mock_article.download.side_effect = Exception("Download failed")
+        mock_article_class.return_value = mock_article
+        
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.headers = {'Content-Length': '5000'}
+        mock_requests_get.return_value = mock_response
+        
+        scraper = ArticleScraper(max_page_bytes=1000)
+        result = scraper.scrape("https://example.com/huge")
+        
+        assert result.success is False
+        assert "Page too large" in result.error_message
+        mock_response.iter_content.assert_not_called()
+    
     def test_scraped_content_dataclass(self):
         """Test ScrapedContent dataclass structure."""
         timestamp = datetime.now()
@@ -210,8 +564,22 @@ class TestArticleScraper:
         assert content.success is True
         assert content.error_message is None
     
-    @patch('src.article_scraper.requests.get')
-    @patch('src.article_scraper.Article')
+    def test_scraped_content_is_immutable_and_slotted(self):
+        """Test ScrapedContent carries no per-instance __dict__ and cannot be modified."""
+        content = ScrapedContent(
+            full_text="Test content",
+            published_date=None,
+            scrape_timestamp=datetime(2024, 1, 15),
+            success=True,
+            error_message=None
+        )
+        
+        assert not hasattr(content, "__dict__")
+        with pytest.raises(AttributeError):
+            content.full_text = "Changed"
+    
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
     def test_scrape_handles_403_forbidden(self, mock_article_class, mock_requests_get):
         """Test handling of 403 Forbidden errors (paywalls, access denied)."""
         # Make newspaper3k fail
@@ -235,8 +603,8 @@ class TestArticleScraper:
         assert "403" in result.error_message or "error" in result.error_message.lower()
         assert result.full_text == ""
     
-    @patch('src.article_scraper.requests.get')
-    @patch('src.article_scraper.Article')
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
     def test_scrape_handles_network_error(self, mock_article_class, mock_requests_get):
         """Test handling of network connection errors."""
         # Make newspaper3k fail
@@ -256,8 +624,8 @@ class TestArticleScraper:
         assert result.error_message is not None
         assert "error" in result.error_message.lower()
     
-    @patch('src.article_scraper.requests.get')
-    @patch('src.article_scraper.Article')
+    @patch('src.article_scraper.requests.Session.get')
+    @patch('newspaper.Article')
     def test_scrape_continues_after_failure(self, mock_article_class, mock_requests_get):
         """Test that scraper can continue processing after a failure."""
         # Make newspaper3k fail
@@ -289,6 +657,8 @@ class TestArticleScraper:
         </html>
         """
         mock_response.raise_for_status = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_requests_get.return_value = mock_response
         
         # Second scrape succeeds
@@ -1,5 +1,7 @@
 """Unit tests for configuration management."""
+import copy
 import os
+import pickle
 import pytest
 from src.config import ConfigurationManager, Config, TestSet, StorageType
 
@@ -56,6 +58,123 @@ class TestConfigurationManager:
         
         assert config.storage_type == StorageType.CSV
     
+    def test_load_config_parquet_default_output_path(self, monkeypatch):
+        """Test Parquet storage defaults to a Parquet directory rather than the CSV path."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.setenv("STORAGE_TYPE", "parquet")
+        monkeypatch.delenv("OUTPUT_PATH", raising=False)
+        
+        config = ConfigurationManager.load_config()
+        
+        assert config.storage_type == StorageType.PARQUET
+        assert config.output_path == "output/articles.parquet"
+    
+    def test_load_config_scraper_concurrency(self, monkeypatch):
+        """Test SCRAPER_CONCURRENCY is read from the environment."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.setenv("SCRAPER_CONCURRENCY", "4")
+        
+        config = ConfigurationManager.load_config()
+        
+        assert config.scraper_concurrency == 4
+    
+    def test_load_config_summarizer_concurrency(self, monkeypatch):
+        """Test SUMMARIZER_CONCURRENCY is read from the environment."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.setenv("SUMMARIZER_CONCURRENCY", "2")
+        
+        config = ConfigurationManager.load_config()
+        
+        assert config.summarizer_concurrency == 2
+    
+    def test_load_config_summarizer_batch_size(self, monkeypatch):
+        """Test SUMMARIZER_BATCH_SIZE is read from the environment."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.setenv("SUMMARIZER_BATCH_SIZE", "5")
+        
+        config = ConfigurationManager.load_config()
+        
+        assert config.summarizer_batch_size == 5
+    
+    def test_load_config_storage_batch_size(self, monkeypatch):
+        """Test STORAGE_BATCH_SIZE is read from the environment, defaulting to 50."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.delenv("STORAGE_BATCH_SIZE", raising=False)
+        
+        assert ConfigurationManager.load_config().storage_batch_size == 50
+        
+        monkeypatch.setenv("STORAGE_BATCH_SIZE", "10")
+        ConfigurationManager.clear_cache()
+        
+        assert ConfigurationManager.load_config().storage_batch_size == 10
+    
+    def test_load_config_scraper_preflight(self, monkeypatch):
+        """Test SCRAPER_PREFLIGHT is parsed as a boolean flag."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.setenv("SCRAPER_PREFLIGHT", "true")
+        
+        config = ConfigurationManager.load_config()
+        
+        assert config.scraper_preflight is True
+    
+    def test_load_config_classifier_prefilter(self, monkeypatch):
+        """Test CLASSIFIER_PREFILTER is parsed as a boolean flag."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.setenv("CLASSIFIER_PREFILTER", "true")
+        
+        config = ConfigurationManager.load_config()
+        
+        assert config.classifier_prefilter is True
+    
+    def test_load_config_news_api_rate_limit(self, monkeypatch):
+        """Test NEWS_API_RATE_LIMIT is parsed as a positive number and unset means unlimited."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.delenv("NEWS_API_RATE_LIMIT", raising=False)
+        
+        assert ConfigurationManager.load_config().news_api_rate_limit is None
+        
+        monkeypatch.setenv("NEWS_API_RATE_LIMIT", "0.5")
+        ConfigurationManager.clear_cache()
+        assert ConfigurationManager.load_config().news_api_rate_limit == 0.5
+        
+        monkeypatch.setenv("NEWS_API_RATE_LIMIT", "0")
+        ConfigurationManager.clear_cache()
+        with pytest.raises(ValueError, match="Invalid NEWS_API_RATE_LIMIT"):
+            ConfigurationManager.load_config()
+    
+    def test_load_config_cache_dir(self, monkeypatch):
+        """Test on-disk caching is off unless CACHE_DIR is set."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.delenv("CACHE_DIR", raising=False)
+        
+        assert ConfigurationManager.load_config().cache_dir is None
+        
+        monkeypatch.setenv("CACHE_DIR", "")
+        ConfigurationManager.clear_cache()
+        assert ConfigurationManager.load_config().cache_dir is None
+        
+        monkeypatch.setenv("CACHE_DIR", ".cache")
+        ConfigurationManager.clear_cache()
+        assert ConfigurationManager.load_config().cache_dir == ".cache"
+    
+    def test_load_config_invalid_scraper_concurrency(self, monkeypatch):
+        """Test configuration loading fails with a non-numeric SCRAPER_CONCURRENCY."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.setenv("SCRAPER_CONCURRENCY", "many")
+        
+        with pytest.raises(ValueError, match="Invalid SCRAPER_CONCURRENCY"):
+            ConfigurationManager.load_config()
+    
     def test_validate_api_keys_success(self, monkeypatch):
         """Test API key validation succeeds when keys are present."""
         monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
@@ -70,26 +189,65 @@ class TestConfigurationManager:
         
         assert ConfigurationManager.validate_api_keys() is False
     
+    def test_load_config_is_cached(self, monkeypatch):
+        """Test repeated loads reuse the cached config until clear_cache is called."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        monkeypatch.setenv("AI_API_KEY", "test_ai_key")
+        monkeypatch.setenv("AI_PROVIDER", "openai")
+        
+        config = ConfigurationManager.load_config()
+        monkeypatch.setenv("AI_PROVIDER", "claude")
+        
+        assert ConfigurationManager.load_config() is config
+        
+        ConfigurationManager.clear_cache()
+        
+        assert ConfigurationManager.load_config().ai_provider == "claude"
+    
     def test_test_sets_defined(self):
         """Test that all 4 test sets are defined."""
         assert len(ConfigurationManager.TEST_SETS) == 4
     
+    def test_test_sets_are_shared_and_immutable(self):
+        """Test test sets and their compiled matchers are built once and cannot be replaced."""
+        assert isinstance(ConfigurationManager.TEST_SETS, tuple)
+        assert ConfigurationManager.TEST_SETS[0].matcher is ConfigurationManager.TEST_SETS[0].matcher
+    
+    def test_test_set_is_frozen_and_hashable(self):
+        """Test TestSet stores entities as a tuple and can be used as a dict key."""
+        test_set = TestSet(name="Custom", entities=["Apple", "Google"])
+        
+        assert test_set.entities == ("Apple", "Google")
+        assert not hasattr(test_set, "__dict__")
+        assert {test_set: 1}[TestSet(name="Custom", entities=("Apple", "Google"))] == 1
+        assert test_set.matcher.match("google i/o") == ["Google"]
+        with pytest.raises(AttributeError):
+            test_set.entities = ("Meta",)
+    
+    def test_test_set_copy_and_pickle(self):
+        """Test TestSet survives copy and a pickle round trip with a working matcher."""
+        test_set = ConfigurationManager.TEST_SETS[0]
+        
+        for restored in (copy.copy(test_set), copy.deepcopy(test_set), pickle.loads(pickle.dumps(test_set))):
+            assert restored == test_set
+            assert restored.matcher.match("Infosys and Wipro") == ["Wipro", "Infosys"]
+    
     def test_test_set_1_entities(self):
         """Test Test Set 1 has correct entities."""
         test_set = ConfigurationManager.TEST_SETS[0]
-        assert test_set.entities == ["TCS", "Wipro", "Infosys", "HCLTech"]
+        assert test_set.entities == ("TCS", "Wipro", "Infosys", "HCLTech")
     
     def test_test_set_2_entities(self):
         """Test Test Set 2 has correct entities."""
         test_set = ConfigurationManager.TEST_SETS[1]
-        assert test_set.entities == ["Airtel", "Jio", "Vodafone Idea", "BSNL", "MTNL", "Tejas Networks"]
+        assert test_set.entities == ("Airtel", "Jio", "Vodafone Idea", "BSNL", "MTNL", "Tejas Networks")
     
     def test_test_set_3_entities(self):
         """Test Test Set 3 has correct entities."""
         test_set = ConfigurationManager.TEST_SETS[2]
-        assert test_set.entities == ["OpenAI", "Anthropic", "Google Deepmind", "Microsoft", "Meta"]
+        assert test_set.entities == ("OpenAI", "Anthropic", "Google Deepmind", "Microsoft", "Meta")
     
     def test_test_set_4_entities(self):
         """Test Test Set 4 has correct entities."""
         test_set = ConfigurationManager.TEST_SETS[3]
-        assert test_set.entities == ["Microsoft", "Google", "Apple", "Meta"]
+        assert test_set.entities == ("Microsoft", "Google", "Apple", "Meta")
@@ -0,0 +1,99 @@
+"""Unit tests for the DiskCache component."""
+import sqlite3
+import pytest
+from unittest.mock import patch
+from src.disk_cache import DiskCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a DiskCache in a temporary directory."""
+    disk_cache = DiskCache(str(tmp_path / "cache" / "test.db"))
+    yield disk_cache
+    disk_cache.close()
+
+
+class TestDiskCache:
+    """Test suite for DiskCache class."""
+    
+    def test_get_missing_key(self, cache):
+        """Test that a missing key returns None."""
+        assert cache.get("https://example.com/missing") is None
+    
+    def test_set_and_get(self, cache):
+        """Test that stored values are returned unchanged."""
+        cache.set("https://example.com/article", b"<html>body</html>")
+        
+        assert cache.get("https://example.com/article") == b"<html>body</html>"
+    
+    def test_set_replaces_existing_value(self, cache):
+        """Test that setting a key twice keeps the latest value."""
+        cache.set("key", b"first")
+        cache.set("key", b"second")
+        
+        assert cache.get("key") == b"second"
+    
+    def test_set_and_get_json(self, cache):
+        """Test that JSON values round-trip through the cache."""
+        cache.set_json("summary", {"text": "A summary", "word_count": 2})
+        
+        assert cache.get_json("summary") == {"text": "A summary", "word_count": 2}
+    
+    def test_get_json_ignores_invalid_entries(self, cache):
+        """Test that entries which are not valid JSON are treated as missing."""
+        cache.set("summary", b"plain text summary")
+        
+        assert cache.get_json("summary") is None
+    
+    def test_values_are_compressed(self, cache):
+        """Test that stored values are compressed on disk and restored on read."""
+        body = b"<p>Repetitive article text.</p>" * 200
+        cache.set("page", body)
+        
+        stored = cache._conn.execute("SELECT value FROM entries").fetchone()[0]
+        
+        assert len(stored) < len(body) / 5
+        assert cache.get("page") == body
+    
+    def test_reads_entries_from_uncompressed_cache(self, tmp_path):
+        """Test that a cache written before compression was added is still readable."""
+        path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value BLOB NOT NULL)")
+        conn.execute(
+            "INSERT INTO entries VALUES (?, ?, ?)",
+            (DiskCache._hash_key("key"), 1000.0, b"legacy value")
+        )
+        conn.commit()
+        conn.close()
+        
+        disk_cache = DiskCache(path)
+        
+        assert disk_cache.get("key") == b"legacy value"
+        disk_cache.close()
+    
+    def test_values_persist_across_instances(self, tmp_path):
+        """Test that values survive reopening the cache file."""
+        path = str(tmp_path / "persist.db")
+        first = DiskCache(path)
+        first.set("key", b"value")
+        first.close()
+        
+        second = DiskCache(path)
+        assert second.get("key") == b"value"
+        second.close()
+    
+    def test_expired_entry_is_ignored(self, tmp_path):
+        """Test that entries older than the TTL are treated as missing."""
+        disk_cache = DiskCache(str(tmp_path / "ttl.db"), ttl_seconds=60)
+        
+        with patch('src.disk_cache.time.time', return_value=1000.0):
+            disk_cache.set("key", b"value")
+        
+        with patch('src.disk_cache.time.time', return_value=1030.0):
+            assert disk_cache.get("key") == b"value"
+        
+        with patch('src.disk_cache.time.time', return_value=1061.0):
+            assert disk_cache.get("key") is None
+        
+        disk_cache.close()
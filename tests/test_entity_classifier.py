@@ -1,5 +1,6 @@
 """Unit tests for the EntityClassifier component."""
 import pytest
+from unittest.mock import patch
 from datetime import datetime
 from src.entity_classifier import EntityClassifier
 from src.config import TestSet
@@ -36,6 +37,10 @@ def sample_article():
 class TestEntityClassifier:
     """Test suite for EntityClassifier."""
     
+    def test_uses_test_set_matcher(self, classifier, test_set):
+        """Test the classifier reuses the matcher compiled for the test set."""
+        assert classifier.matcher is test_set.matcher
+    
     def test_single_entity_match(self, classifier, sample_article):
         """Test classification with a single entity match."""
         content = "Microsoft announced new features for Azure cloud platform."
@@ -100,6 +105,21 @@ class TestEntityClassifier:
         assert len(entities) == 1
         assert "Apple" in entities
     
+    def test_classify_folds_text_once(self, classifier, sample_article):
+        """Test the article text is case-folded once, not once per entity."""
+        class CountingStr(str):
+            folds = 0
+            
+            def casefold(self):
+                CountingStr.folds += 1
+                return str.casefold(self)
+        
+        content = CountingStr("MICROSOFT and Apple were mentioned, but not the others.")
+        entities = classifier.classify(sample_article, content)
+        
+        assert entities == ["Microsoft", "Apple"]
+        assert CountingStr.folds == 1
+    
     def test_should_include_with_match(self, classifier, sample_article):
         """Test should_include returns True when entities match."""
         content = "Meta announced changes to Facebook and Instagram."
@@ -114,6 +134,12 @@ class TestEntityClassifier:
         
         assert result is False
     
+    def test_should_include_stops_at_first_match(self, classifier, sample_article):
+        """Test should_include does not collect every matching entity."""
+        with patch.object(classifier.matcher, "match_folded") as mock_match:
+            assert classifier.should_include(sample_article, "Microsoft and Apple reported earnings.") is True
+        mock_match.assert_not_called()
+    
     def test_all_entities_match(self, classifier, sample_article):
         """Test classification when all entities are mentioned."""
         content = "Microsoft, Google, Apple, and Meta are the big four tech companies."
@@ -0,0 +1,94 @@
+"""Unit tests for the EntityMatcher component."""
+import pytest
+from unittest.mock import patch
+from src.entity_matcher import EntityMatcher
+
+
+class TestEntityMatcher:
+    """Tests for EntityMatcher."""
+    
+    def test_match_case_insensitive(self):
+        """Test entities are matched regardless of case."""
+        matcher = EntityMatcher(["Microsoft", "Google"])
+        
+        assert matcher.match("MICROSOFT and google announce a deal") == ["Microsoft", "Google"]
+    
+    def test_match_returns_test_set_order(self):
+        """Test matches are returned in test set order, not text order."""
+        matcher = EntityMatcher(["Airtel", "Jio", "BSNL"])
+        
+        assert matcher.match("BSNL trails Jio and Airtel") == ["Airtel", "Jio", "BSNL"]
+    
+    def test_match_substrings(self):
+        """Test entities match as substrings, including overlapping names."""
+        matcher = EntityMatcher(["Google", "Google Deepmind", "Meta"])
+        
+        assert matcher.match("Google Deepmind metadata") == ["Google", "Google Deepmind", "Meta"]
+    
+    def test_match_uses_unicode_case_folding(self):
+        """Test matching folds case beyond ASCII (sharp s folds to ss)."""
+        matcher = EntityMatcher(["Strauss"])
+        
+        assert matcher.match("Johann STRAUß concert") == ["Strauss"]
+    
+    def test_match_no_entities(self):
+        """Test text without any entity returns an empty list."""
+        matcher = EntityMatcher(["Apple"])
+        
+        assert matcher.match("Nothing relevant here") == []
+    
+    def test_match_folded_multiple_texts(self):
+        """Test match_folded searches each text and combines the matches."""
+        matcher = EntityMatcher(["Microsoft", "Google", "Apple"])
+        
+        assert matcher.match_folded("google earnings", "analysts expect apple to follow") == ["Google", "Apple"]
+    
+    def test_match_folded_does_not_span_texts(self):
+        """Test an entity split across two texts is not matched."""
+        matcher = EntityMatcher(["Goldman Sachs"])
+        
+        assert matcher.match_folded("shares of goldman", "sachs rose") == []
+    
+    def test_match_entities_differing_only_in_case(self):
+        """Test entities that fold to the same name are all reported."""
+        matcher = EntityMatcher(["Meta", "META", "Apple"])
+        
+        assert matcher.match("meta platforms") == ["Meta", "META"]
+    
+    def test_match_any_folded(self):
+        """Test match_any_folded reports whether any entity occurs in any text."""
+        matcher = EntityMatcher(["Microsoft", "Google"])
+        
+        assert matcher.match_any_folded("quiet day", "google shares rose") is True
+        assert matcher.match_any_folded("quiet day", "nothing relevant") is False
+        assert EntityMatcher([]).match_any_folded("anything") is False
+        assert EntityMatcher([""]).match_any_folded("anything") is True
+    
+    def test_fallback_without_ahocorasick_reports_overlapping_names(self):
+        """Test the substring fallback keeps overlapping matches that a regex alternation would lose."""
+        with patch("src.entity_matcher.ahocorasick", None):
+            matcher = EntityMatcher(["Google", "Google Deepmind", "Meta", "META"])
+        
+        assert matcher.automaton is None
+        assert matcher.match_folded("google deepmind", "meta platforms") == ["Google", "Google Deepmind", "Meta", "META"]
+        assert matcher.match_any_folded("deepmind", "platforms") is False
+    
+    def test_automaton_matches_fallback(self):
+        """Test the pyahocorasick automaton reports exactly what the substring fallback does."""
+        pytest.importorskip("ahocorasick")
+        entities = ["Google", "Google Deepmind", "Meta", "META", "Jio", "Strauss", ""]
+        texts = [
+            ("google deepmind", "meta platforms"),
+            ("reliance jio", "nothing else"),
+            ("johann strauss",),
+            ("no entity here",),
+        ]
+        
+        automaton_matcher = EntityMatcher(entities)
+        with patch("src.entity_matcher.ahocorasick", None):
+            fallback_matcher = EntityMatcher(entities)
+        
+        assert automaton_matcher.automaton is not None
+        for folded in texts:
+            assert automaton_matcher.match_folded(*folded) == fallback_matcher.match_folded(*folded)
+            assert automaton_matcher.match_any_folded(*folded) == fallback_matcher.match_any_folded(*folded)
@@ -122,3 +122,29 @@ class TestMain:
             
             # Verify orchestrator was run
             mock_orchestrator_instance.run.assert_called_once()
+            
+            # Verify every component holding resources was closed
+            for mock_component in (mock_collector, mock_scraper, mock_summarizer, mock_storage):
+                mock_component.return_value.close.assert_called_once()
+    
+    def test_main_closes_components_when_database_url_missing(self, monkeypatch):
+        """Test components opened before storage setup fails are still closed."""
+        monkeypatch.setenv('NEWS_API_KEY', 'test_news_key')
+        monkeypatch.setenv('AI_API_KEY', 'test_ai_key')
+        monkeypatch.setenv('STORAGE_TYPE', 'database')
+        monkeypatch.delenv('DATABASE_URL', raising=False)
+        
+        with patch('main.load_dotenv'), \
+             patch('main.NewsCollector') as mock_collector, \
+             patch('main.EntityClassifier'), \
+             patch('main.ArticleScraper') as mock_scraper, \
+             patch('main.AISummarizer') as mock_summarizer, \
+             patch('main.DatabaseStorage') as mock_storage, \
+             patch('sys.argv', ['main.py', '--test-set', '1']):
+            
+            assert main() == 1
+            
+            mock_storage.assert_not_called()
+            mock_collector.return_value.close.assert_called_once()
+            mock_scraper.return_value.close.assert_called_once()
+            mock_summarizer.return_value.close.assert_called_once()
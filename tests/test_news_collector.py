@@ -1,8 +1,23 @@
 """Unit tests for NewsCollector component."""
+import copy
+import json
+import pickle
+import time
 import pytest
-from datetime import datetime, timedelta
+import requests
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
-from src.news_collector import NewsCollector, RawArticle
+from src.news_collector import NewsCollector, RawArticle, MAX_PAGES, RETRY_BACKOFF_JITTER, RETRY_BACKOFF_MAX
+
+
+def make_response(data):
+    """Build a mock successful HTTP response with the given JSON body."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.content = json.dumps(data).encode("utf-8")
+    mock_response.json.return_value = data
+    return mock_response
 
 
 class TestNewsCollector:
@@ -20,6 +35,40 @@ class TestNewsCollector:
         query = collector._build_query(["Microsoft", "Google", "Apple"])
         assert query == '"Microsoft" OR "Google" OR "Apple"'
     
+    def test_build_query_no_entities(self):
+        """Test query construction with no entities yields an empty query."""
+        collector = NewsCollector(api_key="test_key")
+        assert collector._build_query([]) == ""
+    
+    def test_raw_article_is_immutable_and_hashable(self):
+        """Test RawArticle is a frozen, slotted value that can be used in sets."""
+        article = RawArticle(
+            title="Test Article",
+            url="https://example.com/article",
+            published_date=None,
+            source="Test Source",
+            snippet=None
+        )
+        
+        assert not hasattr(article, "__dict__")
+        assert len({article, RawArticle(**{f: getattr(article, f) for f in RawArticle.__slots__})}) == 1
+        with pytest.raises(AttributeError):
+            article.title = "Changed"
+    
+    def test_raw_article_copy_and_pickle(self):
+        """Test RawArticle survives copy and a pickle round trip."""
+        article = RawArticle(
+            title="Test Article",
+            url="https://example.com/article",
+            published_date=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+            source="Test Source",
+            snippet="Snippet"
+        )
+        
+        assert copy.copy(article) == article
+        assert copy.deepcopy(article) == article
+        assert pickle.loads(pickle.dumps(article)) == article
+    
     def test_parse_response_valid_articles(self):
         """Test parsing valid API response."""
         collector = NewsCollector(api_key="test_key")
@@ -83,6 +132,44 @@ class TestNewsCollector:
         assert len(articles) == 1
         assert articles[0].title == "Valid Article"
     
+    def test_parse_response_malformed_entries(self):
+        """Test malformed entries are skipped without losing the rest of the page."""
+        collector = NewsCollector(api_key="test_key")
+        
+        response = {
+            "status": "ok",
+            "articles": [
+                None,
+                {
+                    "title": "Article without source",
+                    "url": "https://example.com/no-source",
+                    "source": None
+                }
+            ]
+        }
+        
+        articles = collector._parse_response(response)
+        
+        assert len(articles) == 1
+        assert articles[0].source == "Unknown"
+        assert articles[0].published_date is None
+    
+    def test_parse_response_malformed_source_keeps_other_articles(self):
+        """Test an article whose source is not an object is skipped, not the whole page."""
+        collector = NewsCollector(api_key="test_key")
+        
+        response = {
+            "status": "ok",
+            "articles": [
+                {"title": "Bad source", "url": "https://example.com/bad", "source": "CNN"},
+                {"title": "Good", "url": "https://example.com/good", "source": {"name": "Reuters"}}
+            ]
+        }
+        
+        articles = collector._parse_response(response)
+        
+        assert [(a.url, a.source) for a in articles] == [("https://example.com/good", "Reuters")]
+    
     def test_parse_response_invalid_date(self):
         """Test parsing response with invalid date format."""
         collector = NewsCollector(api_key="test_key")
@@ -104,14 +191,49 @@ class TestNewsCollector:
         assert len(articles) == 1
         assert articles[0].published_date is None  # Should handle gracefully
     
-    @patch('src.news_collector.requests.get')
+    def test_parse_response_dates_parsed_per_article(self):
+        """Test each article keeps its own date when valid, invalid and missing dates share a page."""
+        collector = NewsCollector(api_key="test_key")
+        
+        response = {
+            "status": "ok",
+            "articles": [
+                {"title": "A", "url": "https://example.com/a", "publishedAt": "2024-01-15T10:30:00Z"},
+                {"title": "B", "url": "https://example.com/b", "publishedAt": "invalid-date-format"},
+                {"title": "C", "url": "https://example.com/c"},
+                {"title": "D", "url": "https://example.com/d", "publishedAt": "2024-01-16T08:00:00Z"}
+            ]
+        }
+        
+        articles = collector._parse_response(response)
+        
+        assert [a.published_date for a in articles] == [
+            datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+            None,
+            None,
+            datetime(2024, 1, 16, 8, 0, tzinfo=timezone.utc)
+        ]
+    
+    def test_parse_date_uses_ciso8601_when_installed(self):
+        """Test publication dates go through ciso8601 when it is available."""
+        collector = NewsCollector(api_key="test_key")
+        parsed = datetime(2024, 1, 15, 10, 30)
+        
+        with patch('src.news_collector.ciso8601') as mock_ciso8601:
+            mock_ciso8601.parse_datetime.return_value = parsed
+            assert collector._parse_date("2024-01-15T10:30:00Z") is parsed
+        mock_ciso8601.parse_datetime.assert_called_once_with("2024-01-15T10:30:00Z")
+        
+        with patch('src.news_collector.ciso8601', None):
+            assert collector._parse_date("2024-01-15T10:30:00Z") == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+            assert collector._parse_date("not-a-date") is None
+    
+    @patch('src.news_collector.requests.Session.get')
     def test_fetch_news_success(self, mock_get):
         """Test successful news fetching."""
         collector = NewsCollector(api_key="test_key")
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = make_response({
             "status": "ok",
             "articles": [
                 {
@@ -122,7 +244,7 @@ class TestNewsCollector:
                     "description": "Test description"
                 }
             ]
-        }
+        })
         mock_get.return_value = mock_response
         
         articles = collector.fetch_news(["Microsoft", "Google"])
@@ -131,24 +253,51 @@ class TestNewsCollector:
         assert articles[0].title == "Test Article"
         assert mock_get.called
     
-    @patch('src.news_collector.requests.get')
+    @patch('src.news_collector.requests.Session.get')
+    def test_fetch_news_parses_raw_body(self, mock_get):
+        """Test the page body is parsed straight from the response bytes when orjson is installed."""
+        pytest.importorskip("orjson")
+        collector = NewsCollector(api_key="test_key")
+        
+        mock_response = make_response({
+            "status": "ok",
+            "articles": [{"title": "Test Article", "url": "https://example.com/article"}]
+        })
+        mock_get.return_value = mock_response
+        
+        articles = collector.fetch_news(["Microsoft"])
+        
+        assert [a.url for a in articles] == ["https://example.com/article"]
+        mock_response.json.assert_not_called()
+    
+    @patch('src.news_collector.requests.Session.get')
     def test_fetch_news_api_error(self, mock_get):
         """Test handling of API error response."""
         collector = NewsCollector(api_key="test_key")
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = make_response({
             "status": "error",
             "message": "API key invalid"
-        }
+        })
         mock_get.return_value = mock_response
         
         articles = collector.fetch_news(["Microsoft"])
         
         assert len(articles) == 0
     
-    @patch('src.news_collector.requests.get')
+    @patch('src.news_collector.requests.Session.get')
+    def test_fetch_news_invalid_json(self, mock_get):
+        """Test a response body that is not valid JSON yields no articles."""
+        collector = NewsCollector(api_key="test_key")
+        
+        mock_response = make_response({})
+        mock_response.content = b"<html>Service unavailable</html>"
+        mock_response.json.side_effect = ValueError("Expecting value")
+        mock_get.return_value = mock_response
+        
+        assert collector.fetch_news(["Microsoft"]) == []
+    
+    @patch('src.news_collector.requests.Session.get')
     def test_fetch_news_network_error(self, mock_get):
         """Test handling of network errors."""
         collector = NewsCollector(api_key="test_key", max_retries=2)
@@ -159,45 +308,148 @@ class TestNewsCollector:
         
         assert len(articles) == 0
     
-    @patch('src.news_collector.requests.get')
-    @patch('src.news_collector.time.sleep')
-    def test_fetch_news_rate_limit_retry(self, mock_sleep, mock_get):
-        """Test exponential backoff on rate limit errors."""
+    def test_session_adapter_does_not_retry(self):
+        """Test the HTTP adapter leaves every retry to the collector."""
         collector = NewsCollector(api_key="test_key", max_retries=3)
+        retry = collector.session.get_adapter(collector.base_url).max_retries
         
-        # First two calls return 429, third succeeds
-        mock_response_429 = Mock()
-        mock_response_429.status_code = 429
+        assert retry.total == 0
+    
+    def test_retries_rate_limit_and_server_errors(self):
+        """Test 429 and 5xx responses are retried up to max_retries attempts in all."""
+        collector = NewsCollector(api_key="test_key", max_retries=3)
+        server_error = make_response({})
+        server_error.status_code = 503
+        ok = make_response({"status": "ok", "articles": [{"title": "A", "url": "https://example.com/a"}]})
         
-        mock_response_success = Mock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {
-            "status": "ok",
-            "articles": [
-                {
-                    "title": "Test Article",
-                    "url": "https://example.com/article",
-                    "source": {"name": "Test Source"}
-                }
-            ]
-        }
+        with patch.object(collector.session, "get", side_effect=[server_error, server_error, ok]) as mock_get, \
+                patch.object(collector, "_retry_delay", return_value=0):
+            articles = collector.fetch_news(["Microsoft"])
         
-        mock_get.side_effect = [mock_response_429, mock_response_429, mock_response_success]
+        assert [a.url for a in articles] == ["https://example.com/a"]
+        assert mock_get.call_count == 3
+    
+    def test_retries_timeouts(self):
+        """Test timeouts are retried and give up after max_retries attempts."""
+        collector = NewsCollector(api_key="test_key", max_retries=2)
         
-        articles = collector.fetch_news(["Microsoft"])
+        with patch.object(collector.session, "get", side_effect=requests.exceptions.Timeout("slow")) as mock_get, \
+                patch.object(collector, "_retry_delay", return_value=0):
+            assert collector.fetch_news(["Microsoft"]) == []
         
-        assert len(articles) == 1
-        assert mock_sleep.call_count == 2  # Should sleep twice before success
+        assert mock_get.call_count == 2
+    
+    def test_retries_take_a_token_per_attempt(self):
+        """Test every retry waits for its own token, so retries respect the rate limit."""
+        collector = NewsCollector(api_key="test_key", rate_limit=100, max_retries=3)
+        rate_limited = make_response({})
+        rate_limited.status_code = 429
+        
+        with patch.object(collector.session, "get", return_value=rate_limited) as mock_get, \
+                patch.object(collector._bucket, "acquire") as mock_acquire, \
+                patch.object(collector, "_retry_delay", return_value=0):
+            collector.fetch_news(["Microsoft"])
+        
+        assert mock_get.call_count == 3
+        assert mock_acquire.call_count == 3
+    
+    def test_retry_honours_retry_after(self):
+        """Test a Retry-After header, in seconds or as an HTTP date, sets the delay."""
+        collector = NewsCollector(api_key="test_key")
+        
+        assert collector._retry_delay(1, "7") == 7
+        assert collector._retry_delay(1, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        # An unparseable header falls back to the usual backoff
+        assert 1 <= collector._retry_delay(1, "soon") <= 1 + RETRY_BACKOFF_JITTER
+    
+    def test_retry_backoff_is_capped_and_jittered(self):
+        """Test retry delays never exceed the cap and are spread out by jitter."""
+        collector = NewsCollector(api_key="test_key", max_retries=10)
+        
+        delays = {collector._retry_delay(attempt) for attempt in range(1, 10)}
+        assert all(0 < delay <= RETRY_BACKOFF_MAX for delay in delays)
+        assert max(delays) == RETRY_BACKOFF_MAX
+        
+        base = 2 ** 2
+        jittered = {collector._retry_delay(3) for _ in range(20)}
+        assert all(base <= delay <= base + RETRY_BACKOFF_JITTER for delay in jittered)
+        assert len(jittered) > 1
+    
+    def test_fetch_news_reuses_session(self):
+        """Test that every request goes through the collector's keep-alive session."""
+        collector = NewsCollector(api_key="test_key")
+        
+        with patch.object(collector.session, "get", return_value=make_response({"status": "ok", "articles": []})) as mock_get:
+            collector.fetch_news(["Microsoft"])
+            collector.fetch_news(["Google"])
+        
+        assert mock_get.call_count == 2
+        assert collector.session.get_adapter(collector.base_url)._pool_maxsize >= MAX_PAGES
+    
+    def test_close_closes_session(self):
+        """Test close releases the pooled connections."""
+        collector = NewsCollector(api_key="test_key")
+        
+        with patch.object(collector.session, "close") as mock_close:
+            collector.close()
+        
+        mock_close.assert_called_once()
+    
+    def test_rate_limit_spaces_requests(self):
+        """Test back-to-back requests wait on the token bucket once the burst is spent."""
+        collector = NewsCollector(api_key="test_key", rate_limit=20)
+        
+        with patch.object(collector.session, "get", return_value=make_response({"status": "ok", "articles": []})) as mock_get:
+            start = time.monotonic()
+            for _ in range(MAX_PAGES + 2):
+                collector.fetch_news(["Microsoft"])
+            elapsed = time.monotonic() - start
+        
+        assert mock_get.call_count == MAX_PAGES + 2
+        # The bucket starts with MAX_PAGES tokens, so two requests wait 1/20s each
+        assert elapsed >= 0.09
+    
+    def test_rate_limit_backs_off_on_429(self):
+        """Test the request rate is halved on a 429 and recovers after successful requests."""
+        collector = NewsCollector(api_key="test_key", rate_limit=8, max_retries=1)
+        rate_limited = make_response({})
+        rate_limited.status_code = 429
+        
+        with patch.object(collector.session, "get", return_value=rate_limited):
+            collector.fetch_news(["Microsoft"])
+        assert collector._bucket.rate == 4
+        
+        with patch.object(collector.session, "get", return_value=make_response({"status": "ok", "articles": []})):
+            collector.fetch_news(["Microsoft"])
+        assert collector._bucket.rate == pytest.approx(4.8)
+    
+    def test_no_rate_limit_by_default(self):
+        """Test requests are not throttled unless a rate limit is configured."""
+        assert NewsCollector(api_key="test_key")._bucket is None
     
-    @patch('src.news_collector.requests.get')
+    @patch('src.news_collector.requests.Session.get')
+    def test_fetch_news_rate_limit_exhausted(self, mock_get):
+        """Test a rate limit response that survives every retry returns no articles."""
+        collector = NewsCollector(api_key="test_key")
+        
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+        
+        with patch.object(collector, "_retry_delay", return_value=0):
+            articles = collector.fetch_news(["Microsoft"])
+        
+        assert articles == []
+        assert mock_get.call_count == 3
+    
+    @patch('src.news_collector.requests.Session.get')
     def test_fetch_news_pagination(self, mock_get):
         """Test pagination handling."""
         collector = NewsCollector(api_key="test_key")
         
         # First page with 100 articles
-        mock_response_page1 = Mock()
-        mock_response_page1.status_code = 200
-        mock_response_page1.json.return_value = {
+        mock_response_page1 = make_response({
             "status": "ok",
             "articles": [
                 {
@@ -207,12 +459,10 @@ class TestNewsCollector:
                 }
                 for i in range(100)
             ]
-        }
+        })
         
         # Second page with 50 articles (less than pageSize, so stop)
-        mock_response_page2 = Mock()
-        mock_response_page2.status_code = 200
-        mock_response_page2.json.return_value = {
+        mock_response_page2 = make_response({
             "status": "ok",
             "articles": [
                 {
@@ -222,11 +472,123 @@ class TestNewsCollector:
                 }
                 for i in range(100, 150)
             ]
-        }
+        })
         
-        mock_get.side_effect = [mock_response_page1, mock_response_page2]
+        # Third page is empty
+        mock_response_page3 = make_response({"status": "ok", "articles": []})
+        
+        responses = {1: mock_response_page1, 2: mock_response_page2, 3: mock_response_page3}
+        mock_get.side_effect = lambda url, params, timeout: responses[params["page"]]
         
         articles = collector.fetch_news(["Microsoft"])
         
         assert len(articles) == 150
+        assert [a.url for a in articles] == [f"https://example.com/article{i}" for i in range(150)]
+        assert mock_get.call_count == 3
+    
+    @patch('src.news_collector.requests.Session.get')
+    def test_fetch_news_stops_at_reported_total(self, mock_get):
+        """Test that pages beyond the API's totalResults are not requested."""
+        collector = NewsCollector(api_key="test_key")
+        
+        def page(params):
+            start = (params["page"] - 1) * 100
+            return make_response({
+                "status": "ok",
+                "totalResults": 200,
+                "articles": [
+                    {
+                        "title": f"Article {i}",
+                        "url": f"https://example.com/article{i}",
+                        "source": {"name": "Test Source"}
+                    }
+                    for i in range(start, min(start + 100, 200))
+                ]
+            })
+        
+        mock_get.side_effect = lambda url, params, timeout: page(params)
+        
+        articles = collector.fetch_news(["Microsoft"])
+        
+        assert len(articles) == 200
+        assert sorted(c.kwargs["params"]["page"] for c in mock_get.call_args_list) == [1, 2]
+    
+    @patch('src.news_collector.requests.Session.get')
+    def test_fetch_news_cache_hit(self, mock_get, tmp_path):
+        """Test an identical query is answered from the response cache."""
+        mock_get.return_value = make_response({
+            "status": "ok",
+            "totalResults": 1,
+            "articles": [{"title": "Test Article", "url": "https://example.com/article"}]
+        })
+        
+        collector = NewsCollector(api_key="test_key", cache_dir=str(tmp_path))
+        first = collector.fetch_news(["Microsoft"])
+        second = NewsCollector(api_key="other_key", cache_dir=str(tmp_path)).fetch_news(["Microsoft"])
+        
+        assert first == second
+        assert [a.url for a in second] == ["https://example.com/article"]
+        assert mock_get.call_count == 1
+        
+        collector.fetch_news(["Google"])
+        assert mock_get.call_count == 2
+    
+    @patch('src.news_collector.requests.Session.get')
+    def test_fetch_news_does_not_cache_errors(self, mock_get, tmp_path):
+        """Test failed pages are requested again on the next call."""
+        mock_get.return_value = make_response({"status": "error", "message": "API key invalid"})
+        collector = NewsCollector(api_key="test_key", cache_dir=str(tmp_path))
+        
+        collector.fetch_news(["Microsoft"])
+        collector.fetch_news(["Microsoft"])
+        
+        assert mock_get.call_count == 2
+    
+    @patch('src.news_collector.requests.Session.get')
+    def test_fetch_news_does_not_cache_unparseable_pages(self, mock_get, tmp_path):
+        """Test a page that fails to parse is neither cached nor raised from fetch_news."""
+        mock_get.return_value = make_response({"status": "ok", "articles": 5})
+        collector = NewsCollector(api_key="test_key", cache_dir=str(tmp_path))
+        
+        assert collector.fetch_news(["Microsoft"]) == []
+        assert collector.fetch_news(["Microsoft"]) == []
         assert mock_get.call_count == 2
+    
+    @patch('src.news_collector.requests.Session.get')
+    def test_fetch_news_cache_hit_parse_error(self, mock_get, tmp_path):
+        """Test an error parsing a cached page is handled like any other fetch error."""
+        mock_get.return_value = make_response({
+            "status": "ok",
+            "totalResults": 1,
+            "articles": [{"title": "Test Article", "url": "https://example.com/article"}]
+        })
+        collector = NewsCollector(api_key="test_key", cache_dir=str(tmp_path))
+        collector.fetch_news(["Microsoft"])
+        
+        with patch.object(collector, '_parse_page', side_effect=AttributeError("bad page")):
+            assert collector.fetch_news(["Microsoft"]) == []
+        assert mock_get.call_count == 1
+    
+    @patch('src.news_collector.requests.Session.get')
+    def test_fetch_news_single_page(self, mock_get):
+        """Test that further pages are not requested when the first page is not full."""
+        collector = NewsCollector(api_key="test_key")
+        
+        mock_response = make_response({
+            "status": "ok",
+            "articles": [
+                {
+                    "title": f"Article {i}",
+                    "url": f"https://example.com/article{i}",
+                    "source": {"name": "Test Source"}
+                }
+                for i in range(20)
+            ]
+        })
+        mock_get.return_value = mock_response
+        
+        articles = collector.fetch_news(["Microsoft"])
+        
+        assert len(articles) == 20
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["params"]["page"] == 1
@@ -1,15 +1,50 @@
 """Unit tests for the PipelineOrchestrator component."""
+import dataclasses
+import gc
+import threading
+import time
+import weakref
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, MagicMock
+from typing import Tuple
+from unittest.mock import Mock, MagicMock, patch
 from src.pipeline_orchestrator import PipelineOrchestrator, PipelineResult, PipelineError
 from src.config import Config, TestSet, StorageType
+from src.entity_classifier import EntityClassifier
 from src.news_collector import RawArticle
 from src.article_scraper import ScrapedContent
 from src.ai_summarizer import Summary
 from src.storage_layer import ProcessedArticle
 
 
+class InFlight:
+    """Context manager that records the most calls ever inside it at once.
+    
+    Each call waits (up to a timeout) for a second call to arrive, so calls
+    that can overlap always do and the peak does not depend on timing.
+    """
+    
+    def __init__(self, timeout: float = 5):
+        self.timeout = timeout
+        self.current = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.overlapped = threading.Event()
+    
+    def __enter__(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+            if self.current > 1:
+                self.overlapped.set()
+        self.overlapped.wait(self.timeout)
+        return self
+    
+    def __exit__(self, *exc_info):
+        with self.lock:
+            self.current -= 1
+
+
 @pytest.fixture
 def test_set():
     """Create a test set for testing."""
@@ -40,6 +75,12 @@ def mock_components():
     summarizer = Mock()
     storage = Mock()
     
+    # Nothing is stored yet unless a test says otherwise
+    storage.stored_urls.return_value = set()
+    
+    # Batch writes go through save_article, as with StorageLayer's default
+    storage.save_articles.side_effect = lambda articles: [storage.save_article(article) for article in articles]
+    
     return {
         "collector": collector,
         "classifier": classifier,
@@ -71,6 +112,22 @@ def test_pipeline_orchestrator_initialization(config, test_set, mock_components)
     assert orchestrator.errors == []
 
 
+def test_pipeline_records_are_slotted():
+    """Test per-article error records and the run result carry no per-instance __dict__."""
+    error = PipelineError(stage="scraping", article_url="https://example.com", error_message="HTTP error 404", timestamp=datetime.now())
+    result = PipelineResult(
+        total_collected=1,
+        total_classified=0,
+        total_scraped=0,
+        total_summarized=0,
+        total_stored=0,
+        errors=[error]
+    )
+    
+    assert not hasattr(error, "__dict__")
+    assert not hasattr(result, "__dict__")
+
+
 def test_pipeline_run_with_no_articles(config, test_set, mock_components):
     """Test pipeline execution when no articles are collected."""
     mock_components["collector"].fetch_news.return_value = []
@@ -91,37 +148,164 @@ def test_pipeline_run_with_no_articles(config, test_set, mock_components):
     assert len(result.errors) == 0
 
 
-def test_pipeline_run_with_successful_article(config, test_set, mock_components):
-    """Test pipeline execution with a successful article processing."""
-    # Setup mock data
-    raw_article = RawArticle(
-        title="Microsoft announces new AI features",
-        url="https://example.com/article1",
-        published_date=datetime.now(),
-        source="Test Source",
-        snippet="Microsoft unveils new AI capabilities"
+@dataclasses.dataclass(frozen=True)
+class ArticleOutcome:
+    """How each pipeline stage treats one article in a scenario."""
+    scraped: bool = True
+    entities: Tuple[str, ...] = ("Microsoft",)
+    summarized: bool = True
+    stored: bool = True
+
+
+# Scenario table: per-article outcomes, expected
+# (scraped, classified, summarized, stored) totals and expected error stages
+PIPELINE_SCENARIOS = [
+    pytest.param([ArticleOutcome()], (1, 1, 1, 1), [], id="successful_article"),
+    # No matching entities is expected behaviour, not an error
+    pytest.param([ArticleOutcome(entities=())], (1, 0, 0, 0), [], id="no_entities"),
+    pytest.param(
+        [ArticleOutcome(scraped=False), ArticleOutcome(entities=("Google",))],
+        (1, 1, 1, 1), ["scraping"], id="continues_on_scraping_failure"
+    ),
+    pytest.param([ArticleOutcome(summarized=False)], (1, 1, 0, 0), ["summarization"], id="summarization_failure"),
+    pytest.param([ArticleOutcome(stored=False)], (1, 1, 1, 0), ["storage"], id="storage_failure"),
+    pytest.param([ArticleOutcome(entities=("Microsoft", "Google"))] * 5, (5, 5, 5, 5), [], id="multiple_articles"),
+]
+
+
+@pytest.mark.parametrize("outcomes, expected_totals, expected_error_stages", PIPELINE_SCENARIOS)
+def test_pipeline_scenarios(config, test_set, mock_components, outcomes, expected_totals, expected_error_stages):
+    """Test pipeline statistics and errors for mixes of per-stage successes and failures."""
+    articles = [
+        RawArticle(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=f"Content {i}"
+        )
+        for i in range(len(outcomes))
+    ]
+    # Outcomes are looked up by URL or text, so they don't depend on call order
+    by_url = {article.url: outcome for article, outcome in zip(articles, outcomes)}
+    
+    def scrape(url):
+        ok = by_url[url].scraped
+        return ScrapedContent(
+            full_text=url if ok else "",
+            published_date=datetime.now(),
+            scrape_timestamp=datetime.now(),
+            success=ok,
+            error_message=None if ok else "HTTP error 404"
+        )
+    
+    def summarize(content):
+        ok = by_url[content].summarized
+        return Summary(
+            text="Test summary." if ok else "",
+            word_count=35 if ok else 0,
+            success=ok,
+            error_message=None if ok else "AI API rate limit exceeded"
+        )
+    
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["scraper"].scrape.side_effect = scrape
+    mock_components["classifier"].classify.side_effect = lambda article, content: list(by_url[article.url].entities)
+    mock_components["summarizer"].summarize.side_effect = summarize
+    mock_components["storage"].save_article.side_effect = lambda article: by_url[article.url].stored
+    
+    orchestrator = PipelineOrchestrator(
+        config=config,
+        test_set=test_set,
+        **mock_components
     )
     
-    scraped_content = ScrapedContent(
-        full_text="Microsoft has announced new AI features for its products...",
-        published_date=datetime.now(),
-        scrape_timestamp=datetime.now(),
-        success=True,
-        error_message=None
+    result = orchestrator.run()
+    
+    assert result.total_collected == len(articles)
+    assert (result.total_scraped, result.total_classified, result.total_summarized, result.total_stored) == expected_totals
+    assert [error.stage for error in result.errors] == expected_error_stages
+
+
+def test_pipeline_stores_articles_in_collection_order(config, test_set, mock_components):
+    """Test that articles are stored in collection order even when scraping finishes out of order."""
+    articles = [
+        RawArticle(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=f"Content {i}"
+        )
+        for i in range(4)
+    ]
+    
+    def scrape(url):
+        # Earlier articles take longer to scrape
+        time.sleep(0.02 * (4 - int(url[-1])))
+        return ScrapedContent(
+            full_text=f"Microsoft content for {url}",
+            published_date=datetime.now(),
+            scrape_timestamp=datetime.now(),
+            success=True,
+            error_message=None
+        )
+    
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["scraper"].scrape.side_effect = scrape
+    mock_components["classifier"].classify.return_value = ["Microsoft"]
+    mock_components["summarizer"].summarize.return_value = Summary(
+        text="Test summary.", word_count=35, success=True, error_message=None
     )
+    mock_components["storage"].save_article.return_value = True
     
-    summary = Summary(
-        text="Microsoft announces new AI features for its products.",
-        word_count=35,
-        success=True,
-        error_message=None
+    orchestrator = PipelineOrchestrator(
+        config=config,
+        test_set=test_set,
+        **mock_components
     )
     
-    # Configure mocks
-    mock_components["collector"].fetch_news.return_value = [raw_article]
-    mock_components["scraper"].scrape.return_value = scraped_content
+    result = orchestrator.run()
+    
+    stored_urls = [c.args[0].url for c in mock_components["storage"].save_article.call_args_list]
+    assert stored_urls == [article.url for article in articles]
+    assert result.total_stored == 4
+
+
+def test_pipeline_overlaps_network_bound_stages(config, test_set, mock_components):
+    """Test that slow scrape and summarize calls for different articles run concurrently."""
+    articles = [
+        RawArticle(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=f"Content {i}"
+        )
+        for i in range(8)
+    ]
+    
+    scraping = InFlight()
+    summarizing = InFlight()
+    
+    def scrape(url):
+        with scraping:
+            return ScrapedContent(
+                full_text="Microsoft content",
+                published_date=datetime.now(),
+                scrape_timestamp=datetime.now(),
+                success=True,
+                error_message=None
+            )
+    
+    def summarize(content):
+        with summarizing:
+            return Summary(text="Test summary.", word_count=35, success=True, error_message=None)
+    
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["scraper"].scrape.side_effect = scrape
     mock_components["classifier"].classify.return_value = ["Microsoft"]
-    mock_components["summarizer"].summarize.return_value = summary
+    mock_components["summarizer"].summarize.side_effect = summarize
     mock_components["storage"].save_article.return_value = True
     
     orchestrator = PipelineOrchestrator(
@@ -132,36 +316,45 @@ def test_pipeline_run_with_successful_article(config, test_set, mock_components)
     
     result = orchestrator.run()
     
-    assert result.total_collected == 1
-    assert result.total_scraped == 1
-    assert result.total_classified == 1
-    assert result.total_summarized == 1
-    assert result.total_stored == 1
-    assert len(result.errors) == 0
+    assert result.total_stored == 8
+    assert scraping.peak > 1
+    assert summarizing.peak > 1
 
 
-def test_pipeline_skips_article_with_no_entities(config, test_set, mock_components):
-    """Test that pipeline skips articles with no matching entities."""
-    raw_article = RawArticle(
-        title="Unrelated news article",
-        url="https://example.com/article1",
-        published_date=datetime.now(),
-        source="Test Source",
-        snippet="Some unrelated content"
-    )
+def test_pipeline_counts_are_exact_under_concurrency(config, test_set, mock_components):
+    """Test that statistics and errors add up when articles finish out of order."""
+    articles = [
+        RawArticle(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=None
+        )
+        for i in range(24)
+    ]
     
-    scraped_content = ScrapedContent(
-        full_text="This article doesn't mention any of our entities...",
-        published_date=datetime.now(),
-        scrape_timestamp=datetime.now(),
-        success=True,
-        error_message=None
-    )
+    def scrape(url):
+        index = int(url.rsplit("article", 1)[1])
+        # Later articles finish first
+        time.sleep(0.001 * (24 - index))
+        return ScrapedContent(
+            full_text=f"Microsoft {index}",
+            published_date=datetime.now(),
+            scrape_timestamp=datetime.now(),
+            success=index % 3 != 0,
+            error_message=None if index % 3 else "Scrape failed"
+        )
     
-    # Configure mocks
-    mock_components["collector"].fetch_news.return_value = [raw_article]
-    mock_components["scraper"].scrape.return_value = scraped_content
-    mock_components["classifier"].classify.return_value = []  # No entities
+    def summarize(content):
+        index = int(content.split()[1])
+        return Summary(text="Test summary.", word_count=35, success=index % 4 != 1, error_message=None)
+    
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["scraper"].scrape.side_effect = scrape
+    mock_components["classifier"].classify.return_value = ["Microsoft"]
+    mock_components["summarizer"].summarize.side_effect = summarize
+    mock_components["storage"].save_article.return_value = True
     
     orchestrator = PipelineOrchestrator(
         config=config,
@@ -171,60 +364,199 @@ def test_pipeline_skips_article_with_no_entities(config, test_set, mock_componen
     
     result = orchestrator.run()
     
-    assert result.total_collected == 1
-    assert result.total_scraped == 1
-    assert result.total_classified == 0  # Not classified
-    assert result.total_summarized == 0  # Not summarized
-    assert result.total_stored == 0  # Not stored
-    assert len(result.errors) == 0  # No entities is not an error
+    scraped = [i for i in range(24) if i % 3 != 0]
+    summarized = [i for i in scraped if i % 4 != 1]
+    assert result.total_scraped == len(scraped)
+    assert result.total_classified == len(scraped)
+    assert result.total_summarized == len(summarized)
+    assert result.total_stored == len(summarized)
+    assert sorted(e.stage for e in result.errors) == ["scraping"] * 8 + ["summarization"] * (len(scraped) - len(summarized))
 
 
-def test_pipeline_continues_on_scraping_failure(config, test_set, mock_components):
-    """Test that pipeline continues processing when scraping fails."""
-    raw_article1 = RawArticle(
-        title="Article 1",
-        url="https://example.com/article1",
-        published_date=datetime.now(),
-        source="Test Source",
-        snippet="Content 1"
+def test_pipeline_releases_full_text_before_storing(config, test_set, mock_components):
+    """Test scraped text is released once summarized, even while the store queue is full."""
+    class Text(str):
+        """str subclass that supports weak references."""
+    
+    # Stubs rather than Mocks, which would keep references to their arguments
+    class Classifier:
+        def classify(self, article, content):
+            return ["Microsoft"]
+    
+    class Summarizer:
+        def summarize(self, content):
+            return Summary(text="Test summary.", word_count=35, success=True, error_message=None)
+    
+    texts = {}
+    
+    def scrape(url):
+        text = Text(f"Microsoft {url} " * 1000)
+        texts[url] = weakref.ref(text)
+        return ScrapedContent(
+            full_text=text,
+            published_date=datetime.now(),
+            scrape_timestamp=datetime.now(),
+            success=True,
+            error_message=None
+        )
+    
+    alive_while_storing = []
+    
+    def save_article(article):
+        # Give the other articles time to finish and wait on the full store queue
+        time.sleep(0.05)
+        gc.collect()
+        alive_while_storing.append([url for url, ref in texts.items() if ref() is not None])
+        return True
+    
+    articles = [
+        RawArticle(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=None
+        )
+        for i in range(3)
+    ]
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["scraper"].scrape.side_effect = scrape
+    mock_components["classifier"] = Classifier()
+    mock_components["summarizer"] = Summarizer()
+    mock_components["storage"].save_article.side_effect = save_article
+    
+    orchestrator = PipelineOrchestrator(
+        config=config,
+        test_set=test_set,
+        **mock_components
     )
     
-    raw_article2 = RawArticle(
-        title="Article 2",
-        url="https://example.com/article2",
+    with patch("src.pipeline_orchestrator.STORE_QUEUE_SIZE", 1):
+        result = orchestrator.run()
+    
+    assert result.total_stored == 3
+    assert alive_while_storing == [[], [], []]
+
+
+def test_pipeline_batches_summarization(config, test_set, mock_components):
+    """Test that articles are summarized in batches when summarizer_batch_size is above 1."""
+    config = dataclasses.replace(config, summarizer_batch_size=3)
+    articles = [
+        RawArticle(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=None
+        )
+        for i in range(5)
+    ]
+    
+    def summarize_batch(contents):
+        return [Summary(text=f"Summary of {c}", word_count=35, success=True, error_message=None) for c in contents]
+    
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["scraper"].scrape.side_effect = lambda url: ScrapedContent(
+        full_text=f"Microsoft {url}",
         published_date=datetime.now(),
-        source="Test Source",
-        snippet="Content 2"
+        scrape_timestamp=datetime.now(),
+        success=True,
+        error_message=None
     )
+    mock_components["classifier"].classify.return_value = ["Microsoft"]
+    mock_components["summarizer"].summarize_batch.side_effect = summarize_batch
+    mock_components["storage"].save_article.return_value = True
     
-    failed_scrape = ScrapedContent(
-        full_text="",
-        published_date=None,
-        scrape_timestamp=datetime.now(),
-        success=False,
-        error_message="HTTP error 404"
+    orchestrator = PipelineOrchestrator(
+        config=config,
+        test_set=test_set,
+        **mock_components
     )
     
-    successful_scrape = ScrapedContent(
-        full_text="Google announces new product...",
+    result = orchestrator.run()
+    
+    assert result.total_summarized == 5
+    assert result.total_stored == 5
+    mock_components["summarizer"].summarize.assert_not_called()
+    batch_sizes = [len(c.args[0]) for c in mock_components["summarizer"].summarize_batch.call_args_list]
+    assert sum(batch_sizes) == 5
+    assert max(batch_sizes) <= 3
+    stored = [c.args[0] for c in mock_components["storage"].save_article.call_args_list]
+    assert [a.summary for a in stored] == [f"Summary of Microsoft {a.url}" for a in articles]
+
+
+def test_pipeline_batch_with_missing_summaries_fails_leftover_articles(config, test_set, mock_components):
+    """Test that articles a batch returned no summary for are logged as summarization errors instead of hanging."""
+    config = dataclasses.replace(config, summarizer_batch_size=3)
+    articles = [
+        RawArticle(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=None
+        )
+        for i in range(5)
+    ]
+    
+    def summarize_batch(contents):
+        # One summary short for every batch
+        return [Summary(text=f"Summary of {c}", word_count=35, success=True, error_message=None) for c in contents[:-1]]
+    
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["scraper"].scrape.side_effect = lambda url: ScrapedContent(
+        full_text=f"Microsoft {url}",
         published_date=datetime.now(),
         scrape_timestamp=datetime.now(),
         success=True,
         error_message=None
     )
+    mock_components["classifier"].classify.return_value = ["Microsoft"]
+    mock_components["summarizer"].summarize_batch.side_effect = summarize_batch
+    mock_components["storage"].save_article.return_value = True
+    
+    orchestrator = PipelineOrchestrator(
+        config=config,
+        test_set=test_set,
+        **mock_components
+    )
+    
+    result = orchestrator.run()
+    
+    batches = mock_components["summarizer"].summarize_batch.call_count
+    assert result.total_summarized == 5 - batches
+    assert result.total_stored == 5 - batches
+    assert [error.stage for error in result.errors] == ["summarization"] * batches
+    assert all("summaries for" in error.error_message for error in result.errors)
+
+
+def test_pipeline_batching_falls_back_without_summarize_batch(config, test_set, mock_components):
+    """Test that a summarizer without summarize_batch is called once per article."""
+    config = dataclasses.replace(config, summarizer_batch_size=3)
+    articles = [
+        RawArticle(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=None
+        )
+        for i in range(4)
+    ]
     
-    summary = Summary(
-        text="Google announces new product with innovative features.",
-        word_count=35,
+    mock_components["summarizer"] = Mock(spec=["summarize"])
+    mock_components["summarizer"].summarize.return_value = Summary(
+        text="Test summary.", word_count=35, success=True, error_message=None
+    )
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["scraper"].scrape.return_value = ScrapedContent(
+        full_text="Microsoft content",
+        published_date=datetime.now(),
+        scrape_timestamp=datetime.now(),
         success=True,
         error_message=None
     )
-    
-    # Configure mocks
-    mock_components["collector"].fetch_news.return_value = [raw_article1, raw_article2]
-    mock_components["scraper"].scrape.side_effect = [failed_scrape, successful_scrape]
-    mock_components["classifier"].classify.return_value = ["Google"]
-    mock_components["summarizer"].summarize.return_value = summary
+    mock_components["classifier"].classify.return_value = ["Microsoft"]
     mock_components["storage"].save_article.return_value = True
     
     orchestrator = PipelineOrchestrator(
@@ -235,45 +567,44 @@ def test_pipeline_continues_on_scraping_failure(config, test_set, mock_component
     
     result = orchestrator.run()
     
-    assert result.total_collected == 2
-    assert result.total_scraped == 1  # Only one successful scrape
-    assert result.total_classified == 1
-    assert result.total_summarized == 1
-    assert result.total_stored == 1
-    assert len(result.errors) == 1
-    assert result.errors[0].stage == "scraping"
+    assert result.total_summarized == 4
+    assert result.total_stored == 4
+    assert mock_components["summarizer"].summarize.call_count == 4
 
 
-def test_pipeline_continues_on_summarization_failure(config, test_set, mock_components):
-    """Test that pipeline continues processing when summarization fails."""
-    raw_article = RawArticle(
-        title="Test article",
-        url="https://example.com/article1",
-        published_date=datetime.now(),
-        source="Test Source",
-        snippet="Test content"
-    )
+
+def test_pipeline_batches_storage_writes(config, test_set, mock_components):
+    """Test that articles finished while a write is in progress are saved together, in order."""
+    articles = [
+        RawArticle(
+            title=f"Article {i}",
+            url=f"https://example.com/article{i}",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=None
+        )
+        for i in range(6)
+    ]
+    
+    def save_articles(batch):
+        # Hold up the first write so the remaining articles queue behind it
+        if mock_components["storage"].save_articles.call_count == 1:
+            time.sleep(0.1)
+        return [article.url != "https://example.com/article4" for article in batch]
     
-    scraped_content = ScrapedContent(
-        full_text="Apple releases new iPhone model...",
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["scraper"].scrape.return_value = ScrapedContent(
+        full_text="Microsoft content",
         published_date=datetime.now(),
         scrape_timestamp=datetime.now(),
         success=True,
         error_message=None
     )
-    
-    failed_summary = Summary(
-        text="",
-        word_count=0,
-        success=False,
-        error_message="AI API rate limit exceeded"
+    mock_components["classifier"].classify.return_value = ["Microsoft"]
+    mock_components["summarizer"].summarize.return_value = Summary(
+        text="Test summary.", word_count=35, success=True, error_message=None
     )
-    
-    # Configure mocks
-    mock_components["collector"].fetch_news.return_value = [raw_article]
-    mock_components["scraper"].scrape.return_value = scraped_content
-    mock_components["classifier"].classify.return_value = ["Apple"]
-    mock_components["summarizer"].summarize.return_value = failed_summary
+    mock_components["storage"].save_articles.side_effect = save_articles
     
     orchestrator = PipelineOrchestrator(
         config=config,
@@ -283,46 +614,47 @@ def test_pipeline_continues_on_summarization_failure(config, test_set, mock_comp
     
     result = orchestrator.run()
     
-    assert result.total_collected == 1
-    assert result.total_scraped == 1
-    assert result.total_classified == 1
-    assert result.total_summarized == 0  # Summarization failed
-    assert result.total_stored == 0  # Not stored due to failed summarization
-    assert len(result.errors) == 1
-    assert result.errors[0].stage == "summarization"
+    assert result.total_stored == 5
+    assert [(e.stage, e.article_url) for e in result.errors] == [("storage", "https://example.com/article4")]
+    batches = [c.args[0] for c in mock_components["storage"].save_articles.call_args_list]
+    assert len(batches) < len(articles)
+    assert [a.url for batch in batches for a in batch] == [a.url for a in articles]
+    mock_components["storage"].save_article.assert_not_called()
 
 
-def test_pipeline_tracks_storage_errors(config, test_set, mock_components):
-    """Test that pipeline tracks storage errors."""
-    raw_article = RawArticle(
-        title="Test article",
-        url="https://example.com/article1",
-        published_date=datetime.now(),
-        source="Test Source",
-        snippet="Test content"
-    )
+def test_pipeline_prefilter_skips_scraping_off_topic_articles(config, test_set, mock_components):
+    """Test that articles whose title and snippet match no entity are not scraped when the prefilter is on."""
+    config = dataclasses.replace(config, classifier_prefilter=True)
+    articles = [
+        RawArticle(
+            title="Microsoft earnings beat estimates",
+            url="https://example.com/on-topic",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet=None
+        ),
+        RawArticle(
+            title="Local weather update",
+            url="https://example.com/off-topic",
+            published_date=datetime.now(),
+            source="Test Source",
+            snippet="Sunny skies expected"
+        ),
+    ]
     
-    scraped_content = ScrapedContent(
-        full_text="Microsoft launches new service...",
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["classifier"] = EntityClassifier(test_set)
+    mock_components["scraper"].scrape.return_value = ScrapedContent(
+        full_text="Microsoft content",
         published_date=datetime.now(),
         scrape_timestamp=datetime.now(),
         success=True,
         error_message=None
     )
-    
-    summary = Summary(
-        text="Microsoft launches new cloud service for enterprises.",
-        word_count=35,
-        success=True,
-        error_message=None
+    mock_components["summarizer"].summarize.return_value = Summary(
+        text="Test summary.", word_count=35, success=True, error_message=None
     )
-    
-    # Configure mocks
-    mock_components["collector"].fetch_news.return_value = [raw_article]
-    mock_components["scraper"].scrape.return_value = scraped_content
-    mock_components["classifier"].classify.return_value = ["Microsoft"]
-    mock_components["summarizer"].summarize.return_value = summary
-    mock_components["storage"].save_article.return_value = False  # Storage fails
+    mock_components["storage"].save_article.return_value = True
     
     orchestrator = PipelineOrchestrator(
         config=config,
@@ -332,48 +664,41 @@ def test_pipeline_tracks_storage_errors(config, test_set, mock_components):
     
     result = orchestrator.run()
     
-    assert result.total_collected == 1
-    assert result.total_scraped == 1
-    assert result.total_classified == 1
-    assert result.total_summarized == 1
-    assert result.total_stored == 0  # Storage failed
-    assert len(result.errors) == 1
-    assert result.errors[0].stage == "storage"
+    mock_components["scraper"].scrape.assert_called_once_with("https://example.com/on-topic")
+    assert result.total_stored == 1
+    assert result.errors == []
 
 
-def test_pipeline_processes_multiple_articles(config, test_set, mock_components):
-    """Test pipeline processing multiple articles with mixed results."""
+def test_pipeline_skips_duplicate_and_stored_urls(config, test_set, mock_components):
+    """Test that repeated and already stored URLs are not scraped or summarized."""
     articles = [
         RawArticle(
             title=f"Article {i}",
-            url=f"https://example.com/article{i}",
+            url=url,
             published_date=datetime.now(),
             source="Test Source",
-            snippet=f"Content {i}"
+            snippet=None
         )
-        for i in range(5)
+        for i, url in enumerate([
+            "https://example.com/new",
+            "https://example.com/stored",
+            "https://example.com/new",
+        ])
     ]
     
-    scraped_content = ScrapedContent(
-        full_text="Test content with Microsoft and Google...",
+    mock_components["collector"].fetch_news.return_value = articles
+    mock_components["storage"].stored_urls.side_effect = lambda urls: {url for url in urls if url == "https://example.com/stored"}
+    mock_components["scraper"].scrape.return_value = ScrapedContent(
+        full_text="Microsoft content",
         published_date=datetime.now(),
         scrape_timestamp=datetime.now(),
         success=True,
         error_message=None
     )
-    
-    summary = Summary(
-        text="Test summary of the article content.",
-        word_count=35,
-        success=True,
-        error_message=None
+    mock_components["classifier"].classify.return_value = ["Microsoft"]
+    mock_components["summarizer"].summarize.return_value = Summary(
+        text="Test summary.", word_count=35, success=True, error_message=None
     )
-    
-    # Configure mocks
-    mock_components["collector"].fetch_news.return_value = articles
-    mock_components["scraper"].scrape.return_value = scraped_content
-    mock_components["classifier"].classify.return_value = ["Microsoft", "Google"]
-    mock_components["summarizer"].summarize.return_value = summary
     mock_components["storage"].save_article.return_value = True
     
     orchestrator = PipelineOrchestrator(
@@ -384,9 +709,6 @@ def test_pipeline_processes_multiple_articles(config, test_set, mock_components)
     
     result = orchestrator.run()
     
-    assert result.total_collected == 5
-    assert result.total_scraped == 5
-    assert result.total_classified == 5
-    assert result.total_summarized == 5
-    assert result.total_stored == 5
-    assert len(result.errors) == 0
+    mock_components["scraper"].scrape.assert_called_once_with("https://example.com/new")
+    assert result.total_collected == 3
+    assert result.total_stored == 1
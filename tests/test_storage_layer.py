@@ -1,17 +1,26 @@
 """Unit tests for storage layer."""
 import os
 import pytest
-import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from sqlalchemy import event
 from src.storage_layer import (
     StorageLayer,
     ProcessedArticle,
     ArticleFilters,
     DatabaseStorage,
-    CSVStorage
+    CSVStorage,
+    ParquetStorage,
+    ARTICLE_COLUMNS,
+    CSV_WRITE_BUFFER_SIZE,
+    PG_COPY_MIN_ROWS
 )
 
 
+# The sample articles are built fresh for every test, since several tests
+# change their fields. Building one is a single constructor call, no dearer
+# than copying a shared session-scoped template would be, and the string
+# literals are constants of the fixture's code object, created once at import.
 @pytest.fixture
 def sample_article():
     """Create a sample ProcessedArticle for testing."""
@@ -52,6 +61,20 @@ class TestProcessedArticle:
         assert len(sample_article.summary) > 0
         assert sample_article.source == "Test News"
         assert sample_article.created_at == datetime(2024, 1, 15, 11, 0, 0)
+    
+    def test_processed_article_is_slotted(self, sample_article):
+        """Test ProcessedArticle carries no per-instance __dict__."""
+        assert not hasattr(sample_article, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_article.extra = "value"
+    
+    def test_processed_article_fields_are_mutable(self, sample_article):
+        """Test ProcessedArticle fields can be reassigned despite __slots__ (it is not frozen)."""
+        sample_article.title = ""
+        sample_article.entity_tags.append("Apple")
+        
+        assert sample_article.title == ""
+        assert sample_article.entity_tags == ["Microsoft", "Google", "Apple"]
 
 
 class TestArticleFilters:
@@ -78,9 +101,36 @@ class TestArticleFilters:
         assert filters.end_date is None
 
 
+
+class TestArticleValidation:
+    """Tests for the validation shared by all storage backends."""
+    
+    def test_valid_article_accepted(self, sample_article):
+        """Test an article with every field present passes validation."""
+        assert StorageLayer._validate_article(sample_article) is True
+    
+    @pytest.mark.parametrize("field, value", [
+        ("title", ""),
+        ("title", "   "),
+        ("url", ""),
+        ("published_date", None),
+        ("entity_tags", []),
+        ("summary", ""),
+        ("summary", " \n\t"),
+    ])
+    def test_invalid_field_rejected(self, sample_article, field, value):
+        """Test an empty, whitespace-only or missing required field fails validation."""
+        setattr(sample_article, field, value)
+        
+        assert StorageLayer._validate_article(sample_article) is False
+
 class TestDatabaseStorage:
     """Tests for DatabaseStorage class."""
     
+    # Function scoped on purpose. The ORM models are built once per process
+    # (see _orm_models), so a fresh in-memory database only costs its DDL,
+    # about a millisecond, and several tests patch the instance's engine or
+    # dialect, which would leak into later tests through a shared instance.
     @pytest.fixture
     def db_storage(self):
         """Create a DatabaseStorage instance with SQLite in-memory database."""
@@ -92,6 +142,74 @@ class TestDatabaseStorage:
         assert db_storage.engine is not None
         assert db_storage.Session is not None
     
+    def test_instances_share_models_but_not_data(self, db_storage, sample_article):
+        """Test ORM models are defined once while each database keeps its own rows."""
+        other = DatabaseStorage("sqlite:///:memory:")
+        
+        assert other.Article is db_storage.Article
+        assert other.ArticleEntity is db_storage.ArticleEntity
+        assert db_storage.Article.__mapper__.configured
+        assert db_storage.save_article(sample_article) is True
+        assert other.get_articles() == []
+    
+    def test_in_memory_database_shared_across_threads(self, db_storage, sample_article):
+        """Test an article saved from another thread, as the pipeline's store stage does, is visible here."""
+        import threading
+        
+        results = []
+        thread = threading.Thread(target=lambda: results.append(db_storage.save_article(sample_article)))
+        thread.start()
+        thread.join()
+        
+        assert results == [True]
+        assert db_storage.has_url(sample_article.url) is True
+    
+    def test_sqlite_file_uses_wal_journal(self, tmp_path):
+        """Test file-backed SQLite databases are opened in WAL mode."""
+        storage = DatabaseStorage(f"sqlite:///{tmp_path / 'articles.db'}")
+        
+        with storage.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+    
+    def test_in_memory_database_keeps_journal_in_memory(self, db_storage):
+        """Test in-memory databases journal to memory, so test commits never touch the disk."""
+        with db_storage.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "memory"
+            assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2  # MEMORY
+    
+    def test_schema_created_once_per_database(self, tmp_path, sample_article):
+        """Test the tables and entity index are created, and reopening a database keeps its rows."""
+        from sqlalchemy import inspect
+        
+        url = f"sqlite:///{tmp_path / 'articles.db'}"
+        assert DatabaseStorage(url).save_article(sample_article) is True
+        
+        reopened = DatabaseStorage(url)
+        inspector = inspect(reopened.engine)
+        
+        assert {'articles', 'article_entities'} <= set(inspector.get_table_names())
+        assert 'ix_article_entities_entity_article' in {ix['name'] for ix in inspector.get_indexes('article_entities')}
+        assert reopened.has_url(sample_article.url) is True
+    
+    def test_date_filter_uses_index_added_to_existing_database(self, tmp_path, sample_article):
+        """Test a database created without the published_date index gets it, and date filters use it."""
+        url = f"sqlite:///{tmp_path / 'articles.db'}"
+        storage = DatabaseStorage(url)
+        storage.save_article(sample_article)
+        with storage.engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_articles_published_date")
+        
+        reopened = DatabaseStorage(url)
+        filters = ArticleFilters(start_date=datetime(2024, 1, 15), end_date=datetime(2024, 1, 16))
+        with reopened.Session() as session:
+            query = reopened._filtered_query(session, filters, reopened.Article.id)
+            compiled = query.statement.compile(reopened.engine, compile_kwargs={"literal_binds": True})
+            plan = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").fetchall()
+        
+        assert any("ix_articles_published_date" in row[-1] for row in plan)
+        assert [a.url for a in reopened.get_articles(filters)] == [sample_article.url]
+    
     def test_save_article_success(self, db_storage, sample_article):
         """Test saving an article to database."""
         result = db_storage.save_article(sample_article)
@@ -105,56 +223,45 @@ class TestDatabaseStorage:
         
         assert result is True
     
-    def test_save_article_missing_title(self, db_storage, sample_article):
-        """Test saving article with empty title fails validation."""
-        sample_article.title = ""
-        result = db_storage.save_article(sample_article)
+    def test_has_url(self, db_storage, sample_article):
+        """Test has_url reports only stored article URLs."""
+        assert db_storage.has_url(sample_article.url) is False
         
-        assert result is False
-    
-    def test_save_article_missing_url(self, db_storage, sample_article):
-        """Test saving article with empty URL fails validation."""
-        sample_article.url = ""
-        result = db_storage.save_article(sample_article)
+        db_storage.save_article(sample_article)
         
-        assert result is False
+        assert db_storage.has_url(sample_article.url) is True
     
-    def test_save_article_missing_published_date(self, db_storage, sample_article):
-        """Test saving article with missing published_date fails validation."""
-        sample_article.published_date = None
-        result = db_storage.save_article(sample_article)
+    def test_stored_urls_single_query(self, db_storage, sample_article, sample_article_2):
+        """Test stored_urls looks up a whole batch of URLs with one SELECT."""
+        db_storage.save_article(sample_article)
+        statements = []
+        event.listen(db_storage.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
         
-        assert result is False
-    
-    def test_save_article_empty_entity_tags(self, db_storage, sample_article):
-        """Test saving article with empty entity_tags fails validation."""
-        sample_article.entity_tags = []
-        result = db_storage.save_article(sample_article)
+        urls = [sample_article.url, sample_article_2.url, "https://example.com/missing", sample_article.url]
         
-        assert result is False
+        assert db_storage.stored_urls(urls) == {sample_article.url}
+        assert len(statements) == 1
     
-    def test_save_article_empty_summary(self, db_storage, sample_article):
-        """Test saving article with empty summary fails validation."""
-        sample_article.summary = ""
+    def test_save_article_invalid(self, db_storage, sample_article):
+        """Test an article failing validation is rejected without being stored."""
+        sample_article.summary = " \n\t"
         result = db_storage.save_article(sample_article)
         
         assert result is False
+        assert db_storage.has_url(sample_article.url) is False
     
     def test_get_articles_no_filters(self, db_storage, sample_article, sample_article_2):
         """Test retrieving all articles without filters."""
-        db_storage.save_article(sample_article)
-        db_storage.save_article(sample_article_2)
+        db_storage.save_articles([sample_article, sample_article_2])
         
         articles = db_storage.get_articles()
         
         assert len(articles) == 2
-        assert any(a.url == sample_article.url for a in articles)
-        assert any(a.url == sample_article_2.url for a in articles)
+        assert {a.url for a in articles} == {sample_article.url, sample_article_2.url}
     
     def test_get_articles_filter_by_entity(self, db_storage, sample_article, sample_article_2):
         """Test retrieving articles filtered by entity."""
-        db_storage.save_article(sample_article)
-        db_storage.save_article(sample_article_2)
+        db_storage.save_articles([sample_article, sample_article_2])
         
         filters = ArticleFilters(entities=["Microsoft"])
         articles = db_storage.get_articles(filters)
@@ -165,8 +272,7 @@ class TestDatabaseStorage:
     
     def test_get_articles_filter_by_date_range(self, db_storage, sample_article, sample_article_2):
         """Test retrieving articles filtered by date range."""
-        db_storage.save_article(sample_article)
-        db_storage.save_article(sample_article_2)
+        db_storage.save_articles([sample_article, sample_article_2])
         
         filters = ArticleFilters(
             start_date=datetime(2024, 1, 15),
@@ -187,21 +293,231 @@ class TestDatabaseStorage:
         assert len(articles[0].entity_tags) == 2
         assert "Microsoft" in articles[0].entity_tags
         assert "Google" in articles[0].entity_tags
+    
+    def test_get_articles_filter_by_several_entities(self, db_storage, sample_article, sample_article_2):
+        """Test an article matching several filter entities is returned once with all its tags."""
+        db_storage.save_articles([sample_article, sample_article_2])
+        
+        articles = db_storage.get_articles(ArticleFilters(entities=["Microsoft", "Google"]))
+        
+        assert [a.url for a in articles] == [sample_article.url]
+        assert sorted(articles[0].entity_tags) == ["Google", "Microsoft"]
+    
+    def test_get_articles_loads_entity_tags_in_one_query(self, db_storage, sample_article, sample_article_2):
+        """Test entity tags for all articles are fetched together rather than per article."""
+        db_storage.save_articles([sample_article, sample_article_2])
+        statements = []
+        event.listen(db_storage.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        
+        articles = db_storage.get_articles()
+        
+        assert len(articles) == 2
+        assert len(statements) == 2
+    
+    def test_iter_articles_streams_in_chunks(self, db_storage, sample_article, sample_article_2):
+        """Test iter_articles yields lazily and loads entity tags once per chunk."""
+        db_storage.save_articles([sample_article, sample_article_2])
+        statements = []
+        event.listen(db_storage.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        
+        with patch("src.storage_layer.ID_QUERY_CHUNK_SIZE", 1):
+            articles = db_storage.iter_articles()
+            assert statements == []
+            
+            first = next(articles)
+            assert first.url == sample_article.url
+            assert sorted(first.entity_tags) == ["Google", "Microsoft"]
+            rest = list(articles)
+        
+        assert [a.url for a in rest] == [sample_article_2.url]
+        assert rest[0].entity_tags == ["Apple"]
+        # One article query plus one entity query per chunk
+        assert len(statements) == 3
+    
+    def test_get_articles_columnar(self, db_storage, sample_article, sample_article_2):
+        """Test columnar results hold the same values as get_articles, one list per field."""
+        db_storage.save_articles([sample_article, sample_article_2])
+        statements = []
+        event.listen(db_storage.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        
+        columns = db_storage.get_articles_columnar(ArticleFilters(entities=["Microsoft", "Apple"]))
+        
+        assert list(columns) == list(ARTICLE_COLUMNS)
+        assert columns["url"] == [sample_article.url, sample_article_2.url]
+        assert columns["published_date"] == [sample_article.published_date, sample_article_2.published_date]
+        assert sorted(columns["entity_tags"][0]) == ["Google", "Microsoft"]
+        assert columns["entity_tags"][1] == ["Apple"]
+        assert len(statements) == 2
+    
+    def test_save_articles_batch(self, db_storage, sample_article, sample_article_2):
+        """Test saving a batch reports per-article results and skips stored and invalid articles."""
+        db_storage.save_article(sample_article)
+        invalid = ProcessedArticle(
+            title="",
+            url="https://example.com/invalid",
+            published_date=datetime(2024, 1, 17),
+            entity_tags=["Apple"],
+            summary="Summary",
+            source="Test News",
+            created_at=datetime(2024, 1, 17)
+        )
+        
+        results = db_storage.save_articles([sample_article, sample_article_2, invalid, sample_article_2])
+        
+        assert results == [True, True, False, True]
+        articles = {a.url: a for a in db_storage.get_articles()}
+        assert set(articles) == {sample_article.url, sample_article_2.url}
+        assert articles[sample_article_2.url].entity_tags == ["Apple"]
+        assert sorted(articles[sample_article.url].entity_tags) == ["Google", "Microsoft"]
+    
+    def test_save_articles_uses_insert_on_conflict(self, db_storage, sample_article, sample_article_2):
+        """Test new and already stored articles are resolved by the unique URL constraint, not a lookup."""
+        db_storage.save_article(sample_article)
+        statements = []
+        event.listen(db_storage.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        
+        assert db_storage.save_articles([sample_article, sample_article_2]) == [True, True]
+        
+        assert not any(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+        assert any("ON CONFLICT" in statement.upper() for statement in statements)
+        assert len(db_storage.get_articles()) == 2
+    
+    def test_save_articles_statement_count_independent_of_batch_size(self, db_storage):
+        """Test a batch is written with one INSERT per table and one commit, however many articles it holds."""
+        statements = []
+        commits = []
+        event.listen(db_storage.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        event.listen(db_storage.engine, "commit", lambda conn: commits.append(conn))
+        articles = [
+            ProcessedArticle(
+                title=f"Article {i}",
+                url=f"https://example.com/batch{i}",
+                published_date=datetime(2024, 1, 15),
+                entity_tags=["Microsoft", "Google"],
+                summary="Summary",
+                source="Test News",
+                created_at=datetime(2024, 1, 15)
+            )
+            for i in range(20)
+        ]
+        
+        assert db_storage.save_articles(articles) == [True] * 20
+        
+        assert [statement.split()[2] for statement in statements] == ["articles", "article_entities"]
+        assert len(commits) == 1
+    
+    def test_save_articles_without_insert_returning(self, db_storage, sample_article, sample_article_2, monkeypatch):
+        """Test batches are saved on databases without multi-row INSERT ... RETURNING support."""
+        monkeypatch.setattr(db_storage.engine.dialect, "insert_executemany_returning", False)
+        db_storage.save_article(sample_article)
+        
+        assert db_storage.save_articles([sample_article, sample_article_2]) == [True, True]
+        
+        articles = {a.url: a for a in db_storage.get_articles()}
+        assert articles[sample_article_2.url].entity_tags == ["Apple"]
+        assert len(articles) == 2
+    
+    def test_save_articles_rolls_back_on_error(self, db_storage, sample_article):
+        """Test a failure part way through a batch leaves nothing stored."""
+        def fail_entity_insert(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("INSERT INTO ARTICLE_ENTITIES"):
+                raise RuntimeError("disk full")
+        event.listen(db_storage.engine, "before_cursor_execute", fail_entity_insert)
+        
+        assert db_storage.save_articles([sample_article]) == [False]
+        
+        event.remove(db_storage.engine, "before_cursor_execute", fail_entity_insert)
+        assert db_storage.get_articles() == []
+        assert db_storage.save_article(sample_article) is True
+    
+    def test_copy_used_for_large_postgresql_batches(self, db_storage, monkeypatch):
+        """Test COPY is only chosen for large batches on a psycopg2 connection."""
+        assert db_storage._can_copy(PG_COPY_MIN_ROWS) is False
+        
+        monkeypatch.setattr(db_storage.engine.dialect, "name", "postgresql")
+        monkeypatch.setattr(db_storage.engine.dialect, "driver", "psycopg2")
+        
+        assert db_storage._can_copy(PG_COPY_MIN_ROWS) is True
+        assert db_storage._can_copy(PG_COPY_MIN_ROWS - 1) is False
+    
+    def test_copy_rows_quotes_every_field(self, db_storage):
+        """Test rows are streamed as CSV with empty strings quoted and None left bare so only None reads as NULL."""
+        session = MagicMock()
+        cursor = session.connection.return_value.connection.cursor.return_value
+        payloads = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: payloads.append((sql, buffer.read()))
+        
+        db_storage._copy_rows(
+            session, "article_entities", ("article_id", "entity"), [(1, 'Say "hi"'), (2, ""), (3, None)]
+        )
+        
+        assert payloads == [
+            ("COPY article_entities (article_id, entity) FROM STDIN WITH (FORMAT csv)",
+             '"1","Say ""hi"""\n"2",""\n"3",\n')
+        ]
+        cursor.close.assert_called_once()
+    
+    def test_aware_datetimes_stored_identically_by_insert_and_copy(self, db_storage, sample_article):
+        """Test a timezone-aware timestamp is written as the same naive UTC value by INSERT and by COPY."""
+        ist = timezone(timedelta(hours=5, minutes=30))
+        sample_article.published_date = datetime(2024, 1, 15, 16, 0, tzinfo=ist)
+        sample_article.created_at = datetime(2024, 1, 16, 5, 30, tzinfo=ist)
+        
+        db_storage.save_article(sample_article)
+        inserted = db_storage.get_articles()[0]
+        
+        session = MagicMock()
+        cursor = session.connection.return_value.connection.cursor.return_value
+        payloads = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: payloads.append(buffer.read())
+        db_storage._copy_new_articles(session, {sample_article.url: sample_article})
+        
+        assert inserted.published_date == datetime(2024, 1, 15, 10, 30)
+        assert inserted.created_at == datetime(2024, 1, 16, 0, 0)
+        assert f'"{inserted.published_date}"' in payloads[0]
+        assert f'"{inserted.created_at}"' in payloads[0]
+    
+    def test_save_articles_other_dialect_reads_ids_with_returning(self, db_storage, sample_article, sample_article_2, monkeypatch):
+        """Test databases without ON CONFLICT support still get new IDs from the INSERT itself."""
+        monkeypatch.setattr(db_storage.engine.dialect, "name", "other")
+        db_storage.save_article(sample_article)
+        statements = []
+        event.listen(db_storage.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        
+        assert db_storage.save_articles([sample_article, sample_article_2]) == [True, True]
+        
+        # Only the lookup of already stored URLs is a SELECT
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+        assert any("RETURNING" in s.upper() for s in statements)
+        monkeypatch.undo()
+        articles = {a.url: a for a in db_storage.get_articles()}
+        assert articles[sample_article_2.url].entity_tags == ["Apple"]
+    
+    def test_save_articles_empty(self, db_storage):
+        """Test saving an empty batch is a no-op."""
+        assert db_storage.save_articles([]) == []
 
 
 class TestCSVStorage:
     """Tests for CSVStorage class."""
     
     @pytest.fixture
-    def csv_storage(self):
-        """Create a CSVStorage instance with temporary file."""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv')
-        temp_file.close()
-        storage = CSVStorage(temp_file.name)
+    def csv_storage(self, tmp_path):
+        """Create a CSVStorage instance in a temporary directory (removed by pytest).
+        
+        On Linux the fixture also checks that no file descriptors are left
+        open once the storage is closed, since CSVStorage keeps its append
+        handles open between saves.
+        """
+        fd_dir = "/proc/self/fd"
+        open_fds_before = len(os.listdir(fd_dir)) if os.path.isdir(fd_dir) else None
+        
+        storage = CSVStorage(str(tmp_path / "articles.csv"))
         yield storage
-        # Cleanup
-        if os.path.exists(temp_file.name):
-            os.unlink(temp_file.name)
+        storage.close()
+        
+        if open_fds_before is not None:
+            assert len(os.listdir(fd_dir)) == open_fds_before, "CSVStorage test leaked a file descriptor"
     
     def test_csv_storage_initialization(self, csv_storage):
         """Test CSVStorage initializes correctly and creates file."""
@@ -231,56 +547,105 @@ class TestCSVStorage:
         articles = csv_storage.get_articles()
         assert len(articles) == 1
     
-    def test_save_article_missing_title(self, csv_storage, sample_article):
-        """Test saving article with empty title fails validation."""
-        sample_article.title = ""
-        result = csv_storage.save_article(sample_article)
+    def test_has_url(self, csv_storage, sample_article):
+        """Test has_url reports stored URLs, including ones written by an earlier instance."""
+        assert csv_storage.has_url(sample_article.url) is False
         
-        assert result is False
+        csv_storage.save_article(sample_article)
+        
+        assert csv_storage.has_url(sample_article.url) is True
+        assert CSVStorage(csv_storage.output_path).has_url(sample_article.url) is True
     
-    def test_save_article_missing_url(self, csv_storage, sample_article):
-        """Test saving article with empty URL fails validation."""
-        sample_article.url = ""
-        result = csv_storage.save_article(sample_article)
+    def test_save_article_reads_file_once(self, csv_storage, sample_article, sample_article_2):
+        """Test duplicate checks read the CSV once rather than on every save."""
+        with patch("builtins.open", wraps=open) as mock_open:
+            csv_storage.save_article(sample_article)
+            csv_storage.save_article(sample_article_2)
+            csv_storage.save_article(sample_article)
+        
+        read_opens = [c for c in mock_open.call_args_list if c.args[1] == 'r']
+        assert len(read_opens) == 1
+        assert len(csv_storage.get_articles()) == 2
+    
+    def test_save_article_duplicate_skips_file_io(self, csv_storage, sample_article):
+        """Test a duplicate is detected from the in-memory URL set without opening any file."""
+        csv_storage.save_article(sample_article)
         
-        assert result is False
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert csv_storage.save_article(sample_article) is True
+        
+        mock_open.assert_not_called()
     
-    def test_save_article_missing_published_date(self, csv_storage, sample_article):
-        """Test saving article with missing published_date fails validation."""
-        sample_article.published_date = None
-        result = csv_storage.save_article(sample_article)
+    def test_url_index_used_by_later_instances(self, csv_storage, sample_article, sample_article_2):
+        """Test stored URLs are recorded in the index file and loaded from it without reading the CSV."""
+        csv_storage.save_articles([sample_article, sample_article_2])
         
-        assert result is False
+        with open(csv_storage.index_path, encoding='utf-8') as f:
+            assert f.read().splitlines() == [sample_article.url, sample_article_2.url]
+        
+        reopened = CSVStorage(csv_storage.output_path)
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert reopened.has_url(sample_article_2.url) is True
+        assert [c.args[0] for c in mock_open.call_args_list] == [reopened.index_path]
     
-    def test_save_article_empty_entity_tags(self, csv_storage, sample_article):
-        """Test saving article with empty entity_tags fails validation."""
-        sample_article.entity_tags = []
-        result = csv_storage.save_article(sample_article)
+    def test_url_index_rebuilt_when_stale(self, csv_storage, sample_article, sample_article_2):
+        """Test the index is rebuilt from the CSV when it is missing."""
+        csv_storage.save_articles([sample_article, sample_article_2])
+        csv_storage.close()
+        os.remove(csv_storage.index_path)
         
-        assert result is False
+        reopened = CSVStorage(csv_storage.output_path)
+        
+        assert reopened.has_url(sample_article.url) is True
+        with open(reopened.index_path, encoding='utf-8') as f:
+            assert sorted(f.read().splitlines()) == sorted([sample_article.url, sample_article_2.url])
+    
+    def test_save_articles_batch(self, csv_storage, sample_article, sample_article_2):
+        """Test a batch is appended with one write and duplicates within it are skipped."""
+        with patch("builtins.open", wraps=open) as mock_open:
+            results = csv_storage.save_articles([sample_article, sample_article_2, sample_article])
+        
+        assert results == [True, True, True]
+        appends = [c for c in mock_open.call_args_list if c.args == (csv_storage.output_path, 'a')]
+        assert len(appends) == 1
+        assert appends[0].kwargs["buffering"] == CSV_WRITE_BUFFER_SIZE
+        assert [a.url for a in csv_storage.get_articles()] == [sample_article.url, sample_article_2.url]
     
-    def test_save_article_empty_summary(self, csv_storage, sample_article):
-        """Test saving article with empty summary fails validation."""
-        sample_article.summary = ""
+    def test_save_articles_keeps_file_open_between_batches(self, csv_storage, sample_article, sample_article_2):
+        """Test later batches reuse the open handles and each batch is readable once saved."""
+        with patch("builtins.open", wraps=open) as mock_open:
+            csv_storage.save_article(sample_article)
+            assert [a.url for a in CSVStorage(csv_storage.output_path).get_articles()] == [sample_article.url]
+            csv_storage.save_article(sample_article_2)
+        
+        appends = [c for c in mock_open.call_args_list if c.args[1:2] == ('a',)]
+        assert [c.args[0] for c in appends] == [csv_storage.output_path, csv_storage.index_path]
+        
+        csv_storage.close()
+        reopened = CSVStorage(csv_storage.output_path)
+        assert [a.url for a in reopened.get_articles()] == [sample_article.url, sample_article_2.url]
+        assert reopened.has_url(sample_article_2.url) is True
+    
+    def test_save_article_invalid(self, csv_storage, sample_article):
+        """Test an article failing validation is rejected without being written."""
+        sample_article.title = ""
         result = csv_storage.save_article(sample_article)
         
         assert result is False
+        assert csv_storage.get_articles() == []
     
     def test_get_articles_no_filters(self, csv_storage, sample_article, sample_article_2):
         """Test retrieving all articles without filters."""
-        csv_storage.save_article(sample_article)
-        csv_storage.save_article(sample_article_2)
+        csv_storage.save_articles([sample_article, sample_article_2])
         
         articles = csv_storage.get_articles()
         
         assert len(articles) == 2
-        assert any(a.url == sample_article.url for a in articles)
-        assert any(a.url == sample_article_2.url for a in articles)
+        assert {a.url for a in articles} == {sample_article.url, sample_article_2.url}
     
     def test_get_articles_filter_by_entity(self, csv_storage, sample_article, sample_article_2):
         """Test retrieving articles filtered by entity."""
-        csv_storage.save_article(sample_article)
-        csv_storage.save_article(sample_article_2)
+        csv_storage.save_articles([sample_article, sample_article_2])
         
         filters = ArticleFilters(entities=["Microsoft"])
         articles = csv_storage.get_articles(filters)
@@ -291,8 +656,7 @@ class TestCSVStorage:
     
     def test_get_articles_filter_by_date_range(self, csv_storage, sample_article, sample_article_2):
         """Test retrieving articles filtered by date range."""
-        csv_storage.save_article(sample_article)
-        csv_storage.save_article(sample_article_2)
+        csv_storage.save_articles([sample_article, sample_article_2])
         
         filters = ArticleFilters(
             start_date=datetime(2024, 1, 15),
@@ -314,15 +678,194 @@ class TestCSVStorage:
         assert "Microsoft" in articles[0].entity_tags
         assert "Google" in articles[0].entity_tags
     
-    def test_get_articles_empty_csv(self):
+    def test_iter_articles_streams_rows(self, csv_storage, sample_article, sample_article_2):
+        """Test iter_articles yields articles as rows are read and applies filters."""
+        csv_storage.save_articles([sample_article, sample_article_2])
+        
+        articles = csv_storage.iter_articles()
+        
+        assert next(articles).url == sample_article.url
+        assert [a.url for a in articles] == [sample_article_2.url]
+        assert [a.url for a in csv_storage.iter_articles(ArticleFilters(entities=["Apple"]))] == [sample_article_2.url]
+    
+    def test_get_articles_date_filter_skips_parsing_rejected_rows(self, csv_storage, sample_article, sample_article_2):
+        """Test rows outside the date range are rejected without parsing their timestamps."""
+        sample_article_2.published_date = datetime(2024, 1, 16, 14, 20, 0, 500)
+        csv_storage.save_articles([sample_article, sample_article_2])
+        filters = ArticleFilters(start_date=datetime(2024, 1, 16, 14, 20), end_date=datetime(2024, 1, 16, 14, 20, 0, 500))
+        
+        with patch("src.storage_layer._parse_iso_datetime", wraps=datetime.fromisoformat) as parse:
+            articles = csv_storage.get_articles(filters)
+        
+        assert [a.url for a in articles] == [sample_article_2.url]
+        assert articles[0].published_date == sample_article_2.published_date
+        # Published and created timestamps of the matching row only
+        assert parse.call_count == 2
+    
+    def test_dates_round_trip_through_iso_format(self, csv_storage, sample_article):
+        """Test dates are written in ISO 8601 and read back exactly, including microseconds and offsets."""
+        sample_article.published_date = datetime(2024, 1, 15, 10, 30, 0, 123456, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+        sample_article.created_at = datetime(2024, 1, 15, 11, 0, 0, 654321)
+        csv_storage.save_article(sample_article)
+        
+        with open(csv_storage.output_path, encoding='utf-8') as f:
+            assert "2024-01-15T10:30:00.123456+05:30" in f.read()
+        
+        [article] = csv_storage.get_articles()
+        assert article.published_date == sample_article.published_date
+        assert article.published_date.utcoffset() == timedelta(hours=5, minutes=30)
+        assert article.created_at == sample_article.created_at
+    
+    def test_entity_tags_normalized_on_save(self, csv_storage, sample_article):
+        """Test padded and empty tags are cleaned when written and hand-edited columns when read."""
+        sample_article.entity_tags = [" Microsoft", "", "Google Deepmind "]
+        csv_storage.save_article(sample_article)
+        
+        with open(csv_storage.output_path, 'r', encoding='utf-8') as f:
+            assert "Microsoft,Google Deepmind" in f.read()
+        assert csv_storage.get_articles()[0].entity_tags == ["Microsoft", "Google Deepmind"]
+        
+        with open(csv_storage.output_path, 'a', newline='', encoding='utf-8') as f:
+            f.write('Hand edited,https://example.com/edited,2024-01-15T10:30:00,"Apple, ,Google",Summary,Test News,2024-01-15T11:00:00\n')
+        assert csv_storage.get_articles()[1].entity_tags == ["Apple", "Google"]
+    
+    def test_get_articles_reordered_columns(self, csv_storage, sample_article):
+        """Test files with reordered or extra columns are read by header name."""
+        with open(csv_storage.output_path, 'w', newline='', encoding='utf-8') as f:
+            f.write("Source,Notes,URL,Title,Entities,Summary,Created At,Published Date\n")
+            f.write(f"Test News,x,{sample_article.url},Test Article Title,Microsoft,Summary,2024-01-15T11:00:00,2024-01-15T10:30:00\n")
+            f.write("Test News,short row\n")
+        
+        articles = csv_storage.get_articles()
+        
+        assert len(articles) == 1
+        assert articles[0].url == sample_article.url
+        assert articles[0].title == "Test Article Title"
+        assert articles[0].entity_tags == ["Microsoft"]
+        assert articles[0].published_date == datetime(2024, 1, 15, 10, 30)
+    
+    def test_get_articles_ignores_extra_fields(self, csv_storage, sample_article):
+        """Test rows with more fields than the header are read, ignoring the extra fields."""
+        csv_storage.save_articles([sample_article])
+        with open(csv_storage.output_path, 'a', newline='', encoding='utf-8') as f:
+            f.write("Extra Fields,https://example.com/extra,2024-01-15T10:30:00,Apple,Summary,Test News,2024-01-15T11:00:00,,\n")
+        
+        articles = csv_storage.get_articles()
+        
+        assert [a.url for a in articles] == [sample_article.url, "https://example.com/extra"]
+        assert articles[1].source == "Test News"
+        assert articles[1].created_at == datetime(2024, 1, 15, 11, 0)
+    
+    def test_get_articles_entity_filter_matches_whole_tags(self, csv_storage, sample_article, sample_article_2):
+        """Test the entity filter requires an exact tag, not a substring of the Entities column."""
+        sample_article_2.entity_tags = ["Apple Inc"]
+        csv_storage.save_articles([sample_article, sample_article_2])
+        
+        assert csv_storage.get_articles(ArticleFilters(entities=["Apple"])) == []
+        articles = csv_storage.get_articles(ArticleFilters(entities=["Apple Inc", "Google"]))
+        assert [a.url for a in articles] == [sample_article.url, sample_article_2.url]
+    
+    def test_get_articles_columnar(self, csv_storage, sample_article, sample_article_2):
+        """Test columnar results hold the same values as get_articles, one list per field."""
+        csv_storage.save_articles([sample_article, sample_article_2])
+        
+        columns = csv_storage.get_articles_columnar(ArticleFilters(start_date=datetime(2024, 1, 16)))
+        
+        assert list(columns) == list(ARTICLE_COLUMNS)
+        assert columns["url"] == [sample_article_2.url]
+        assert columns["entity_tags"] == [sample_article_2.entity_tags]
+        assert columns["created_at"] == [sample_article_2.created_at]
+    
+    def test_get_articles_empty_csv(self, tmp_path):
         """Test retrieving articles from empty CSV returns empty list."""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv')
-        temp_file.close()
-        storage = CSVStorage(temp_file.name)
+        path = tmp_path / "empty.csv"
+        path.touch()
+        storage = CSVStorage(str(path))
         
         articles = storage.get_articles()
         
         assert len(articles) == 0
+
+
+class TestParquetStorage:
+    """Tests for ParquetStorage class."""
+    
+    @pytest.fixture
+    def parquet_storage(self, tmp_path):
+        """Create a ParquetStorage instance in a temporary directory."""
+        pytest.importorskip("pyarrow")
+        return ParquetStorage(str(tmp_path / "articles.parquet"), batch_size=2)
+    
+    def part_files(self, storage):
+        """List the part files written so far."""
+        return sorted(name for name in os.listdir(storage.output_path) if name.endswith(".parquet"))
+    
+    def test_save_articles_buffers_until_batch_size(self, parquet_storage, sample_article, sample_article_2):
+        """Test articles are written as one part file once batch_size are buffered."""
+        assert parquet_storage.save_article(sample_article) is True
+        assert self.part_files(parquet_storage) == []
+        assert parquet_storage.has_url(sample_article.url) is True
+        
+        assert parquet_storage.save_article(sample_article_2) is True
+        assert len(self.part_files(parquet_storage)) == 1
+    
+    def test_save_article_duplicate(self, parquet_storage, sample_article):
+        """Test duplicates, buffered or written, are skipped and count as saved."""
+        assert parquet_storage.save_articles([sample_article, sample_article]) == [True, True]
+        parquet_storage.flush()
+        assert parquet_storage.save_article(sample_article) is True
+        
+        assert len(parquet_storage.get_articles()) == 1
+    
+    def test_save_article_invalid(self, parquet_storage, sample_article):
+        """Test articles failing validation are not saved."""
+        sample_article.summary = "   "
+        
+        assert parquet_storage.save_article(sample_article) is False
+        assert parquet_storage.has_url(sample_article.url) is False
+    
+    def test_get_articles_round_trip(self, parquet_storage, sample_article, sample_article_2):
+        """Test articles read back equal the ones saved, buffered ones included."""
+        parquet_storage.save_articles([sample_article, sample_article_2])
+        later = ProcessedArticle(
+            title="Third", url="https://example.com/article3", published_date=datetime(2024, 1, 17),
+            entity_tags=["Microsoft"], summary="Third summary", source="Test News", created_at=datetime(2024, 1, 17, 1)
+        )
+        parquet_storage.save_article(later)
+        
+        assert parquet_storage.get_articles() == [sample_article, sample_article_2, later]
+    
+    def test_get_articles_filters(self, parquet_storage, sample_article, sample_article_2):
+        """Test entity tags are matched whole and date bounds are inclusive."""
+        parquet_storage.save_articles([sample_article, sample_article_2])
+        
+        assert parquet_storage.get_articles(ArticleFilters(entities=["Google"])) == [sample_article]
+        assert parquet_storage.get_articles(ArticleFilters(entities=["Goog"])) == []
+        assert parquet_storage.get_articles(ArticleFilters(entities=["Apple", "Microsoft"])) == [sample_article, sample_article_2]
+        assert parquet_storage.get_articles(ArticleFilters(start_date=sample_article_2.published_date)) == [sample_article_2]
+        assert parquet_storage.get_articles(ArticleFilters(end_date=sample_article.published_date)) == [sample_article]
+    
+    def test_get_articles_columnar(self, parquet_storage, sample_article, sample_article_2):
+        """Test columnar retrieval returns one list per field."""
+        parquet_storage.save_articles([sample_article, sample_article_2])
+        
+        columns = parquet_storage.get_articles_columnar()
         
-        # Cleanup
-        os.unlink(temp_file.name)
+        assert tuple(columns) == ARTICLE_COLUMNS
+        assert columns["url"] == [sample_article.url, sample_article_2.url]
+        assert columns["entity_tags"] == [sample_article.entity_tags, sample_article_2.entity_tags]
+    
+    def test_close_writes_buffered_articles_for_later_instances(self, parquet_storage, sample_article):
+        """Test close writes the remainder and a new instance sees it."""
+        parquet_storage.save_article(sample_article)
+        parquet_storage.close()
+        
+        reopened = ParquetStorage(parquet_storage.output_path)
+        
+        assert reopened.has_url(sample_article.url) is True
+        assert reopened.get_articles() == [sample_article]
+    
+    def test_get_articles_empty(self, parquet_storage):
+        """Test an empty directory reads back as no articles."""
+        assert parquet_storage.get_articles() == []
+        assert parquet_storage.has_url("https://example.com/missing") is False